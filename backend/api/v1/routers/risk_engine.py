@@ -91,7 +91,7 @@ async def train_payment_default_model(
     ml_model: MLRiskModel = Depends(get_ml_model)
 ):
     """
-    Train Payment Default Predictor (RandomForest).
+    Train Payment Default Predictor (HistGradientBoosting).
     
     Trains a machine learning model to predict payment default probability.
     Uses synthetic data for training if no real historical data available.
@@ -128,7 +128,7 @@ async def train_xgboost_model(
     """
     Train XGBoost Advanced Risk Predictor.
     
-    More accurate than RandomForest, better for imbalanced data.
+    Alternative to the HistGradientBoosting payment default predictor.
     
     **Training Time**: ~45 seconds for 10,000 samples
     
@@ -232,7 +232,7 @@ async def train_all_models(
     Train ALL ML Models in One Go.
     
     Trains all 4 models:
-    1. Payment Default Predictor (RandomForest)
+    1. Payment Default Predictor (HistGradientBoosting)
     2. XGBoost Advanced Predictor
     3. Credit Limit Optimizer
     4. Fraud Detector
@@ -286,7 +286,7 @@ async def predict_payment_default(
     """
     Predict Payment Default Risk.
     
-    Uses trained ML model (RandomForest or XGBoost) to predict default probability.
+    Uses trained ML model (HistGradientBoosting or XGBoost) to predict default probability.
     Falls back to rule-based scoring if ML models not trained.
     
     **Response Time**: <50ms
@@ -386,7 +386,7 @@ async def get_models_status(ml_model: MLRiskModel = Depends(get_ml_model)):
     Returns:
         {
             "models": {
-                "payment_default": {"trained": true, "type": "RandomForestClassifier"},
+                "payment_default": {"trained": true, "type": "HistGradientBoostingClassifier"},
                 "xgboost": {"trained": false},
                 "credit_limit": {"trained": true, "type": "GradientBoostingRegressor"},
                 "fraud_detector": {"trained": false}
@@ -398,7 +398,7 @@ async def get_models_status(ml_model: MLRiskModel = Depends(get_ml_model)):
     models_info = {
         "payment_default": {
             "trained": ml_model.payment_default_model is not None,
-            "type": "RandomForestClassifier" if ml_model.payment_default_model else None
+            "type": "HistGradientBoostingClassifier" if ml_model.payment_default_model else None
         },
         "xgboost": {
             "trained": ml_model.xgboost_model is not None,
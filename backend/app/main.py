@@ -6,7 +6,7 @@ load_dotenv()
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 
 from backend.modules.settings.router import router as settings_router
 from backend.modules.partners.router import router as partners_router
@@ -38,6 +38,8 @@ def create_app() -> FastAPI:
 	app = FastAPI(
 		title="Commodity ERP API",
 		version="1.0.0",
+		# orjson encodes responses several times faster than stdlib json
+		default_response_class=ORJSONResponse,
 		description="""
 		## 2035-Ready Commodity Trading ERP System
 		
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, NamedTuple, Optional
+from uuid import UUID
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.core.auth.jwt import decode_token
@@ -31,6 +32,32 @@ async def get_current_user(
     return user
 
 
+class AuthContext(NamedTuple):
+    """Identity of the authenticated caller"""
+    user_id: UUID
+    organization_id: Optional[UUID]
+    user_type: str
+
+
+async def get_auth_context(
+    request: Request,
+    authorization: Annotated[str | None, Header(alias="Authorization")] = None,
+    db: AsyncSession = Depends(get_db),
+) -> AuthContext:
+    """
+    Authenticated caller for the current request.
+    
+    Reuses the user AuthMiddleware already loaded onto request.state, so the
+    token is decoded and the user fetched once per request; only routes the
+    middleware skips fall back to get_current_user. FastAPI caches the
+    result for every dependency of the same request.
+    """
+    user = getattr(request.state, "user", None)
+    if user is None:
+        user = await get_current_user(authorization, db)
+    return AuthContext(user.id, user.organization_id, user.user_type)
+
+
 def require_permissions(*codes: str):
     async def _dep(user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
         svc = RBACService(db)
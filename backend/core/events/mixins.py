@@ -61,8 +61,9 @@ class EventMixin:
             metadata=EventMetadata(**metadata) if metadata else None
         )
         
-        # Store event for later persistence
-        if not hasattr(self, '_pending_events'):
+        # Store event for later persistence, on this instance: appending to
+        # the class-level default would share events between instances
+        if '_pending_events' not in self.__dict__:
             self._pending_events = []
         self._pending_events.append(event)
     
@@ -10,29 +10,116 @@ import uuid
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column, DateTime, Integer, String, Text, text
-from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    SmallInteger,
+    String,
+    Text,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID, insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.hybrid import Comparator, hybrid_property
 from sqlalchemy.future import select
+from sqlalchemy.orm import relationship
 
 from backend.db.session import Base
 
 
+class EventTypeRef(Base):
+    """Lookup table for event type codes, e.g. "partner.vehicle.added" """
+    
+    __tablename__ = "event_type_ref"
+    
+    id = Column(SmallInteger, Identity(), primary_key=True)
+    code = Column(String(100), nullable=False, unique=True)
+
+
+class AggregateTypeRef(Base):
+    """Lookup table for aggregate type codes, e.g. "partner" """
+    
+    __tablename__ = "aggregate_type_ref"
+    
+    id = Column(SmallInteger, Identity(), primary_key=True)
+    code = Column(String(50), nullable=False, unique=True)
+
+
+class _CodeComparator(Comparator):
+    """
+    Compares a dictionary-encoded column by its code.
+    
+    Event.event_type == "x" becomes event_type_id = (SELECT id ... WHERE code = 'x'),
+    an uncorrelated subquery evaluated once, so the id index is used.
+    """
+    
+    def __init__(self, id_column, lookup):
+        super().__init__(id_column)
+        self.lookup = lookup
+    
+    def __eq__(self, code):
+        return self.expression == (
+            select(self.lookup.id).where(self.lookup.code == code).scalar_subquery()
+        )
+
+
 class Event(Base):
-    """Event storage table - stores ALL events from ALL modules"""
+    """Event storage table - stores ALL events from ALL modules
+    
+    event_type and aggregate_type are stored as SMALLINT ids into
+    event_type_ref / aggregate_type_ref; the hybrid properties of the same
+    names read and filter by the code.
+    """
     
     __tablename__ = "events"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    event_type = Column(String(100), nullable=False, index=True)
-    aggregate_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    aggregate_type = Column(String(50), nullable=False, index=True)
+    event_type_id = Column(SmallInteger, ForeignKey("event_type_ref.id"), nullable=False, index=True)
+    aggregate_id = Column(UUID(as_uuid=True), nullable=False)
+    aggregate_type_id = Column(SmallInteger, ForeignKey("aggregate_type_ref.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
-    timestamp = Column(DateTime(timezone=True), nullable=False, server_default=text("NOW()"), index=True)
+    timestamp = Column(DateTime(timezone=True), nullable=False, server_default=text("NOW()"))
     version = Column(Integer, nullable=False, default=1)
     data = Column(JSONB, nullable=False)
     event_metadata = Column(JSONB, nullable=True)  # Renamed from 'metadata' to avoid SQLAlchemy conflict
     created_at = Column(DateTime(timezone=True), nullable=False, server_default=text("NOW()"))
+    
+    __table_args__ = (
+        # An aggregate's stream in order; the leading column serves aggregate_id alone
+        Index("ix_events_aggregate_composite", "aggregate_id", "aggregate_type_id", "timestamp"),
+        # Append-only, so timestamp follows physical order
+        Index(
+            "ix_events_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+    
+    event_type_ref = relationship(EventTypeRef, lazy="joined", innerjoin=True)
+    aggregate_type_ref = relationship(AggregateTypeRef, lazy="joined", innerjoin=True)
+    
+    @hybrid_property
+    def event_type(self) -> str:
+        return self.event_type_ref.code
+    
+    @event_type.inplace.comparator
+    @classmethod
+    def _event_type_comparator(cls) -> _CodeComparator:
+        return _CodeComparator(cls.event_type_id, EventTypeRef)
+    
+    @hybrid_property
+    def aggregate_type(self) -> str:
+        return self.aggregate_type_ref.code
+    
+    @aggregate_type.inplace.comparator
+    @classmethod
+    def _aggregate_type_comparator(cls) -> _CodeComparator:
+        return _CodeComparator(cls.aggregate_type_id, AggregateTypeRef)
 
 
 class EventStore:
@@ -66,9 +153,9 @@ class EventStore:
         Events are immutable once written.
         """
         event = Event(
-            event_type=event_type,
+            event_type_id=await self._code_id(EventTypeRef, event_type),
             aggregate_id=aggregate_id,
-            aggregate_type=aggregate_type,
+            aggregate_type_id=await self._code_id(AggregateTypeRef, aggregate_type),
             user_id=user_id,
             data=data,
             event_metadata=metadata,
@@ -81,6 +168,28 @@ class EventStore:
         
         return event
     
+    async def _code_id(self, lookup, code: str) -> int:
+        """Id of a lookup code, registering the code the first time it is seen"""
+        inserted = (
+            insert(lookup)
+            .values(code=code)
+            .on_conflict_do_nothing(index_elements=[lookup.code])
+            .returning(lookup.id)
+            .cte("inserted")
+        )
+        query = (
+            select(inserted.c.id)
+            .union_all(select(lookup.id).where(lookup.code == code))
+            .limit(1)
+        )
+        code_id = (await self.session.execute(query)).scalar()
+        if code_id is None:
+            # Registered by a concurrent transaction after this statement's snapshot
+            code_id = (await self.session.execute(
+                select(lookup.id).where(lookup.code == code)
+            )).scalar_one()
+        return code_id
+    
     async def get_by_aggregate(
         self,
         aggregate_id: uuid.UUID,
@@ -17,6 +17,14 @@ class AppSettings(BaseSettings):
     ALLOWED_ORIGINS: str = "https://frontend-service-565186585906.us-central1.run.app,http://localhost:3000,http://localhost:5173"
     REDIS_URL: str = "redis://localhost:6379/0"
     
+    # Async database pool (per worker process)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    
+    # GCS bucket for uploaded partner documents; empty = placeholder URLs (local dev)
+    DOCUMENTS_BUCKET: str = ""
+    
     # Cookie/Session settings for Cloud Run
     COOKIE_SECURE: bool = True
     COOKIE_SAMESITE: str = "None"
@@ -0,0 +1,12 @@
+"""
+Storage Module
+
+Object storage for uploaded documents.
+"""
+
+from backend.core.storage.document_storage import DocumentStorage, get_document_storage
+
+__all__ = [
+    "DocumentStorage",
+    "get_document_storage",
+]
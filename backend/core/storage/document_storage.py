@@ -0,0 +1,83 @@
+"""
+Document Storage using Google Cloud Storage
+
+Uploads are resumable and sent in fixed-size chunks, so at most one chunk
+of a file is held in memory while it is transferred.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from typing import BinaryIO, Optional
+
+from google.cloud import storage
+
+from backend.core.settings.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Resumable upload chunk size (GCS requires a multiple of 256 KiB)
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class DocumentStorage:
+    """
+    Content-addressed document storage on GCS.
+    
+    Objects are named by the SHA-256 of their content, so uploading the same
+    file twice reuses the stored object instead of writing it again.
+    """
+    
+    def __init__(self, bucket_name: str):
+        """Initialize storage for the given bucket."""
+        self.bucket = storage.Client().bucket(bucket_name)
+    
+    def _upload(self, fileobj: BinaryIO, filename: Optional[str], content_type: Optional[str]) -> str:
+        fileobj.seek(0)
+        digest = hashlib.file_digest(fileobj, "sha256").hexdigest()
+        extension = os.path.splitext(filename or "")[1].lower()
+        
+        blob = self.bucket.blob(f"documents/{digest}{extension}", chunk_size=UPLOAD_CHUNK_SIZE)
+        if blob.exists():
+            logger.info(f"Document {blob.name} already stored, skipping upload")
+        else:
+            fileobj.seek(0)
+            blob.upload_from_file(fileobj, content_type=content_type)
+        
+        fileobj.seek(0)
+        return blob.public_url
+    
+    async def upload(
+        self,
+        fileobj: BinaryIO,
+        filename: Optional[str],
+        content_type: Optional[str] = None,
+    ) -> str:
+        """
+        Upload a file and return its URL.
+        
+        The GCS client is blocking, so hashing and upload run in a worker
+        thread; the event loop keeps serving other requests meanwhile.
+        
+        Args:
+            fileobj: Binary file object (e.g. UploadFile.file)
+            filename: Original file name, used for the object extension
+            content_type: MIME type stored on the object
+            
+        Returns:
+            Public URL of the stored object
+        """
+        return await asyncio.to_thread(self._upload, fileobj, filename, content_type)
+
+
+# Singleton instance
+_document_storage: Optional[DocumentStorage] = None
+
+
+def get_document_storage() -> Optional[DocumentStorage]:
+    """Get singleton document storage, or None when no bucket is configured."""
+    global _document_storage
+    if _document_storage is None and settings.DOCUMENTS_BUCKET:
+        _document_storage = DocumentStorage(settings.DOCUMENTS_BUCKET)
+    return _document_storage
@@ -0,0 +1,27 @@
+"""
+Primary key generation.
+
+uuid7() returns RFC 9562 version 7 UUIDs: a 48-bit millisecond timestamp
+followed by random bits. Keys generated later sort later, so inserts land
+on the right edge of the primary key B-tree instead of random leaf pages.
+Keys are generated here rather than by the database so that models keep
+assigning ids on the client (needed before flush for relationships) and no
+PostgreSQL extension is required.
+"""
+
+import os
+import time
+import uuid
+
+__all__ = ["uuid7"]
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUID (version 7)."""
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    # Version (4 bits at 76) and RFC 4122 variant (2 bits at 62)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import asyncio
-import importlib.util
+import functools
+import importlib
 import os
 import sys
 from logging.config import fileConfig
 from pathlib import Path
 
 from alembic import context
-from sqlalchemy import pool
+from sqlalchemy import MetaData, pool
 from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import create_async_engine
 
@@ -25,108 +26,48 @@ from backend.db.session import Base  # noqa: E402
 
 # ============================================
 # IMPORT ALL MODELS FOR MIGRATION GENERATION
-# Total: 58 tables across the system
 # ============================================
-
-# Core Models - Events & Outbox (2 tables)
-from backend.core.events.store import Event  # noqa: F401,E402
-from backend.core.outbox.models import EventOutbox  # noqa: F401,E402
-
-# Core Models - Capabilities (3 tables)
-from backend.core.auth.capabilities.models import (  # noqa: F401,E402
-    Capability,
-    UserCapability,
-    RoleCapability,
-)
-
-# Core Models - GDPR (4 tables)
-from backend.core.gdpr.data_retention import DataRetentionPolicy  # noqa: F401,E402
-from backend.core.gdpr.consent import ConsentVersion, UserConsent  # noqa: F401,E402
-from backend.core.gdpr.user_rights import UserRightRequest  # noqa: F401,E402
-
-# Settings Models - Users & Auth (6 tables)
-from backend.modules.settings.models.settings_models import (  # noqa: F401,E402
-    User,
-    Role,
-    Permission,
-    RolePermission,
-    UserRole,
-    RefreshToken,
-)
-
-# Settings Models - Organization (5 tables)
-from backend.modules.settings.organization.models import (  # noqa: F401,E402
-    Organization,
-    OrganizationGST,
-    OrganizationBankAccount,
-    OrganizationFinancialYear,
-    OrganizationDocumentSeries,
+# Models are discovered from the filesystem instead of a hand-maintained,
+# dependency-ordered import list. Relationships and FKs use string references,
+# so SQLAlchemy's declarative registry resolves them regardless of import order.
+BACKEND_ROOT = REPO_ROOT / "backend"
+MODEL_SEARCH_DIRS = ("core", "modules")
+
+# Tables declared outside the models.py / *_models.py / models/ conventions
+EXTRA_MODEL_MODULES = (
+    "backend.core.events.store",
+    "backend.core.gdpr.data_retention",
+    "backend.core.gdpr.consent",
+    "backend.core.gdpr.user_rights",
 )
 
-# Settings Models - Commodities (11 tables)
-from backend.modules.settings.commodities.models import (  # noqa: F401,E402
-    Commodity,
-    CommodityVariety,
-    CommodityParameter,
-    SystemCommodityParameter,
-    PaymentTerm,
-    DeliveryTerm,
-    WeightmentTerm,
-    PassingTerm,
-    BargainType,
-    TradeType,
-    CommissionStructure,
-)
-from backend.modules.settings.commodities.hsn_models import (  # noqa: F401,E402
-    HSNKnowledgeBase,
-)
 
-# Settings Models - Locations (1 table)
-from backend.modules.settings.locations.models import Location  # noqa: F401,E402
-
-# Partner Models (9 tables)
-from backend.modules.partners.models import (  # noqa: F401,E402
-    BusinessPartner,
-    PartnerLocation,
-    PartnerEmployee,
-    PartnerDocument,
-    PartnerVehicle,
-    PartnerOnboardingApplication,
-    PartnerAmendment,
-    PartnerKYCRenewal,
-    PartnerBranch,
-)
+def _discover_model_modules() -> list[str]:
+    """Return dotted names of every model module under core/ and modules/."""
+    names: set[str] = set()
+    for search_dir in MODEL_SEARCH_DIRS:
+        for path in (BACKEND_ROOT / search_dir).rglob("*.py"):
+            if "__pycache__" in path.parts:
+                continue
+            rel = path.relative_to(BACKEND_ROOT).with_suffix("")
+            if path.name == "__init__.py":
+                # models/ package: its __init__ re-exports the package's models
+                if rel.parent.name != "models":
+                    continue
+                rel = rel.parent
+            elif path.stem != "models" and not path.stem.endswith("_models"):
+                continue
+            names.add(".".join(("backend", *rel.parts)))
+    return sorted(names)
 
-# Auth Models (1 table)
-from backend.modules.auth.models import UserSession  # noqa: F401,E402
 
-# Notification Models (3 tables)
-from backend.modules.notifications.models.notification import (  # noqa: F401,E402
-    Notification,
-    NotificationPreference,
-    DeviceToken,
-)
+def _import_all_models() -> None:
+    # importlib caches in sys.modules, so already-loaded modules are not re-executed
+    for module_name in (*EXTRA_MODEL_MODULES, *_discover_model_modules()):
+        importlib.import_module(module_name)
 
-# Trade Desk Models - Import in dependency order to avoid circular references (13 tables)
-# Base entities (no FK to other trade_desk tables)
-from backend.modules.trade_desk.models.requirement import Requirement  # noqa: F401,E402
-from backend.modules.trade_desk.models.availability import Availability  # noqa: F401,E402
-from backend.modules.trade_desk.models.match_token import MatchToken  # noqa: F401,E402
-from backend.modules.trade_desk.models.requirement_embedding import RequirementEmbedding  # noqa: F401,E402
-from backend.modules.trade_desk.models.availability_embedding import AvailabilityEmbedding  # noqa: F401,E402
 
-# Negotiations (depends on match_tokens, requirements, availabilities)
-from backend.modules.trade_desk.models.negotiation import Negotiation  # noqa: F401,E402
-from backend.modules.trade_desk.models.negotiation_offer import NegotiationOffer  # noqa: F401,E402
-from backend.modules.trade_desk.models.negotiation_message import NegotiationMessage  # noqa: F401,E402
-
-# Trades (depends on negotiations)
-from backend.modules.trade_desk.models.trade import Trade  # noqa: F401,E402
-from backend.modules.trade_desk.models.trade_amendment import TradeAmendment  # noqa: F401,E402
-from backend.modules.trade_desk.models.trade_signature import TradeSignature  # noqa: F401,E402
-
-# Match outcomes (depends on trades)
-from backend.modules.trade_desk.models.match_outcome import MatchOutcome  # noqa: F401,E402
+_import_all_models()
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -138,16 +79,30 @@ if config.config_file_name is not None:
 
 target_metadata = Base.metadata
 
+# Optional table-name prefix (e.g. ALEMBIC_METADATA_SCOPE=organization) that
+# limits autogenerate to one module's tables instead of diffing all of them.
+METADATA_SCOPE = os.getenv("ALEMBIC_METADATA_SCOPE")
+if METADATA_SCOPE:
+    scoped_metadata = MetaData()
+    for table in Base.metadata.sorted_tables:
+        if table.name.startswith(METADATA_SCOPE):
+            table.to_metadata(scoped_metadata)
+    target_metadata = scoped_metadata
+
 
 def _include_object(object, name, type_, reflected, compare_to):  # noqa: ANN001
+    # Out-of-scope tables are absent from target_metadata; don't diff them as removed
+    if METADATA_SCOPE and type_ == "table" and not name.startswith(METADATA_SCOPE):
+        return False
     # Avoid re-generating composite unique constraints that are redundant with PK
     if type_ == "unique_constraint" and name in {"uq_role_permission", "uq_user_role"}:
         return False
     return True
 
 
+@functools.lru_cache(maxsize=1)
 def get_database_url() -> str:
-    """Get database URL from environment."""
+    """Get database URL from environment (read once per process)."""
     db_url = os.getenv("DATABASE_URL")
     if not db_url:
         # Fallback for local development
@@ -195,17 +150,19 @@ def do_run_migrations(connection: Connection) -> None:
         context.run_migrations()
 
 
+@functools.lru_cache(maxsize=1)
+def get_async_database_url() -> str:
+    """Database URL normalized to the asyncpg driver for online migrations."""
+    return (
+        get_database_url()
+        .replace("postgresql+psycopg://", "postgresql+asyncpg://")
+        .replace("postgresql://", "postgresql+asyncpg://", 1)
+    )
+
+
 async def run_async_migrations() -> None:
     """Run migrations in async mode."""
-    db_url = get_database_url()
-    
-    # Ensure async driver for online migrations
-    if "postgresql://" in db_url and "asyncpg" not in db_url:
-        db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
-    if "postgresql+psycopg://" in db_url:
-        db_url = db_url.replace("postgresql+psycopg://", "postgresql+asyncpg://")
-    
-    connectable = create_async_engine(db_url, poolclass=pool.NullPool)
+    connectable = create_async_engine(get_async_database_url(), poolclass=pool.NullPool)
 
     async with connectable.connect() as connection:
         await connection.run_sync(do_run_migrations)
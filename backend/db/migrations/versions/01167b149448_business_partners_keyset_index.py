@@ -0,0 +1,46 @@
+"""Index business_partners for keyset pagination
+
+Partner listings page with WHERE (created_at, id) < (:created_at, :id)
+ORDER BY created_at DESC, id DESC instead of OFFSET; this index serves
+that scan directly for the non-deleted rows the listing reads.
+
+Revision ID: 01167b149448
+Revises: d5fd7286d60e
+Create Date: 2026-10-16 10:12:41.508113
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+
+# revision identifiers, used by Alembic.
+revision = '01167b149448'
+down_revision = 'd5fd7286d60e'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so partner writes are not blocked while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_business_partners_created_at_id',
+            'business_partners',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_where=sa.text('is_deleted = false'),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_business_partners_created_at_id',
+            table_name='business_partners',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,65 @@
+"""Store CDPS capabilities and entity_hierarchy as JSONB
+
+business_partners.capabilities and entity_hierarchy are JSON (text, re-parsed
+on every read). Converts both to JSONB in one table rewrite and adds a GIN
+jsonb_path_ops index on capabilities, which serves containment filters such
+as capabilities @> '{"import_allowed": true}' for every capability key.
+Combinations of flags are a single containment as well
+('{"domestic_buy_india": true, "domestic_sell_india": true}'), so no
+multicolumn expression index over the flags is added.
+
+Revision ID: 3b9d4e7f2a15
+Revises: 7a2d5e8b3c61
+Create Date: 2026-10-16 22:31:47.208153
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '3b9d4e7f2a15'
+down_revision = '7a2d5e8b3c61'
+branch_labels = None
+depends_on = None
+
+
+def _retype(target: str) -> None:
+    # The '{}' default is dropped and re-set around the type change so it is
+    # never cast between json and jsonb
+    op.execute(
+        'ALTER TABLE business_partners '
+        'ALTER COLUMN capabilities DROP DEFAULT, '
+        f'ALTER COLUMN capabilities TYPE {target} USING capabilities::{target}, '
+        f"ALTER COLUMN capabilities SET DEFAULT '{{}}'::{target}, "
+        f'ALTER COLUMN entity_hierarchy TYPE {target} USING entity_hierarchy::{target}'
+    )
+
+
+def upgrade() -> None:
+    _retype('jsonb')
+
+    # CONCURRENTLY so partner writes are not blocked while the index builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_capabilities_gin',
+            'business_partners',
+            ['capabilities'],
+            postgresql_using='gin',
+            postgresql_ops={'capabilities': 'jsonb_path_ops'},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'idx_capabilities_gin',
+            table_name='business_partners',
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+    _retype('json')
@@ -0,0 +1,57 @@
+"""BRIN indexes on append-only partner timestamps
+
+partner_documents.uploaded_at, partner_amendments.requested_at and
+partner_kyc_renewals.created_at are set at insert time and never change,
+so they follow the physical row order and a BRIN index (pages_per_range 32)
+serves "last N days" range scans at a fraction of a B-tree's size.
+
+business_partners.created_at is left out: the keyset index
+ix_business_partners_created_at_id already serves its range scans.
+
+Revision ID: 4f81d2c7a5e9
+Revises: 9c3e6f1a4b82
+Create Date: 2026-10-16 21:40:27.519384
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '4f81d2c7a5e9'
+down_revision = '9c3e6f1a4b82'
+branch_labels = None
+depends_on = None
+
+BRIN_INDEXES = (
+    ('ix_partner_documents_uploaded_at_brin', 'partner_documents', 'uploaded_at'),
+    ('ix_partner_amendments_requested_at_brin', 'partner_amendments', 'requested_at'),
+    ('ix_partner_kyc_renewals_created_at_brin', 'partner_kyc_renewals', 'created_at'),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so partner writes are not blocked while the indexes build
+    with op.get_context().autocommit_block():
+        for name, table, column in BRIN_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 32},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _column in BRIN_INDEXES:
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,56 @@
+"""Derive onboarding tax_verified from the verification results
+
+partner_onboarding_applications.tax_verified becomes a STORED generated
+column read from the gst_verified flag create_application records in
+verification_results, so the two can no longer disagree. The application
+layer stops writing the column.
+
+Existing tax_verified values are copied into verification_results first, so
+the generated column comes back with the same value for every row that had
+one (NULLs read as false).
+
+Revision ID: 5c2e9a71d3b8
+Revises: bd81e4c74adc
+Create Date: 2026-10-16 19:02:17.214538
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '5c2e9a71d3b8'
+down_revision = 'bd81e4c74adc'
+branch_labels = None
+depends_on = None
+
+TAX_VERIFIED_EXPRESSION = "COALESCE((verification_results->>'gst_verified')::boolean, false)"
+
+
+def upgrade() -> None:
+    # Keep the current flag: the generated column below is rebuilt from it
+    op.execute("""
+        UPDATE partner_onboarding_applications
+        SET verification_results = jsonb_set(
+            COALESCE(verification_results::jsonb, '{}'::jsonb),
+            '{gst_verified}',
+            to_jsonb(tax_verified)
+        )::json
+        WHERE tax_verified IS NOT NULL
+    """)
+
+    # A column cannot be converted to a generated one in place; both steps
+    # run in one ALTER so the table is rewritten once.
+    op.execute(f"""
+        ALTER TABLE partner_onboarding_applications
+            DROP COLUMN tax_verified,
+            ADD COLUMN tax_verified BOOLEAN GENERATED ALWAYS AS ({TAX_VERIFIED_EXPRESSION}) STORED
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        ALTER TABLE partner_onboarding_applications
+            ALTER COLUMN tax_verified DROP EXPRESSION
+    """)
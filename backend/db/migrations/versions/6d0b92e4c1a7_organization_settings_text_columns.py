@@ -0,0 +1,57 @@
+"""Use TEXT for free-form organization settings columns
+
+Names, addresses, e-mails, URLs and the invoice footer on organizations,
+organization_gst and organization_bank_accounts carry no meaningful length
+limit, so they become TEXT. Columns whose length is part of the domain
+(base_currency, PAN, CIN, gstin, ifsc) and short codes (type, pincode,
+phone numbers, theme_color, branch_code, account_number) keep their VARCHAR limits.
+
+VARCHAR(n) -> TEXT is binary-compatible, so no table is rewritten.
+
+Revision ID: 6d0b92e4c1a7
+Revises: a3f18c07d2e4
+Create Date: 2026-10-16 20:31:52.118406
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6d0b92e4c1a7'
+down_revision = 'a3f18c07d2e4'
+branch_labels = None
+depends_on = None
+
+# (table, column, previous VARCHAR length)
+TEXT_COLUMNS = (
+    ('organizations', 'legal_name', 255),
+    ('organizations', 'address_line1', 255),
+    ('organizations', 'address_line2', 255),
+    ('organizations', 'city', 128),
+    ('organizations', 'state', 128),
+    ('organizations', 'contact_email', 255),
+    ('organizations', 'logo_url', 255),
+    ('organizations', 'invoice_footer', 1024),
+    ('organizations', 'digital_signature_url', 255),
+    ('organizations', 'audit_firm_name', 255),
+    ('organizations', 'audit_firm_email', 255),
+    ('organization_gst', 'legal_name', 255),
+    ('organization_gst', 'address', 255),
+    ('organization_gst', 'state', 128),
+    ('organization_bank_accounts', 'account_holder', 255),
+    ('organization_bank_accounts', 'bank_name', 255),
+    ('organization_bank_accounts', 'branch', 255),
+)
+
+
+def upgrade() -> None:
+    for table, column, length in TEXT_COLUMNS:
+        op.alter_column(table, column, type_=sa.Text(), existing_type=sa.String(length=length))
+
+
+def downgrade() -> None:
+    for table, column, length in TEXT_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(length=length), existing_type=sa.Text())
@@ -0,0 +1,53 @@
+"""Store partner JSON payloads as JSONB
+
+JSON columns are stored as text and re-parsed on every read; JSONB is stored
+pre-parsed. Converts the partner payload columns:
+
+- business_partners: service_details, commodities, risk_assessment
+- partner_employees: permissions
+- partner_documents: ocr_extracted_data
+- partner_vehicles: rto_data
+- partner_amendments: supporting_documents
+
+Each table is rewritten once, with all of its columns in a single ALTER.
+
+Revision ID: 7a2d5e8b3c61
+Revises: 4f81d2c7a5e9
+Create Date: 2026-10-16 21:58:03.662718
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '7a2d5e8b3c61'
+down_revision = '4f81d2c7a5e9'
+branch_labels = None
+depends_on = None
+
+JSONB_COLUMNS = {
+    'business_partners': ('service_details', 'commodities', 'risk_assessment'),
+    'partner_employees': ('permissions',),
+    'partner_documents': ('ocr_extracted_data',),
+    'partner_vehicles': ('rto_data',),
+    'partner_amendments': ('supporting_documents',),
+}
+
+
+def _retype(target: str) -> None:
+    for table, columns in JSONB_COLUMNS.items():
+        alterations = ', '.join(
+            f'ALTER COLUMN {column} TYPE {target} USING {column}::{target}'
+            for column in columns
+        )
+        op.execute(f'ALTER TABLE {table} {alterations}')
+
+
+def upgrade() -> None:
+    _retype('jsonb')
+
+
+def downgrade() -> None:
+    _retype('json')
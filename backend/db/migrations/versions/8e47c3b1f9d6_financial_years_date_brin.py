@@ -0,0 +1,48 @@
+"""BRIN indexes on financial year date ranges
+
+Financial years are created in date order, so start_date and end_date are
+correlated with their physical position and a BRIN index (pages_per_range
+32) serves range lookups at a fraction of a B-tree's size and write cost.
+
+Revision ID: 8e47c3b1f9d6
+Revises: 6d0b92e4c1a7
+Create Date: 2026-10-16 20:48:33.604217
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '8e47c3b1f9d6'
+down_revision = '6d0b92e4c1a7'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ('start_date', 'end_date')
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            op.create_index(
+                f'ix_organization_financial_years_{column}',
+                'organization_financial_years',
+                [column],
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 32},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in COLUMNS:
+            op.drop_index(
+                f'ix_organization_financial_years_{column}',
+                table_name='organization_financial_years',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,44 @@
+"""Use TEXT for partner names and document URLs
+
+legal_name and trade_name on business_partners and
+partner_onboarding_applications, and partner_documents.file_url, have no
+meaningful length limit, so they become TEXT.
+
+VARCHAR(n) -> TEXT is binary-compatible: no table rewrite and the existing
+indexes (including the trigram index on legal_name) are kept as they are.
+
+Revision ID: 9c3e6f1a4b82
+Revises: 2b5f7a9c0e13
+Create Date: 2026-10-16 21:22:10.845731
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c3e6f1a4b82'
+down_revision = '2b5f7a9c0e13'
+branch_labels = None
+depends_on = None
+
+# (table, column, previous VARCHAR length)
+TEXT_COLUMNS = (
+    ('business_partners', 'legal_name', 500),
+    ('business_partners', 'trade_name', 500),
+    ('partner_onboarding_applications', 'legal_name', 500),
+    ('partner_onboarding_applications', 'trade_name', 500),
+    ('partner_documents', 'file_url', 1000),
+)
+
+
+def upgrade() -> None:
+    for table, column, length in TEXT_COLUMNS:
+        op.alter_column(table, column, type_=sa.Text(), existing_type=sa.String(length=length))
+
+
+def downgrade() -> None:
+    for table, column, length in TEXT_COLUMNS:
+        op.alter_column(table, column, type_=sa.String(length=length), existing_type=sa.Text())
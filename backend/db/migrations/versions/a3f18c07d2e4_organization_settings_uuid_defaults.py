@@ -0,0 +1,42 @@
+"""Generate organization settings primary keys server-side
+
+organization_gst, organization_bank_accounts, organization_financial_years
+and organization_document_series get gen_random_uuid() as the default for
+their id column, so inserts no longer need a client-generated UUID and batch
+inserts can take their ids from RETURNING.
+
+gen_random_uuid() is built into PostgreSQL 13+, no extension needed.
+
+Revision ID: a3f18c07d2e4
+Revises: 5c2e9a71d3b8
+Create Date: 2026-10-16 20:14:08.731952
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f18c07d2e4'
+down_revision = '5c2e9a71d3b8'
+branch_labels = None
+depends_on = None
+
+TABLES = (
+    'organization_gst',
+    'organization_bank_accounts',
+    'organization_financial_years',
+    'organization_document_series',
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=sa.text('gen_random_uuid()'))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, 'id', server_default=None)
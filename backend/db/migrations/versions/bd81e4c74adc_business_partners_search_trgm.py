@@ -0,0 +1,46 @@
+"""Trigram index for partner search
+
+Partner search matches name/tax ID/PAN with ILIKE '%term%' and the pg_trgm
+word-similarity operator (%>), neither of which a B-tree can serve. This
+GIN index over the same concatenated expression the repository builds
+(see partner_search_filter) serves both.
+
+Revision ID: bd81e4c74adc
+Revises: 01167b149448
+Create Date: 2026-10-16 11:02:17.349861
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+
+# revision identifiers, used by Alembic.
+revision = 'bd81e4c74adc'
+down_revision = '01167b149448'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # CONCURRENTLY so partner writes are not blocked while the index builds.
+    # The expression must match _partner_search_document() exactly.
+    with op.get_context().autocommit_block():
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_business_partners_search_trgm
+            ON business_partners USING GIN ((
+                legal_name
+                || ' ' || coalesce(trade_name, '')
+                || ' ' || coalesce(tax_id_number, '')
+                || ' ' || coalesce(pan_number, '')
+            ) gin_trgm_ops)
+        """)
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other objects may depend on it
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_business_partners_search_trgm")
@@ -0,0 +1,76 @@
+"""Dictionary-encode events.event_type and aggregate_type
+
+events stored event_type (VARCHAR(100)) and aggregate_type (VARCHAR(50)) on
+every row and indexed the full strings. They are replaced by SMALLINT
+event_type_id / aggregate_type_id foreign keys into new event_type_ref and
+aggregate_type_ref lookup tables, backfilled from the existing strings, and
+the two indexes are rebuilt on the 2-byte ids. EventStore registers a code
+the first time it is seen (INSERT ... ON CONFLICT DO NOTHING).
+
+Revision ID: e6a4c2b9d7f1
+Revises: 3b9d4e7f2a15
+Create Date: 2026-10-16 22:58:14.730261
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e6a4c2b9d7f1'
+down_revision = '3b9d4e7f2a15'
+branch_labels = None
+depends_on = None
+
+# events string column -> (lookup table, code length)
+LOOKUPS = {
+    'event_type': ('event_type_ref', 100),
+    'aggregate_type': ('aggregate_type_ref', 50),
+}
+
+
+def upgrade() -> None:
+    for column, (table, length) in LOOKUPS.items():
+        op.create_table(
+            table,
+            sa.Column('id', sa.SmallInteger(), sa.Identity(), primary_key=True),
+            sa.Column('code', sa.String(length=length), nullable=False, unique=True),
+        )
+        op.execute(f'INSERT INTO {table} (code) SELECT DISTINCT {column} FROM events ORDER BY 1')
+        op.add_column('events', sa.Column(f'{column}_id', sa.SmallInteger(), nullable=True))
+
+    # Both ids in one pass over events
+    op.execute("""
+        UPDATE events
+        SET event_type_id = et.id, aggregate_type_id = at.id
+        FROM event_type_ref et, aggregate_type_ref at
+        WHERE et.code = events.event_type AND at.code = events.aggregate_type
+    """)
+
+    for column, (table, _length) in LOOKUPS.items():
+        op.alter_column('events', f'{column}_id', nullable=False)
+        op.create_foreign_key(f'events_{column}_id_fkey', 'events', table, [f'{column}_id'], ['id'])
+        op.drop_index(f'ix_events_{column}', table_name='events')
+        op.drop_column('events', column)
+        op.create_index(f'ix_events_{column}_id', 'events', [f'{column}_id'])
+
+
+def downgrade() -> None:
+    for column, (_table, length) in LOOKUPS.items():
+        op.add_column('events', sa.Column(column, sa.String(length=length), nullable=True))
+
+    op.execute("""
+        UPDATE events
+        SET event_type = et.code, aggregate_type = at.code
+        FROM event_type_ref et, aggregate_type_ref at
+        WHERE et.id = events.event_type_id AND at.id = events.aggregate_type_id
+    """)
+
+    for column, (table, _length) in LOOKUPS.items():
+        op.alter_column('events', column, nullable=False)
+        op.create_index(f'ix_events_{column}', 'events', [column])
+        op.drop_index(f'ix_events_{column}_id', table_name='events')
+        op.drop_column('events', f'{column}_id')
+        op.drop_table(table)
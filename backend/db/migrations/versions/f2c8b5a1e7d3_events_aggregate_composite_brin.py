@@ -0,0 +1,74 @@
+"""Trim events indexes to an aggregate composite plus a BRIN on timestamp
+
+events had single-column B-trees on aggregate_id, aggregate_type_id and
+timestamp. Event streams are read per aggregate in timestamp order, so one
+composite (aggregate_id, aggregate_type_id, timestamp) replaces the first
+two; its leading column still serves lookups by aggregate_id alone.
+Events are append-only, so timestamp follows physical row order and a BRIN
+index (pages_per_range 32) serves time-range scans at a fraction of a
+B-tree's size. The event_type_id and user_id indexes stay.
+
+Revision ID: f2c8b5a1e7d3
+Revises: e6a4c2b9d7f1
+Create Date: 2026-10-16 23:24:51.094382
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c8b5a1e7d3'
+down_revision = 'e6a4c2b9d7f1'
+branch_labels = None
+depends_on = None
+
+REPLACED_INDEXES = ('aggregate_id', 'aggregate_type_id', 'timestamp')
+
+
+def upgrade() -> None:
+    # CONCURRENTLY so event writes are not blocked while the indexes build
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_events_aggregate_composite',
+            'events',
+            ['aggregate_id', 'aggregate_type_id', 'timestamp'],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            'ix_events_timestamp_brin',
+            'events',
+            ['timestamp'],
+            postgresql_using='brin',
+            postgresql_with={'pages_per_range': 32},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        for column in REPLACED_INDEXES:
+            op.drop_index(
+                f'ix_events_{column}',
+                table_name='events',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for column in REPLACED_INDEXES:
+            op.create_index(
+                f'ix_events_{column}',
+                'events',
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name in ('ix_events_timestamp_brin', 'ix_events_aggregate_composite'):
+            op.drop_index(
+                name,
+                table_name='events',
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 try:
     # When running with PYTHONPATH=., we can import as a package-less module
@@ -13,14 +13,32 @@ except ModuleNotFoundError:  # Fallback when launched from backend working dir
     from modules.settings.services.settings_services import SeedService  # type: ignore
 
 
+@functools.lru_cache(maxsize=None)
+def get_engine(database_url: str, schema: str | None = None) -> AsyncEngine:
+    """One engine per URL/schema, shared if the seeder runs more than once in-process."""
+    # prepared_statement_cache_size is read by SQLAlchemy's asyncpg dialect from
+    # the URL; statement_cache_size is asyncpg's own connect() argument.
+    separator = "&" if "?" in database_url else "?"
+    engine = create_async_engine(
+        f"{database_url}{separator}prepared_statement_cache_size=1024",
+        pool_size=5,
+        pool_pre_ping=False,
+        connect_args={"statement_cache_size": 1024},
+    )
+    if schema:
+        # Seed a non-default schema without changing the models
+        engine = engine.execution_options(schema_translate_map={None: schema})
+    return engine
+
+
 async def main() -> None:
     database_url = os.environ["DATABASE_URL"].replace("postgresql://", "postgresql+asyncpg://")
     org_name = os.getenv("DEFAULT_ORG_NAME", "Cotton Corp")
     admin_email = os.getenv("DEFAULT_ADMIN_EMAIL", "admin@example.com")
     admin_password = os.getenv("DEFAULT_ADMIN_PASSWORD", "ChangeMe123!")
+    schema = os.getenv("SEED_SCHEMA")
 
-    engine = create_async_engine(database_url, future=True)
-    async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async_session_maker = async_sessionmaker(get_engine(database_url, schema), expire_on_commit=False)
     
     async with async_session_maker() as session:
         service = SeedService(session)
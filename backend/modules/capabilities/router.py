@@ -12,7 +12,7 @@ Provides REST API endpoints for:
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -71,10 +71,14 @@ async def list_capabilities(
     result = await db.execute(query)
     capabilities = result.scalars().all()
     
-    return CapabilityListResponse(
+    response = CapabilityListResponse(
         total=len(capabilities),
-        capabilities=[CapabilityResponse.model_validate(cap) for cap in capabilities]
+        capabilities=tuple(CapabilityResponse.model_validate(cap) for cap in capabilities)
     )
+    # Serialize with pydantic-core directly: the full catalog is the largest
+    # payload here, and returning a Response skips FastAPI's re-validation
+    # against response_model and the jsonable_encoder pass
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.get(
@@ -122,13 +126,13 @@ async def get_user_capabilities(
     
     return UserCapabilitiesResponse(
         user_id=user_id,
-        capabilities=list(capability_codes),
-        direct_capabilities=[
+        capabilities=tuple(capability_codes),
+        direct_capabilities=tuple(
             UserCapabilityResponse.model_validate(uc) for uc in direct_caps
-        ],
-        role_capabilities=[
+        ),
+        role_capabilities=tuple(
             RoleCapabilityResponse.model_validate(rc) for rc in role_caps
-        ]
+        )
     )
 
 
@@ -279,13 +283,13 @@ async def get_my_capabilities(
     
     return UserCapabilitiesResponse(
         user_id=current_user.id,
-        capabilities=list(capability_codes),
-        direct_capabilities=[
+        capabilities=tuple(capability_codes),
+        direct_capabilities=tuple(
             UserCapabilityResponse.model_validate(uc) for uc in direct_caps
-        ],
-        role_capabilities=[
+        ),
+        role_capabilities=tuple(
             RoleCapabilityResponse.model_validate(rc) for rc in role_caps
-        ]
+        )
     )
 
 
@@ -5,10 +5,10 @@ Request/Response schemas for capability management API.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class CapabilityResponse(BaseModel):
@@ -22,8 +22,7 @@ class CapabilityResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class UserCapabilityResponse(BaseModel):
@@ -38,8 +37,7 @@ class UserCapabilityResponse(BaseModel):
     revoked_by: Optional[UUID] = None
     reason: Optional[str] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class RoleCapabilityResponse(BaseModel):
@@ -50,8 +48,7 @@ class RoleCapabilityResponse(BaseModel):
     granted_at: datetime
     granted_by: Optional[UUID] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class GrantCapabilityToUserRequest(BaseModel):
@@ -75,9 +72,9 @@ class GrantCapabilityToRoleRequest(BaseModel):
 class UserCapabilitiesResponse(BaseModel):
     """All capabilities for a user"""
     user_id: UUID
-    capabilities: List[str] = Field(..., description="List of capability codes")
-    direct_capabilities: List[UserCapabilityResponse] = Field(..., description="Directly assigned capabilities")
-    role_capabilities: List[RoleCapabilityResponse] = Field(default_factory=list, description="Capabilities from roles")
+    capabilities: tuple[str, ...] = Field(..., description="List of capability codes")
+    direct_capabilities: tuple[UserCapabilityResponse, ...] = Field(..., description="Directly assigned capabilities")
+    role_capabilities: tuple[RoleCapabilityResponse, ...] = Field(default_factory=tuple, description="Capabilities from roles")
 
 
 class CapabilityCheckRequest(BaseModel):
@@ -96,7 +93,7 @@ class CapabilityCheckResponse(BaseModel):
 class CapabilityListResponse(BaseModel):
     """List of all capabilities"""
     total: int
-    capabilities: List[CapabilityResponse]
+    capabilities: tuple[CapabilityResponse, ...]
 
 
 class CapabilityCategoryFilter(BaseModel):
@@ -4,20 +4,30 @@ from __future__ import annotations
 
 from typing import Optional, Dict, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_serializer
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponseV2(BaseModel):
     """Standard error response used across all API endpoints."""
-    
+
     detail: str = Field(..., description="Human-readable error message")
     code: Optional[str] = Field(None, description="Machine-readable error code", alias="error_code")
     field: Optional[str] = Field(None, description="Field name if validation error")
-    
-    # Alternative fields for compatibility with risk module
+
+    model_config = ConfigDict(populate_by_name=True)  # Allow both 'code' and 'error_code'
+
+    @model_serializer(mode="wrap")
+    def _drop_nulls(self, handler):
+        # Unset optional fields are left out of the payload instead of sent as null
+        return {key: value for key, value in handler(self).items() if value is not None}
+
+
+class ErrorResponseV1(ErrorResponseV2):
+    """Error response with the legacy alternative fields used by the risk module."""
+
     error: Optional[str] = Field(None, description="Error type (alternative to code)")
     message: Optional[str] = Field(None, description="Error message (alternative to detail)")
     details: Optional[Dict[str, Any]] = Field(None, description="Additional error details")
-    
-    class Config:
-        populate_by_name = True  # Allow both 'code' and 'error_code'
+
+
+ErrorResponse = ErrorResponseV2
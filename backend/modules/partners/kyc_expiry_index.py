@@ -0,0 +1,134 @@
+"""
+KYC Expiry Index
+
+Redis sorted set of KYC-verified partners scored by their KYC expiry
+(unix time), so "expiring in the next N days" is a ZRANGEBYSCORE instead
+of a filter over business_partners.
+
+The set is seeded from the database when missing and expires after
+KYC_EXPIRY_INDEX_TTL_SECONDS, which bounds drift from writes that bypass
+record()/remove() (e.g. the daily KYC expiry job). Callers re-check the
+returned IDs against the database, so a stale entry is never served.
+
+Partners are not organization-scoped, so there is one index for all.
+"""
+
+import calendar
+import logging
+import time
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import redis.asyncio as redis
+
+logger = logging.getLogger(__name__)
+
+KYC_EXPIRY_KEY = "kyc_expiry"
+KYC_EXPIRY_INDEX_TTL_SECONDS = 3600
+
+# ZADD only into an already-seeded index; a partial set would look complete
+_ZADD_IF_SEEDED = """
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return redis.call('ZADD', KEYS[1], ARGV[1], ARGV[2])
+end
+return 0
+"""
+
+
+def _score(kyc_expiry_date: date) -> int:
+    """Unix time of the expiry date at 00:00 UTC (how Postgres compares a DATE to a timestamp)."""
+    if isinstance(kyc_expiry_date, datetime):
+        kyc_expiry_date = kyc_expiry_date.date()
+    return calendar.timegm(kyc_expiry_date.timetuple())
+
+
+class KYCExpiryIndex:
+    """
+    Sorted-set index of partner KYC expiry dates.
+
+    All methods are no-ops (or report a miss) without a Redis client, and
+    Redis errors are logged rather than raised; the database stays the
+    source of truth.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis]):
+        self.redis = redis_client
+
+    async def get_expiring_ids(self, days_threshold: int) -> Optional[List[UUID]]:
+        """
+        IDs of partners whose KYC expires within days_threshold days.
+
+        Returns:
+            Partner IDs ordered by expiry, or None if the index is not
+            seeded (or Redis is unavailable)
+        """
+        if not self.redis:
+            return None
+
+        now = time.time()
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.exists(KYC_EXPIRY_KEY)
+                pipe.zrangebyscore(KYC_EXPIRY_KEY, f"({now}", now + days_threshold * 86400)
+                seeded, partner_ids = await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"KYC expiry index read failed: {e}")
+            return None
+
+        if not seeded:
+            return None
+        return [UUID(partner_id) for partner_id in partner_ids]
+
+    async def seed(self, entries: Iterable[Tuple[UUID, date]]) -> None:
+        """Replace the index with (partner_id, kyc_expiry_date) entries."""
+        if not self.redis:
+            return
+
+        mapping = {str(partner_id): _score(kyc_expiry_date) for partner_id, kyc_expiry_date in entries}
+        if not mapping:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.delete(KYC_EXPIRY_KEY)
+                pipe.zadd(KYC_EXPIRY_KEY, mapping)
+                pipe.expire(KYC_EXPIRY_KEY, KYC_EXPIRY_INDEX_TTL_SECONDS)
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"KYC expiry index seed failed: {e}")
+
+    async def record(self, partner_id: UUID, kyc_expiry_date: date) -> None:
+        """Add or move a partner after its KYC expiry date changes."""
+        if not self.redis:
+            return
+
+        try:
+            await self.redis.eval(
+                _ZADD_IF_SEEDED, 1, KYC_EXPIRY_KEY, _score(kyc_expiry_date), str(partner_id)
+            )
+        except redis.RedisError as e:
+            logger.warning(f"KYC expiry index update failed for {partner_id}: {e}")
+
+    async def record_many(self, entries: Iterable[Tuple[UUID, date]]) -> None:
+        """record() for several partners in one pipelined round trip."""
+        if not self.redis:
+            return
+
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for partner_id, kyc_expiry_date in entries:
+                    pipe.eval(_ZADD_IF_SEEDED, 1, KYC_EXPIRY_KEY, _score(kyc_expiry_date), str(partner_id))
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"KYC expiry index batch update failed: {e}")
+
+    async def remove(self, partner_id: UUID) -> None:
+        """Drop a partner whose KYC is no longer verified."""
+        if not self.redis:
+            return
+
+        try:
+            await self.redis.zrem(KYC_EXPIRY_KEY, str(partner_id))
+        except redis.RedisError as e:
+            logger.warning(f"KYC expiry index removal failed for {partner_id}: {e}")
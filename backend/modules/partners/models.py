@@ -17,7 +17,6 @@ Compliance:
 
 from __future__ import annotations
 
-import uuid
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Optional
@@ -25,19 +24,22 @@ from typing import Optional
 from sqlalchemy import (
     Boolean,
     Column,
+    Computed,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Text,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSON, UUID
+from sqlalchemy.dialects.postgresql import JSON, JSONB, UUID
 from sqlalchemy.orm import relationship
 
 from backend.core.events.mixins import EventMixin
+from backend.db.ids import uuid7
 from backend.db.session import Base
 
 
@@ -69,7 +71,7 @@ class BusinessPartner(Base, EventMixin):
     # ============================================
     # PRIMARY KEY
     # ============================================
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # ============================================
     # NO ORGANIZATION_ID
@@ -97,8 +99,8 @@ class BusinessPartner(Base, EventMixin):
     # ============================================
     # BUSINESS IDENTITY
     # ============================================
-    legal_name = Column(String(500), nullable=False, index=True)
-    trade_name = Column(String(500), nullable=True)
+    legal_name = Column(Text, nullable=False, index=True)
+    trade_name = Column(Text, nullable=True)
     
     country = Column(String(100), nullable=False, index=True)
     business_entity_type = Column(
@@ -122,10 +124,12 @@ class BusinessPartner(Base, EventMixin):
     )
     
     # Document-Driven Capabilities (CORE CDPS FIELD)
+    # Filter with containment so idx_capabilities_gin is used:
+    #   BusinessPartner.capabilities.contains({"import_allowed": True})
     capabilities = Column(
-        JSON,
+        JSONB,
         nullable=True,
-        server_default=text("'{}'::json"),
+        server_default=text("'{}'::jsonb"),
         comment="""Auto-detected from verified documents:
         {
             "domestic_buy_india": bool,
@@ -168,7 +172,7 @@ class BusinessPartner(Base, EventMixin):
     )
     
     entity_hierarchy = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="""Full entity hierarchy for compliance:
         {
@@ -264,7 +268,7 @@ class BusinessPartner(Base, EventMixin):
     # COMMODITIES (for buyers/sellers/traders)
     # ============================================
     commodities = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment='["cotton", "cotton_yarn", "textiles"]'
     )
@@ -288,7 +292,7 @@ class BusinessPartner(Base, EventMixin):
     # SERVICE PROVIDER DETAILS (JSON)
     # ============================================
     service_details = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Transporter: {fleet_size, routes, vehicle_types, has_own_vehicles, transport_license}, Broker: {license_number, exchange, commission_structure}"
     )
@@ -299,7 +303,7 @@ class BusinessPartner(Base, EventMixin):
     risk_score = Column(Integer, nullable=True, comment="0-100")
     risk_category = Column(String(20), nullable=True, comment="low, medium, high, critical")
     risk_assessment = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment="Detailed scoring breakdown and flags"
     )
@@ -359,6 +363,24 @@ class BusinessPartner(Base, EventMixin):
     updated_by = Column(UUID(as_uuid=True), nullable=True)
     updated_at = Column(DateTime(timezone=True), onupdate=datetime.utcnow, nullable=True)
     
+    # fillfactor 80 (room for HOT updates) is set by revision 2b5f7a9c0e13;
+    # SQLAlchemy has no table option for storage parameters.
+    __table_args__ = (
+        # Keyset pagination of partner listings: ORDER BY created_at DESC, id DESC
+        Index(
+            "ix_business_partners_created_at_id",
+            created_at.desc(),
+            id.desc(),
+            postgresql_where=text("is_deleted = false"),
+        ),
+        Index(
+            "idx_capabilities_gin",
+            "capabilities",
+            postgresql_using="gin",
+            postgresql_ops={"capabilities": "jsonb_path_ops"},
+        ),
+    )
+    
     # ============================================
     # RELATIONSHIPS
     # ============================================
@@ -389,7 +411,7 @@ class PartnerLocation(Base):
     
     __tablename__ = "partner_locations"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     partner_id = Column(UUID(as_uuid=True), ForeignKey("business_partners.id", ondelete="CASCADE"), nullable=False)
     
     location_type = Column(
@@ -441,7 +463,7 @@ class PartnerEmployee(Base, EventMixin):
     
     __tablename__ = "partner_employees"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     partner_id = Column(UUID(as_uuid=True), ForeignKey("business_partners.id", ondelete="CASCADE"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     # organization_id removed - partner employees belong to external partner, not our internal organization
@@ -455,7 +477,7 @@ class PartnerEmployee(Base, EventMixin):
     
     # Permissions
     permissions = Column(
-        JSON,
+        JSONB,
         nullable=True,
         comment='{"create_orders": true, "view_reports": true, "approve_contracts": false}'
     )
@@ -474,7 +496,7 @@ class PartnerDocument(Base):
     
     __tablename__ = "partner_documents"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     partner_id = Column(UUID(as_uuid=True), ForeignKey("business_partners.id", ondelete="CASCADE"), nullable=False)
     # organization_id removed - documents belong to external partner
     
@@ -486,13 +508,13 @@ class PartnerDocument(Base):
     document_subtype = Column(String(100), nullable=True)
     country = Column(String(100), nullable=False)
     
-    file_url = Column(String(1000), nullable=False)
+    file_url = Column(Text, nullable=False)
     file_name = Column(String(500))
     file_size = Column(Integer)
     mime_type = Column(String(100))
     
     # OCR extracted data
-    ocr_extracted_data = Column(JSON, nullable=True)
+    ocr_extracted_data = Column(JSONB, nullable=True)
     extraction_confidence = Column(Numeric(5, 2), nullable=True)
     
     # Validity
@@ -507,17 +529,27 @@ class PartnerDocument(Base):
     
     uploaded_at = Column(DateTime(timezone=True), server_default=text("NOW()"))
     
+    __table_args__ = (
+        # Insert-ordered timestamp: BRIN serves "uploaded in the last N days"
+        Index(
+            "ix_partner_documents_uploaded_at_brin",
+            "uploaded_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
+    
     partner = relationship("BusinessPartner", back_populates="documents")
 
 
-class PartnerVehicle(Base):
+class PartnerVehicle(Base, EventMixin):
     """
     Vehicles for transporters (lorry owners)
     """
     
     __tablename__ = "partner_vehicles"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     partner_id = Column(UUID(as_uuid=True), ForeignKey("business_partners.id", ondelete="CASCADE"), nullable=False)
     # organization_id removed - vehicles belong to external partner (transporter)
     
@@ -538,7 +570,7 @@ class PartnerVehicle(Base):
     
     # Verification
     verified_via_rto = Column(Boolean, default=False)
-    rto_data = Column(JSON, nullable=True, comment="Data from Parivahan/Vahan API")
+    rto_data = Column(JSONB, nullable=True, comment="Data from Parivahan/Vahan API")
     
     status = Column(String(20), default="active")
     created_at = Column(DateTime(timezone=True), server_default=text("NOW()"))
@@ -554,7 +586,7 @@ class PartnerOnboardingApplication(Base):
     
     __tablename__ = "partner_onboarding_applications"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     organization_id = Column(
         UUID(as_uuid=True),
@@ -569,8 +601,8 @@ class PartnerOnboardingApplication(Base):
     entity_class = Column(String(20), nullable=True, comment="business_entity or service_provider")
     capabilities = Column(JSON, nullable=True, comment="Trading capabilities from CDPS")
     
-    legal_name = Column(String(500), nullable=False)
-    trade_name = Column(String(500), nullable=True)
+    legal_name = Column(Text, nullable=False)
+    trade_name = Column(Text, nullable=True)
     country = Column(String(100), nullable=False)
     business_entity_type = Column(String(100), nullable=True)
     registration_date = Column(Date, nullable=True)
@@ -579,7 +611,11 @@ class PartnerOnboardingApplication(Base):
     tax_id_type = Column(String(20), nullable=True)
     tax_id_number = Column(String(50), nullable=True)
     tax_details = Column(JSON, nullable=True)
-    tax_verified = Column(Boolean, default=False)
+    # Generated from verification_results; never written by the application
+    tax_verified = Column(
+        Boolean,
+        Computed("COALESCE((verification_results->>'gst_verified')::boolean, false)", persisted=True)
+    )
     
     pan_number = Column(String(10), nullable=True)
     pan_name = Column(String(500), nullable=True)
@@ -641,7 +677,7 @@ class PartnerAmendment(Base):
     
     __tablename__ = "partner_amendments"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     partner_id = Column(UUID(as_uuid=True), ForeignKey("business_partners.id"), nullable=False)
     # organization_id removed - amendments track changes to external partner data
     
@@ -656,7 +692,7 @@ class PartnerAmendment(Base):
     new_value = Column(JSON)
     
     reason = Column(Text)
-    supporting_documents = Column(JSON, comment="Document IDs")
+    supporting_documents = Column(JSONB, comment="Document IDs")
     
     status = Column(String(20), default="pending", comment="pending, approved, rejected")
     
@@ -667,6 +703,15 @@ class PartnerAmendment(Base):
     approved_at = Column(DateTime(timezone=True), nullable=True)
     
     chat_transcript = Column(JSON, nullable=True)
+    
+    __table_args__ = (
+        Index(
+            "ix_partner_amendments_requested_at_brin",
+            "requested_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class PartnerKYCRenewal(Base):
@@ -676,7 +721,7 @@ class PartnerKYCRenewal(Base):
     
     __tablename__ = "partner_kyc_renewals"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     partner_id = Column(UUID(as_uuid=True), ForeignKey("business_partners.id"), nullable=False)
     # organization_id removed - KYC renewals for external partners
     
@@ -704,6 +749,15 @@ class PartnerKYCRenewal(Base):
     notes = Column(Text, nullable=True)
     
     created_at = Column(DateTime(timezone=True), server_default=text("NOW()"))
+    
+    __table_args__ = (
+        Index(
+            "ix_partner_kyc_renewals_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class PartnerBranch(Base, EventMixin):
@@ -758,7 +812,7 @@ class PartnerBranch(Base, EventMixin):
     __tablename__ = "partner_branches"
     
     # Primary key
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     
     # Foreign key
     partner_id = Column(
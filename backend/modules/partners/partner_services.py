@@ -16,18 +16,23 @@ Services:
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional
+from functools import partial
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 import redis.asyncio as redis
 
 from backend.core.events.emitter import EventEmitter
 from backend.core.resilience.circuit_breaker import api_circuit_breaker
 from backend.core.outbox import OutboxRepository
+from backend.db.async_session import run_after_commit
 from backend.modules.partners.enums import (
     AmendmentType,
     BusinessEntityType,
@@ -46,6 +51,7 @@ from backend.modules.partners.models import (
     PartnerOnboardingApplication,
     PartnerVehicle,
 )
+from backend.modules.partners.kyc_expiry_index import KYCExpiryIndex
 from backend.modules.partners.repositories import (
     BusinessPartnerRepository,
     OnboardingApplicationRepository,
@@ -64,6 +70,8 @@ from backend.modules.partners.schemas import (
     VerificationResult,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class GSTVerificationService:
     """
@@ -297,8 +305,8 @@ class DocumentProcessingService:
             Dict with extracted data
         """
         try:
-            # Use actual Tesseract OCR
-            extracted_data = self.ocr_service.extract_gst_certificate(file_bytes)
+            # Tesseract is CPU-bound and synchronous: keep it off the event loop
+            extracted_data = await asyncio.to_thread(self.ocr_service.extract_gst_certificate, file_bytes)
             
             logger.info(
                 f"GST OCR extraction: GSTIN={extracted_data.get('gstin', 'N/A')}, "
@@ -322,8 +330,8 @@ class DocumentProcessingService:
             Dict with extracted data
         """
         try:
-            # Use actual Tesseract OCR
-            extracted_data = self.ocr_service.extract_pan_card(file_bytes)
+            # Tesseract is CPU-bound and synchronous: keep it off the event loop
+            extracted_data = await asyncio.to_thread(self.ocr_service.extract_pan_card, file_bytes)
             
             logger.info(
                 f"PAN OCR extraction: PAN={extracted_data.get('pan', 'N/A')}, "
@@ -347,8 +355,8 @@ class DocumentProcessingService:
             Dict with extracted data
         """
         try:
-            # Use actual Tesseract OCR
-            extracted_data = self.ocr_service.extract_bank_proof(file_bytes)
+            # Tesseract is CPU-bound and synchronous: keep it off the event loop
+            extracted_data = await asyncio.to_thread(self.ocr_service.extract_bank_proof, file_bytes)
             
             logger.info(
                 f"Bank proof OCR extraction: IFSC={extracted_data.get('ifsc', 'N/A')}, "
@@ -372,8 +380,8 @@ class DocumentProcessingService:
             Dict with extracted data
         """
         try:
-            # Use actual Tesseract OCR
-            extracted_data = self.ocr_service.extract_vehicle_rc(file_bytes)
+            # Tesseract is CPU-bound and synchronous: keep it off the event loop
+            extracted_data = await asyncio.to_thread(self.ocr_service.extract_vehicle_rc, file_bytes)
             
             logger.info(
                 f"Vehicle RC OCR extraction: Reg={extracted_data.get('registration_number', 'N/A')}, "
@@ -658,8 +666,9 @@ class ApprovalService:
     async def process_approval(
         self,
         application_id: UUID,
-        risk_assessment: RiskAssessment,
         decision: ApprovalDecision,
+        risk_assessment: Optional[RiskAssessment] = None,
+        organization_id: Optional[UUID] = None,
         idempotency_key: Optional[str] = None
     ) -> BusinessPartner:
         """
@@ -667,8 +676,10 @@ class ApprovalService:
         
         Args:
             application_id: Application ID
-            risk_assessment: Risk assessment result
             decision: Approval decision
+            risk_assessment: Risk assessment result; for manual decisions this
+                is omitted and built from the score stored on the application
+            organization_id: Restrict the application lookup to this organization
             idempotency_key: Idempotency key for deduplication
         
         Returns:
@@ -680,11 +691,22 @@ class ApprovalService:
             if cached:
                 return json.loads(cached)
         
-        # Get application
-        application = await self.app_repo.get_by_id(application_id)
+        # Get application, locked so concurrent decisions on it are serialized
+        application = await self.app_repo.get_by_id(
+            application_id, organization_id, for_update=True
+        )
         if not application:
             raise ValueError("Application not found")
         
+        if risk_assessment is None:
+            # Only the fields used below; the score breakdown is not stored
+            risk_assessment = RiskAssessment.model_construct(
+                total_score=application.risk_score or 50,
+                category=application.risk_category,
+                flags=(application.risk_assessment or {}).get("flags", []),
+                approval_route="manual",
+            )
+        
         if decision.decision == "approve":
             # Use provided credit limit or default from risk assessment
             credit_limit = decision.credit_limit or risk_assessment.recommended_credit_limit
@@ -755,8 +777,14 @@ class ApprovalService:
                 idempotency_key=idempotency_key
             )
             
-            # Commit transaction
-            await self.db.commit()
+            # No commit here: the request's session dependency commits once
+            # the endpoint returns, together with any other writes it made.
+            # The Redis writes wait for that commit, so neither the expiry
+            # index nor a retry can see a partner that was rolled back.
+            
+            run_after_commit(self.db, partial(
+                KYCExpiryIndex(self.redis).record, partner.id, partner.kyc_expiry_date
+            ))
             
             # Cache result for idempotency
             if idempotency_key and self.redis:
@@ -765,11 +793,12 @@ class ApprovalService:
                     "legal_name": partner.legal_name,
                     "status": partner.status
                 }
-                await self.redis.setex(
+                run_after_commit(self.db, partial(
+                    self.redis.setex,
                     f"idempotency:{idempotency_key}",
                     86400,
                     json.dumps(partner_dict)
-                )
+                ))
             
             return partner
         elif decision.decision == "reject":
@@ -798,6 +827,8 @@ class ApprovalService:
                 idempotency_key=idempotency_key
             )
             
+            # Committed here because the rejection is reported by raising,
+            # which would otherwise roll the request's transaction back
             await self.db.commit()
             
             raise ValueError(f"Application rejected: {decision.notes}")
@@ -826,18 +857,45 @@ class KYCRenewalService:
         self.kyc_repo = PartnerKYCRenewalRepository(db)
         self.outbox_repo = OutboxRepository(db)
     
-    async def check_kyc_expiry(self, organization_id: UUID, days_threshold: int = 30) -> List[BusinessPartner]:
+    @classmethod
+    async def check_kyc_expiry(
+        cls,
+        db: AsyncSession,
+        organization_id: UUID,
+        days_threshold: int = 30,
+        redis_client: Optional[redis.Redis] = None
+    ) -> List[BusinessPartner]:
         """
         Get partners with KYC expiring soon.
         
+        A read-only lookup, so it needs no acting user; callers don't have
+        to construct the service with a placeholder user ID.
+        
         Args:
+            db: Database session
             organization_id: Organization ID
             days_threshold: Days before expiry
+            redis_client: Redis client for the KYC expiry index (optional)
         
         Returns:
             List of partners needing renewal
         """
-        return await self.bp_repo.get_expiring_kyc(organization_id, days_threshold)
+        bp_repo = BusinessPartnerRepository(db)
+        kyc_index = KYCExpiryIndex(redis_client)
+        partner_ids = await kyc_index.get_expiring_ids(days_threshold)
+        
+        if partner_ids is None:
+            # Index not built yet (or no Redis): answer from the database and seed it
+            if redis_client:
+                await kyc_index.seed(await bp_repo.get_kyc_expiry_dates())
+            return await bp_repo.get_expiring_kyc(organization_id, days_threshold)
+        
+        if not partner_ids:
+            return []
+        
+        return await bp_repo.get_expiring_kyc(
+            organization_id, days_threshold, partner_ids=partner_ids
+        )
     
     async def initiate_kyc_renewal(self, partner_id: UUID) -> PartnerKYCRenewal:
         """
@@ -899,6 +957,10 @@ class KYCRenewalService:
                 verification_passed=True
             )
             
+            run_after_commit(self.db, partial(
+                KYCExpiryIndex(self.redis).record, partner.id, partner.kyc_expiry_date
+            ))
+            
             return partner
         else:
             # Failed verification
@@ -917,8 +979,36 @@ class KYCRenewalService:
                 status=PartnerStatus.SUSPENDED,
                 updated_by=self.current_user_id
             )
+            run_after_commit(self.db, partial(KYCExpiryIndex(self.redis).remove, renewal.business_partner_id))
             
             raise ValueError("KYC verification failed")
+    
+    async def complete_kyc_renewals(
+        self,
+        completions: List[Tuple[UUID, List[UUID]]]
+    ) -> List[UUID]:
+        """
+        Complete several verified KYC renewals at once.
+        
+        Renewals and partners are updated in a single statement (see
+        PartnerKYCRenewalRepository.complete_many) instead of one
+        complete_kyc_renewal round trip per partner. Failed verifications
+        still go through complete_kyc_renewal one by one.
+        
+        Args:
+            completions: (renewal_id, new document IDs) pairs
+        
+        Returns:
+            IDs of the partners whose KYC was extended; renewals that were
+            not found or are no longer pending are skipped
+        """
+        if not completions:
+            return []
+        
+        renewed = await self.kyc_repo.complete_many(completions, self.current_user_id)
+        run_after_commit(self.db, partial(KYCExpiryIndex(self.redis).record_many, renewed))
+        
+        return [partner_id for partner_id, _ in renewed]
 
 
 class PartnerService:
@@ -984,6 +1074,25 @@ class PartnerService:
         Returns:
             OnboardingApplication
         """
+        # Steps 1 and 2 are independent external calls (neither uses the
+        # session), so they run concurrently; a failure in either falls back
+        # to the submitted data as before
+        async def verify_gst() -> Optional[GSTVerificationResult]:
+            if not data.tax_id_number:
+                return None
+            return await self.gst_service.verify_gstin(data.tax_id_number)
+        
+        gst_result, location_result = await asyncio.gather(
+            verify_gst(),
+            self.geocoding_service.geocode_address(
+                data.primary_address,
+                data.primary_city,
+                data.primary_state,
+                data.primary_postal_code
+            ),
+            return_exceptions=True
+        )
+        
         # Step 1: Verify GST if tax_id_number provided
         gst_verified = False
         gst_verification_data = None
@@ -992,38 +1101,29 @@ class PartnerService:
         entity_type = data.business_entity_type
         registration_date = data.registration_date
         
-        if data.tax_id_number:
-            try:
-                gst_result = await self.gst_service.verify_gstin(data.tax_id_number)
-                if gst_result.verified:
-                    gst_verified = True
-                    legal_name = gst_result.legal_name
-                    trade_name = gst_result.trade_name or data.trade_name
-                    entity_type = gst_result.entity_type
-                    registration_date = gst_result.registration_date
-                    gst_verification_data = gst_result.dict()
-            except Exception as e:
-                # Continue with manual data if GST verification fails
-                pass
+        if isinstance(gst_result, GSTVerificationResult) and gst_result.verified:
+            gst_verified = True
+            legal_name = gst_result.legal_name
+            trade_name = gst_result.trade_name or data.trade_name
+            entity_type = gst_result.entity_type
+            registration_date = gst_result.registration_date
+            gst_verification_data = gst_result.dict()
+        elif isinstance(gst_result, Exception):
+            # Continue with manual data if GST verification fails
+            logger.warning(f"GST verification failed during onboarding: {gst_result}")
         
         # Step 2: Geocode location (auto-verify if confidence >90%)
         location_verified = False
         latitude = data.primary_latitude
         longitude = data.primary_longitude
         
-        try:
-            location_result = await self.geocoding_service.geocode_address(
-                data.primary_address,
-                data.primary_city,
-                data.primary_state,
-                data.primary_postal_code
-            )
+        if isinstance(location_result, Exception):
+            # Continue with manual coordinates if geocoding fails
+            logger.warning(f"Geocoding failed during onboarding: {location_result}")
+        else:
             location_verified = location_result.get("confidence", 0) > 0.90
             latitude = location_result.get("latitude")
             longitude = location_result.get("longitude")
-        except Exception as e:
-            # Continue with manual coordinates if geocoding fails
-            pass
         
         # Step 3: Create application
         application = await self.app_repo.create(
@@ -1041,7 +1141,6 @@ class PartnerService:
             tax_id_type=data.tax_id_type,
             tax_id_number=data.tax_id_number,
             tax_details=data.tax_details,
-            tax_verified=gst_verified,
             pan_number=data.pan_number,
             pan_name=data.pan_name,
             pan_verified=False,
@@ -1250,11 +1349,11 @@ class PartnerService:
         if risk_assessment.approval_route == "auto":
             partner = await self.approval_service.process_approval(
                 application_id,
-                risk_assessment,
                 ApprovalDecision(
                     decision="approve",
                     notes="Auto-approved based on low risk score"
-                )
+                ),
+                risk_assessment=risk_assessment
             )
             
             return {
@@ -1291,15 +1390,14 @@ class PartnerService:
         # Create document
         document = await self.document_repo.create(
             partner_id=application.id,
-            organization_id=self.organization_id,
             document_type=document_type,
+            country=application.primary_country,
             file_url=file_url,
             file_name=file_name,
             file_size=file_size,
             mime_type=mime_type,
             ocr_extracted_data=extracted_data,
-            ocr_confidence=extracted_data.get("confidence", 0),
-            uploaded_by=self.current_user_id
+            extraction_confidence=extracted_data.get("confidence", 0)
         )
         
         # Emit event
@@ -1314,7 +1412,6 @@ class PartnerService:
         )
         await document.flush_events(self.db)
         
-        await self.db.commit()
         return document
     
     async def add_location(
@@ -1367,7 +1464,6 @@ class PartnerService:
         )
         await location.flush_events(self.db)
         
-        await self.db.commit()
         return location
     
     async def invite_employee(
@@ -1385,7 +1481,6 @@ class PartnerService:
         # Create employee invitation
         employee = await self.employee_repo.create(
             partner_id=partner_id,
-            organization_id=partner.organization_id,
             user_id=self.current_user_id,
             employee_name=employee_data.get('employee_name'),
             employee_email=employee_data.get('employee_email'),
@@ -1408,7 +1503,6 @@ class PartnerService:
         )
         await employee.flush_events(self.db)
         
-        await self.db.commit()
         return employee
     
     async def add_vehicle(
@@ -1463,9 +1557,100 @@ class PartnerService:
         )
         await vehicle.flush_events(self.db)
         
-        await self.db.commit()
         return vehicle
     
+    async def invite_employees(
+        self,
+        partner_id: UUID,
+        employees_data: List[Dict]
+    ) -> List[PartnerEmployee]:
+        """
+        Invite several employees to a partner account with one INSERT.
+        
+        Duplicate requests are handled by IdempotencyMiddleware (Idempotency-Key).
+        """
+        # Partner and its current employee count in one round trip
+        partner, existing_count = await self.bp_repo.get_with_employee_count(partner_id)
+        if not partner:
+            raise ValueError("Partner not found")
+        
+        # Check the whole batch against the employee cap
+        if partner.max_employees_allowed is not None:
+            if existing_count + len(employees_data) > partner.max_employees_allowed:
+                raise ValueError(
+                    f"Partner allows {partner.max_employees_allowed} employees "
+                    f"({existing_count} existing, {len(employees_data)} requested)"
+                )
+        
+        # Create employee invitations
+        employees = await self.employee_repo.create_many([
+            {
+                "partner_id": partner_id,
+                "user_id": self.current_user_id,
+                "employee_name": employee_data.get('employee_name'),
+                "employee_email": employee_data.get('employee_email'),
+                "employee_phone": employee_data.get('employee_phone'),
+                "designation": employee_data.get('designation'),
+                "role": "employee",
+                "status": "invited",
+                "permissions": employee_data.get('permissions', {}),
+            }
+            for employee_data in employees_data
+        ])
+        
+        # Emit events
+        for employee in employees:
+            employee.emit_event(
+                event_type="partner.employee.invited",
+                user_id=self.current_user_id,
+                data={
+                    "employee_id": str(employee.id),
+                    "partner_id": str(partner_id),
+                    "employee_email": employee.employee_email
+                }
+            )
+            await employee.flush_events(self.db)
+        
+        return employees
+    
+    async def add_vehicles(
+        self,
+        partner_id: UUID,
+        vehicles_data: List[Dict]
+    ) -> List[PartnerVehicle]:
+        """
+        Add several vehicles to a transporter partner with one INSERT.
+        
+        Duplicate requests are handled by IdempotencyMiddleware (Idempotency-Key).
+        """
+        # Get partner
+        partner = await self.bp_repo.get_by_id(partner_id)
+        if not partner:
+            raise ValueError("Partner not found")
+        
+        if partner.entity_class != "service_provider":
+            raise ValueError("Only service provider partners can add vehicles")
+        
+        vehicles = await self.vehicle_repo.create_many([
+            {**vehicle_data, "partner_id": partner_id, "status": "active"}
+            for vehicle_data in vehicles_data
+        ])
+        
+        # Emit events
+        for vehicle in vehicles:
+            vehicle.emit_event(
+                event_type="partner.vehicle.added",
+                user_id=self.current_user_id,
+                data={
+                    "vehicle_id": str(vehicle.id),
+                    "partner_id": str(partner_id),
+                    "registration_number": vehicle.vehicle_number
+                }
+            )
+            await vehicle.flush_events(self.db)
+        
+        return vehicles
+    
     # Methods for router refactoring - clean architecture
     async def get_application_by_id(self, application_id: UUID) -> Optional[PartnerOnboardingApplication]:
         """Get onboarding application by ID"""
@@ -1475,24 +1660,53 @@ class PartnerService:
         """Get partner by ID"""
         return await self.bp_repo.get_by_id(partner_id, self.organization_id)
     
+    async def get_partner_full(self, partner_id: UUID) -> Optional[BusinessPartner]:
+        """Get partner by ID with locations, employees, documents and vehicles"""
+        return await self.bp_repo.get_full(partner_id, self.organization_id)
+    
     async def list_all_partners(
         self,
         skip: int = 0,
         limit: int = 100,
-        partner_type: Optional[PartnerType] = None,
+        entity_class: Optional[str] = None,
         status: Optional[PartnerStatus] = None,
         kyc_status: Optional[KYCStatus] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        after: Optional[str] = None
     ) -> List[BusinessPartner]:
-        """List all partners with filters"""
+        """List all partners with filters (after: keyset cursor from the previous page)"""
         return await self.bp_repo.list_all(
             organization_id=self.organization_id,
             skip=skip,
             limit=limit,
-            partner_type=partner_type,
+            entity_class=entity_class,
             status=status,
             kyc_status=kyc_status,
-            search=search
+            search=search,
+            after=after
+        )
+    
+    async def list_partner_rows(
+        self,
+        columns: Tuple[str, ...],
+        skip: int = 0,
+        limit: int = 100,
+        entity_class: Optional[str] = None,
+        status: Optional[PartnerStatus] = None,
+        kyc_status: Optional[KYCStatus] = None,
+        search: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Row]:
+        """List partners as plain rows of the given columns (no ORM objects)"""
+        return await self.bp_repo.list_rows(
+            columns=columns,
+            skip=skip,
+            limit=limit,
+            entity_class=entity_class,
+            status=status,
+            kyc_status=kyc_status,
+            search=search,
+            after=after
         )
     
     async def get_partner_locations(self, partner_id: UUID) -> List[PartnerLocation]:
@@ -1533,7 +1747,7 @@ class PartnerService:
     
     async def search_partners_advanced(
         self,
-        partner_type: Optional[PartnerType] = None,
+        entity_class: Optional[str] = None,
         status: Optional[PartnerStatus] = None,
         kyc_status: Optional[KYCStatus] = None,
         kyc_expiring_days: Optional[int] = None,
@@ -1548,75 +1762,22 @@ class PartnerService:
         limit: int = 50
     ) -> Dict:
         """Advanced partner search with filters, sorting, and pagination"""
-        from sqlalchemy import select, func, or_, and_, desc, asc
-        from datetime import timedelta
-        from backend.modules.partners.models import BusinessPartner
-        
-        # Base query
-        query = select(BusinessPartner).where(
-            BusinessPartner.organization_id == self.organization_id,
-            BusinessPartner.is_deleted == False
+        partners, total = await self.bp_repo.search_advanced(
+            entity_class=entity_class,
+            status=status,
+            kyc_status=kyc_status,
+            kyc_expiring_days=kyc_expiring_days,
+            risk_category=risk_category,
+            state=state,
+            date_from=datetime.fromisoformat(date_from) if date_from else None,
+            date_to=datetime.fromisoformat(date_to) if date_to else None,
+            search=search,
+            sort_by=sort_by,
+            sort_order=sort_order,
+            skip=skip,
+            limit=limit
         )
         
-        # Apply filters
-        if partner_type:
-            query = query.where(BusinessPartner.partner_type == partner_type)
-        
-        if status:
-            query = query.where(BusinessPartner.status == status)
-        
-        if kyc_status:
-            query = query.where(BusinessPartner.kyc_status == kyc_status)
-        
-        if kyc_expiring_days:
-            expiry_threshold = datetime.utcnow() + timedelta(days=kyc_expiring_days)
-            query = query.where(
-                and_(
-                    BusinessPartner.kyc_expiry_date <= expiry_threshold,
-                    BusinessPartner.kyc_expiry_date >= datetime.utcnow()
-                )
-            )
-        
-        if risk_category:
-            query = query.where(BusinessPartner.risk_category == risk_category)
-        
-        if state:
-            query = query.where(BusinessPartner.primary_state == state)
-        
-        if date_from:
-            query = query.where(BusinessPartner.created_at >= datetime.fromisoformat(date_from))
-        
-        if date_to:
-            query = query.where(BusinessPartner.created_at <= datetime.fromisoformat(date_to))
-        
-        if search:
-            search_pattern = f"%{search}%"
-            query = query.where(
-                or_(
-                    BusinessPartner.legal_business_name.ilike(search_pattern),
-                    BusinessPartner.trade_name.ilike(search_pattern),
-                    BusinessPartner.tax_id_number.ilike(search_pattern),
-                    BusinessPartner.pan_number.ilike(search_pattern)
-                )
-            )
-        
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total = await self.db.scalar(count_query)
-        
-        # Apply sorting
-        if sort_order == "desc":
-            query = query.order_by(desc(getattr(BusinessPartner, sort_by)))
-        else:
-            query = query.order_by(asc(getattr(BusinessPartner, sort_by)))
-        
-        # Apply pagination
-        query = query.offset(skip).limit(limit)
-        
-        # Execute
-        result = await self.db.execute(query)
-        partners = result.scalars().all()
-        
         return {
             "total": total,
             "skip": skip,
@@ -17,12 +17,16 @@ NOTE: These DO NOT extend BaseRepository because:
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import List, Optional
+import base64
+import json
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, or_, select, case
+from sqlalchemy import Row, Select, String, and_, bindparam, or_, select, case, func, insert, literal_column, text, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from backend.core.security.context import (
     get_current_business_partner_id,
@@ -43,6 +47,151 @@ from backend.modules.partners.models import (
 from backend.modules.partners.enums import PartnerStatus, KYCStatus
 
 
+# Completes a batch of verified KYC renewals and extends their partners' KYC
+# by a year in one statement: the renewals are matched against the unnested
+# (id, documents) arrays, and the partner update reads the CTE's RETURNING.
+# Only pending renewals are completed, so a retried batch extends nothing twice.
+_COMPLETE_KYC_RENEWALS = text("""
+    WITH completed AS (
+        UPDATE partner_kyc_renewals AS r
+        SET status = 'completed',
+            renewal_completed_at = now(),
+            completed_by = :completed_by,
+            documents_verified = v.document_ids
+        FROM unnest(CAST(:renewal_ids AS uuid[]), CAST(:document_ids AS json[]))
+            AS v(renewal_id, document_ids)
+        WHERE r.id = v.renewal_id
+          AND r.status = 'pending'
+        RETURNING r.partner_id
+    )
+    UPDATE business_partners AS bp
+    SET kyc_status = :verified,
+        kyc_verified_at = now(),
+        kyc_expiry_date = (now() + interval '365 days')::date,
+        updated_by = :completed_by,
+        updated_at = now()
+    FROM completed
+    WHERE bp.id = completed.partner_id
+    RETURNING bp.id, bp.kyc_expiry_date
+""")
+
+
+def encode_partner_cursor(partner: BusinessPartner) -> str:
+    """Opaque cursor for the page after this partner (or list_rows row) in list_all order"""
+    raw = json.dumps([partner.created_at.isoformat(), str(partner.id)])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_partner_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor from encode_partner_cursor; raises ValueError if malformed"""
+    try:
+        created_at, partner_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(created_at), UUID(partner_id)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
+
+def _partner_search_document():
+    """
+    Searchable text of a partner: names, tax ID and PAN in one string.
+    
+    Must stay identical to the expression of ix_business_partners_search_trgm
+    (pg_trgm GIN) for the planner to use that index; the separators are SQL
+    literals rather than bind parameters for the same reason.
+    """
+    sep = literal_column("' '", String)
+    empty = literal_column("''", String)
+    return (
+        BusinessPartner.legal_name
+        .concat(sep).concat(func.coalesce(BusinessPartner.trade_name, empty))
+        .concat(sep).concat(func.coalesce(BusinessPartner.tax_id_number, empty))
+        .concat(sep).concat(func.coalesce(BusinessPartner.pan_number, empty))
+    )
+
+
+def partner_search_filter(search: str):
+    """
+    Substring or fuzzy (trigram word similarity) match on name/tax ID/PAN.
+    
+    Both operators are served by the trigram index, so search no longer
+    scans every partner row.
+    
+    search may be a string or a bindparam (for statements built once).
+    """
+    document = _partner_search_document().self_group()
+    return or_(
+        document.ilike("%" + search + "%"),
+        document.op("%>")(search),
+    )
+
+
+# Hot-path statements are built once, on first use (after all mappers are
+# defined), and executed with bound values. Reusing the same Select skips
+# rebuilding it and lets SQLAlchemy reuse its memoized cache key and
+# compiled SQL.
+
+@lru_cache(maxsize=None)
+def _partner_by_id_stmt() -> Select:
+    return select(BusinessPartner).where(
+        BusinessPartner.id == bindparam("partner_id"),
+        BusinessPartner.is_deleted == False
+    )
+
+
+@lru_cache(maxsize=None)
+def _partner_full_stmt() -> Select:
+    return _partner_by_id_stmt().options(
+        selectinload(BusinessPartner.locations.and_(PartnerLocation.is_deleted == False)),
+        selectinload(BusinessPartner.employees),
+        selectinload(BusinessPartner.documents),
+        selectinload(BusinessPartner.vehicles),
+    )
+
+
+@lru_cache(maxsize=None)
+def _partner_list_stmt(
+    entity_class: bool,
+    status: bool,
+    kyc_status: bool,
+    search: bool,
+    after: bool,
+    skip: bool,
+    columns: Optional[Tuple[str, ...]] = None
+) -> Select:
+    """list_all/list_rows statement for one combination of present filters"""
+    if columns:
+        query = select(*(BusinessPartner.__table__.c[name] for name in columns))
+    else:
+        query = select(BusinessPartner)
+    query = query.where(BusinessPartner.is_deleted == False)
+    
+    if entity_class:
+        query = query.where(BusinessPartner.entity_class == bindparam("entity_class"))
+    if status:
+        query = query.where(BusinessPartner.status == bindparam("status"))
+    if kyc_status:
+        query = query.where(BusinessPartner.kyc_status == bindparam("kyc_status"))
+    if search:
+        query = query.where(partner_search_filter(bindparam("search", type_=String)))
+    
+    # Keyset pagination: seek past the previous page's last row via
+    # ix_business_partners_created_at_id instead of scanning OFFSET rows
+    if after:
+        query = query.where(
+            tuple_(BusinessPartner.created_at, BusinessPartner.id)
+            < tuple_(
+                bindparam("after_created_at", type_=BusinessPartner.created_at.type),
+                bindparam("after_id", type_=BusinessPartner.id.type),
+            )
+        )
+    
+    # id breaks created_at ties so pages never overlap
+    query = query.order_by(BusinessPartner.created_at.desc(), BusinessPartner.id.desc())
+    if skip:
+        query = query.offset(bindparam("skip"))
+    return query.limit(bindparam("limit"))
+
+
 class BusinessPartnerRepository:
     """
     Repository for BusinessPartner entity.
@@ -113,20 +262,65 @@ class BusinessPartnerRepository:
         Returns:
             BusinessPartner or None
         """
-        query = select(BusinessPartner).where(
-            and_(
-                BusinessPartner.id == partner_id,
-                BusinessPartner.is_deleted == False
-            )
-        )
+        result = await self.db.execute(_partner_by_id_stmt(), {"partner_id": partner_id})
+        return result.scalar_one_or_none()
+    
+    async def get_full(
+        self,
+        partner_id: UUID,
+        organization_id: Optional[UUID] = None
+    ) -> Optional[BusinessPartner]:
+        """
+        Get business partner with locations, employees, documents and vehicles loaded.
         
-        # Apply organization filter if provided
-        if organization_id:
-            query = query
+        Each collection is loaded with one SELECT ... WHERE partner_id IN (...)
+        on the same connection, so the full view is one request instead of
+        one per collection endpoint.
         
-        result = await self.db.execute(query)
+        Args:
+            partner_id: Partner ID
+            organization_id: Organization ID for isolation (if external user)
+        
+        Returns:
+            BusinessPartner or None
+        """
+        result = await self.db.execute(_partner_full_stmt(), {"partner_id": partner_id})
         return result.scalar_one_or_none()
     
+    async def get_with_employee_count(
+        self,
+        partner_id: UUID
+    ) -> Tuple[Optional[BusinessPartner], int]:
+        """
+        Get business partner and its employee count (excluding deleted) in one query.
+        
+        Args:
+            partner_id: Partner ID
+        
+        Returns:
+            (BusinessPartner or None, employee count)
+        """
+        employee_count = (
+            select(func.count()).select_from(PartnerEmployee).where(
+                and_(
+                    PartnerEmployee.partner_id == BusinessPartner.id,
+                    PartnerEmployee.status != "deleted"
+                )
+            ).scalar_subquery()
+        )
+        result = await self.db.execute(
+            select(BusinessPartner, employee_count).where(
+                and_(
+                    BusinessPartner.id == partner_id,
+                    BusinessPartner.is_deleted == False
+                )
+            )
+        )
+        row = result.first()
+        if row is None:
+            return None, 0
+        return row[0], row[1]
+    
     async def get_by_tax_id(
         self,
         tax_id: str,
@@ -187,57 +381,96 @@ class BusinessPartnerRepository:
         entity_class: Optional[str] = None,
         status: Optional[PartnerStatus] = None,
         kyc_status: Optional[KYCStatus] = None,
-        search: Optional[str] = None
+        search: Optional[str] = None,
+        after: Optional[str] = None
     ) -> List[BusinessPartner]:
         """
-        List business partners with filters.
+        List business partners with filters, newest first.
         
         Args:
             organization_id: Organization ID for isolation
-            skip: Pagination offset
+            skip: Pagination offset (deprecated: cost grows with the offset, use after)
             limit: Pagination limit
+            after: Cursor from encode_partner_cursor(last partner of the previous page)
             entity_class: Filter by entity class
             status: Filter by status
             kyc_status: Filter by KYC status
-            search: Search in name/tax_id
+            search: Search in name/tax_id/PAN (substring or fuzzy)
         
         Returns:
             List of BusinessPartner
         """
-        query = select(BusinessPartner).where(
-            BusinessPartner.is_deleted == False
-        )
+        query, params = self._list_query(skip, limit, entity_class, status, kyc_status, search, after)
+        result = await self.db.execute(query, params)
+        return list(result.scalars().all())
+    
+    async def list_rows(
+        self,
+        columns: Tuple[str, ...],
+        skip: int = 0,
+        limit: int = 100,
+        entity_class: Optional[str] = None,
+        status: Optional[PartnerStatus] = None,
+        kyc_status: Optional[KYCStatus] = None,
+        search: Optional[str] = None,
+        after: Optional[str] = None
+    ) -> List[Row]:
+        """
+        Same listing as list_all, as plain rows of the given columns.
         
-        # Apply filters
-        if entity_class:
-            query = query.where(BusinessPartner.entity_class == entity_class)
+        No ORM objects are built or tracked in the session, which makes this
+        much cheaper for read-only listings that are serialized straight away.
+        Rows support attribute access, so encode_partner_cursor accepts them
+        when columns include created_at and id.
         
-        if status:
-            query = query.where(BusinessPartner.status == status)
+        Args:
+            columns: business_partners column names to select
+            (others as for list_all)
         
+        Returns:
+            List of Row
+        """
+        query, params = self._list_query(skip, limit, entity_class, status, kyc_status, search, after, columns)
+        result = await self.db.execute(query, params)
+        return list(result.all())
+    
+    def _list_query(
+        self,
+        skip: int,
+        limit: int,
+        entity_class: Optional[str],
+        status: Optional[PartnerStatus],
+        kyc_status: Optional[KYCStatus],
+        search: Optional[str],
+        after: Optional[str],
+        columns: Optional[Tuple[str, ...]] = None
+    ) -> Tuple[Select, dict]:
+        """Prebuilt statement and bound values for a listing"""
+        params = {"limit": limit}
+        if entity_class:
+            params["entity_class"] = entity_class
+        if status:
+            params["status"] = status
         if kyc_status:
-            query = query.where(BusinessPartner.kyc_status == kyc_status)
-        
+            params["kyc_status"] = kyc_status
         if search:
-            search_pattern = f"%{search}%"
-            query = query.where(
-                or_(
-                    BusinessPartner.legal_name.ilike(search_pattern),
-                    BusinessPartner.trade_name.ilike(search_pattern),
-                    BusinessPartner.tax_id_number.ilike(search_pattern)
-                )
-            )
-        
-        # Order and paginate
-        query = query.order_by(BusinessPartner.created_at.desc()).offset(skip).limit(limit)
-        
-        result = await self.db.execute(query)
-        return list(result.scalars().all())
+            params["search"] = search
+        if after:
+            params["after_created_at"], params["after_id"] = decode_partner_cursor(after)
+        if skip:
+            params["skip"] = skip
+        
+        query = _partner_list_stmt(
+            bool(entity_class), bool(status), bool(kyc_status), bool(search), bool(after), bool(skip),
+            columns
+        )
+        return query, params
     
     async def get_expiring_kyc(
         self,
         organization_id: UUID,
-        days_threshold: int = 30
+        days_threshold: int = 30,
+        partner_ids: Optional[List[UUID]] = None
     ) -> List[BusinessPartner]:
         """
         Get partners with KYC expiring soon.
@@ -245,6 +478,8 @@ class BusinessPartnerRepository:
         Args:
             organization_id: Organization ID
             days_threshold: Days before expiry to consider
+            partner_ids: Candidate IDs (e.g. from the KYC expiry index); the
+                expiry filters are still applied, so stale candidates drop out
         
         Returns:
             List of partners with expiring KYC
@@ -262,9 +497,25 @@ class BusinessPartnerRepository:
             )
         ).order_by(BusinessPartner.kyc_expiry_date)
         
+        if partner_ids is not None:
+            query = query.where(BusinessPartner.id.in_(partner_ids))
+        
         result = await self.db.execute(query)
         return list(result.scalars().all())
     
+    async def get_kyc_expiry_dates(self) -> List[tuple]:
+        """Get (id, kyc_expiry_date) of every KYC-verified partner, for seeding the expiry index"""
+        result = await self.db.execute(
+            select(BusinessPartner.id, BusinessPartner.kyc_expiry_date).where(
+                and_(
+                    BusinessPartner.is_deleted == False,
+                    BusinessPartner.kyc_status == KYCStatus.VERIFIED,
+                    BusinessPartner.kyc_expiry_date.isnot(None)
+                )
+            )
+        )
+        return [tuple(row) for row in result.all()]
+    
     async def update(self, partner_id: UUID, **kwargs) -> Optional[BusinessPartner]:
         """Update business partner"""
         partner = await self.get_by_id(partner_id)
@@ -329,6 +580,79 @@ class BusinessPartnerRepository:
             limit=limit,
             search=search_term
         )
+    
+    async def search_advanced(
+        self,
+        entity_class: Optional[str] = None,
+        status: Optional[PartnerStatus] = None,
+        kyc_status: Optional[KYCStatus] = None,
+        kyc_expiring_days: Optional[int] = None,
+        risk_category: Optional[str] = None,
+        state: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        search: Optional[str] = None,
+        sort_by: str = "created_at",
+        sort_order: str = "desc",
+        skip: int = 0,
+        limit: int = 50
+    ) -> Tuple[List[BusinessPartner], int]:
+        """
+        Filtered, sorted page of partners plus the total match count.
+        
+        Every filter combination compiles into one statement; the total is
+        a COUNT(*) OVER () window on the page rows rather than a second
+        query over the same filters.
+        
+        Returns:
+            (partners, total)
+        """
+        conditions = [BusinessPartner.is_deleted == False]
+        
+        if entity_class:
+            conditions.append(BusinessPartner.entity_class == entity_class)
+        if status:
+            conditions.append(BusinessPartner.status == status)
+        if kyc_status:
+            conditions.append(BusinessPartner.kyc_status == kyc_status)
+        if kyc_expiring_days:
+            now = datetime.utcnow()
+            conditions.append(
+                BusinessPartner.kyc_expiry_date.between(now, now + timedelta(days=kyc_expiring_days))
+            )
+        if risk_category:
+            conditions.append(BusinessPartner.risk_category == risk_category)
+        if state:
+            conditions.append(BusinessPartner.primary_state == state)
+        if date_from:
+            conditions.append(BusinessPartner.created_at >= date_from)
+        if date_to:
+            conditions.append(BusinessPartner.created_at <= date_to)
+        if search:
+            conditions.append(partner_search_filter(search))
+        
+        if sort_by not in BusinessPartner.__table__.c:
+            raise ValueError(f"Cannot sort by {sort_by}")
+        sort_column = BusinessPartner.__table__.c[sort_by]
+        query = (
+            select(BusinessPartner, func.count().over().label("total"))
+            .where(*conditions)
+            .order_by(sort_column.desc() if sort_order == "desc" else sort_column.asc())
+            .offset(skip)
+            .limit(limit)
+        )
+        
+        rows = (await self.db.execute(query)).all()
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        
+        if not skip:
+            return [], 0
+        # Paged past the end: the window had no rows to report the total on
+        total = await self.db.scalar(
+            select(func.count()).select_from(BusinessPartner).where(*conditions)
+        )
+        return [], total
 
 
 class PartnerLocationRepository:
@@ -371,11 +695,9 @@ class PartnerLocationRepository:
         return query
     
     async def create(self, **kwargs) -> PartnerLocation:
-        """Create a new partner location"""
-        location = PartnerLocation(**kwargs)
-        self.db.add(location)
-        await self.db.flush()
-        return location
+        """Create a new partner location (INSERT ... RETURNING, one round trip)"""
+        result = await self.db.execute(insert(PartnerLocation).values(**kwargs).returning(PartnerLocation))
+        return result.scalar_one()
     
     async def get_by_id(self, location_id: UUID) -> Optional[PartnerLocation]:
         """Get location by ID with isolation"""
@@ -478,11 +800,17 @@ class PartnerEmployeeRepository:
         return query
     
     async def create(self, **kwargs) -> PartnerEmployee:
-        """Create a new partner employee"""
-        employee = PartnerEmployee(**kwargs)
-        self.db.add(employee)
-        await self.db.flush()
-        return employee
+        """Create a new partner employee (INSERT ... RETURNING, one round trip)"""
+        result = await self.db.execute(insert(PartnerEmployee).values(**kwargs).returning(PartnerEmployee))
+        return result.scalar_one()
+    
+    async def create_many(self, rows: List[dict]) -> List[PartnerEmployee]:
+        """Create several partner employees with one batched INSERT, returned in row order"""
+        result = await self.db.execute(
+            insert(PartnerEmployee).returning(PartnerEmployee, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result.scalars().all())
     
     async def get_by_id(self, employee_id: UUID) -> Optional[PartnerEmployee]:
         """Get employee by ID"""
@@ -632,11 +960,17 @@ class PartnerDocumentRepository:
         return query
     
     async def create(self, **kwargs) -> PartnerDocument:
-        """Create a new partner document"""
-        document = PartnerDocument(**kwargs)
-        self.db.add(document)
-        await self.db.flush()
-        return document
+        """Create a new partner document (INSERT ... RETURNING, one round trip)"""
+        result = await self.db.execute(insert(PartnerDocument).values(**kwargs).returning(PartnerDocument))
+        return result.scalar_one()
+    
+    async def create_many(self, rows: List[dict]) -> List[UUID]:
+        """Create several partner documents with one batched INSERT, returning their IDs in row order"""
+        result = await self.db.execute(
+            insert(PartnerDocument).returning(PartnerDocument.id, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result.scalars().all())
     
     async def get_by_id(self, document_id: UUID) -> Optional[PartnerDocument]:
         """Get document by ID"""
@@ -727,11 +1061,17 @@ class PartnerVehicleRepository:
         return query
     
     async def create(self, **kwargs) -> PartnerVehicle:
-        """Create a new partner vehicle"""
-        vehicle = PartnerVehicle(**kwargs)
-        self.db.add(vehicle)
-        await self.db.flush()
-        return vehicle
+        """Create a new partner vehicle (INSERT ... RETURNING, one round trip)"""
+        result = await self.db.execute(insert(PartnerVehicle).values(**kwargs).returning(PartnerVehicle))
+        return result.scalar_one()
+    
+    async def create_many(self, rows: List[dict]) -> List[PartnerVehicle]:
+        """Create several partner vehicles with one batched INSERT, returned in row order"""
+        result = await self.db.execute(
+            insert(PartnerVehicle).returning(PartnerVehicle, sort_by_parameter_order=True),
+            rows
+        )
+        return list(result.scalars().all())
     
     async def get_by_id(self, vehicle_id: UUID) -> Optional[PartnerVehicle]:
         """Get vehicle by ID"""
@@ -820,9 +1160,10 @@ class OnboardingApplicationRepository:
     async def get_by_id(
         self,
         application_id: UUID,
-        organization_id: Optional[UUID] = None
+        organization_id: Optional[UUID] = None,
+        for_update: bool = False
     ) -> Optional[PartnerOnboardingApplication]:
-        """Get application by ID"""
+        """Get application by ID (for_update locks the row until the transaction ends)"""
         query = select(PartnerOnboardingApplication).where(
             PartnerOnboardingApplication.id == application_id
         )
@@ -832,6 +1173,9 @@ class OnboardingApplicationRepository:
                 PartnerOnboardingApplication.organization_id == organization_id
             )
         
+        if for_update:
+            query = query.with_for_update()
+        
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
     
@@ -957,6 +1301,36 @@ class PartnerKYCRenewalRepository:
         )
         return result.scalar_one_or_none()
     
+    async def complete_many(
+        self,
+        completions: List[Tuple[UUID, List[UUID]]],
+        completed_by: UUID
+    ) -> List[Tuple[UUID, date]]:
+        """
+        Complete verified renewals and extend their partners' KYC, in one statement.
+        
+        Args:
+            completions: (renewal_id, verified document IDs) pairs
+            completed_by: User completing the renewals
+        
+        Returns:
+            (partner_id, new kyc_expiry_date) for each updated partner;
+            renewals that are not pending are left as they are
+        """
+        result = await self.db.execute(
+            _COMPLETE_KYC_RENEWALS,
+            {
+                "renewal_ids": [renewal_id for renewal_id, _ in completions],
+                "document_ids": [
+                    json.dumps([str(document_id) for document_id in document_ids])
+                    for _, document_ids in completions
+                ],
+                "completed_by": completed_by,
+                "verified": KYCStatus.VERIFIED.value,
+            }
+        )
+        return [tuple(row) for row in result.all()]
+    
     async def get_by_partner(
         self,
         partner_id: UUID,
@@ -35,6 +35,8 @@ PartnerEmployeeRepository = _repo_module.PartnerEmployeeRepository
 PartnerKYCRenewalRepository = _repo_module.PartnerKYCRenewalRepository
 PartnerLocationRepository = _repo_module.PartnerLocationRepository
 PartnerVehicleRepository = _repo_module.PartnerVehicleRepository
+encode_partner_cursor = _repo_module.encode_partner_cursor
+decode_partner_cursor = _repo_module.decode_partner_cursor
 
 __all__ = [
     "BranchRepository",
@@ -46,4 +48,6 @@ __all__ = [
     "PartnerKYCRenewalRepository",
     "PartnerLocationRepository",
     "PartnerVehicleRepository",
+    "encode_partner_cursor",
+    "decode_partner_cursor",
 ]
@@ -20,25 +20,30 @@ Endpoints:
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
+import hashlib
+from functools import partial
+from typing import List, Optional, Dict, Any, Union
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Header, HTTPException, UploadFile, File, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, Request, Response, UploadFile, File, status
 from sqlalchemy.ext.asyncio import AsyncSession
 import redis.asyncio as redis
 
-from backend.core.auth.deps import get_current_user
+from backend.core.auth.deps import AuthContext, get_auth_context
 from backend.core.auth.capabilities import Capabilities, RequireCapability
 from backend.core.events.emitter import EventEmitter
-from backend.db.session import get_db
+from backend.db.async_session import get_db, run_after_commit
 from backend.app.dependencies import get_redis
 from backend.modules.partners.enums import PartnerStatus, KYCStatus, RiskCategory
 from backend.modules.partners.schemas import (
     AmendmentRequest,
     ApprovalDecision,
+    BusinessPartnerListResponse,
+    BusinessPartnerPage,
     BusinessPartnerResponse,
     DashboardStats,
     EmployeeInvite,
+    KYCRenewalCompletion,
     KYCRenewalRequest,
     OnboardingApplicationCreate,
     OnboardingApplicationResponse,
@@ -58,6 +63,7 @@ from backend.modules.partners.partner_services import (
 )
 from backend.modules.partners.services.analytics import PartnerAnalyticsService
 from backend.modules.partners.services.documents import PartnerDocumentService
+from backend.modules.partners.services.cache import PartnerCache, invalidate_partner_cache, invalidate_partner_caches
 from backend.modules.partners.repositories import (
     BusinessPartnerRepository,
     OnboardingApplicationRepository,
@@ -65,6 +71,7 @@ from backend.modules.partners.repositories import (
     PartnerEmployeeRepository,
     PartnerLocationRepository,
     PartnerVehicleRepository,
+    encode_partner_cursor,
 )
 
 router = APIRouter(prefix="/partners", tags=["partners"])
@@ -72,16 +79,27 @@ router = APIRouter(prefix="/partners", tags=["partners"])
 
 # ===== DEPENDENCIES =====
 
-def get_current_user_id() -> UUID:
+async def get_current_user_id(auth: AuthContext = Depends(get_auth_context)) -> UUID:
     """Get current user ID from auth context"""
-    # TODO: Replace with actual auth dependency
+    return auth.user_id
+
+
+async def get_current_organization_id(auth: AuthContext = Depends(get_auth_context)) -> UUID:
+    """Get current organization ID from auth context"""
+    return auth.organization_id
+
+
+def get_onboarding_user_id() -> UUID:
+    """Get applicant user ID for onboarding endpoints"""
+    # TODO: Replace with onboarding token dependency (subject is the mobile
+    # number, not a user, so these routes are skipped by AuthMiddleware)
     from uuid import uuid4
     return uuid4()
 
 
-def get_current_organization_id() -> UUID:
-    """Get current organization ID from auth context"""
-    # TODO: Replace with actual auth dependency
+def get_onboarding_organization_id() -> UUID:
+    """Get organization ID for onboarding endpoints"""
+    # TODO: Replace with onboarding token dependency
     from uuid import uuid4
     return uuid4()
 
@@ -94,15 +112,15 @@ def get_event_emitter(db: AsyncSession = Depends(get_db)) -> EventEmitter:
 def get_partner_service(
     db: AsyncSession = Depends(get_db),
     redis_client: redis.Redis = Depends(get_redis),
-    current_user = Depends(get_current_user)
+    auth: AuthContext = Depends(get_auth_context)
 ) -> PartnerService:
     """Get PartnerService instance with dependencies"""
     event_emitter = EventEmitter(db)
     return PartnerService(
         db=db,
         event_emitter=event_emitter,
-        current_user_id=current_user.id,
-        organization_id=current_user.organization_id,
+        current_user_id=auth.user_id,
+        organization_id=auth.organization_id,
         redis_client=redis_client
     )
 
@@ -123,6 +141,38 @@ def get_document_service(
     return PartnerDocumentService(db=db, redis_client=redis_client)
 
 
+def get_partner_cache(
+    redis_client: redis.Redis = Depends(get_redis),
+    auth: AuthContext = Depends(get_auth_context)
+) -> PartnerCache:
+    """Get PartnerCache scoped to the current user's organization"""
+    return PartnerCache(redis_client, auth.organization_id)
+
+
+def _json_with_etag(request: Request, body: bytes) -> Response:
+    """
+    Send a JSON body with an ETag, or 304 if the client already has it.
+    
+    The ETag is a hash of the body itself, so it changes whenever any part
+    of the view does (including child rows, which don't bump updated_at).
+    no-cache makes clients revalidate every time rather than show stale data.
+    """
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in client_etags or "*" in client_etags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Columns of BusinessPartnerListResponse, selected as plain rows for the
+# basic listing (no ORM objects)
+_PARTNER_LIST_COLUMNS = tuple(BusinessPartnerListResponse.model_fields)
+
+
 # ===== ONBOARDING ENDPOINTS =====
 
 @router.post(
@@ -150,8 +200,8 @@ async def start_onboarding(
     data: OnboardingApplicationCreate,
     db: AsyncSession = Depends(get_db),
     event_emitter: EventEmitter = Depends(get_event_emitter),
-    user_id: UUID = Depends(get_current_user_id),
-    organization_id: UUID = Depends(get_current_organization_id),
+    user_id: UUID = Depends(get_onboarding_user_id),
+    organization_id: UUID = Depends(get_onboarding_organization_id),
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     redis_client: redis.Redis = Depends(get_redis),
     _check: None = Depends(RequireCapability(Capabilities.PARTNER_CREATE)),
@@ -172,10 +222,11 @@ async def start_onboarding(
 @router.post(
     "/onboarding/{application_id}/documents",
     response_model=PartnerDocumentResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
     summary="Upload Document",
     description="""
-    Upload document with OCR extraction.
+    Upload document; OCR extraction runs in the background and fills in
+    the document's extracted data when it completes.
     
     Automatically extracts:
     - GST Certificate: GSTIN, business name
@@ -192,10 +243,11 @@ async def start_onboarding(
 async def upload_document(
     application_id: UUID,
     document_type: str,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     document_service: PartnerDocumentService = Depends(get_document_service),
-    organization_id: UUID = Depends(get_current_organization_id),
-    user_id: UUID = Depends(get_current_user_id),
+    organization_id: UUID = Depends(get_onboarding_organization_id),
+    user_id: UUID = Depends(get_onboarding_user_id),
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     _check: None = Depends(RequireCapability(Capabilities.PARTNER_CREATE)),
 ):
@@ -206,7 +258,8 @@ async def upload_document(
             file=file,
             document_type=document_type,
             organization_id=organization_id,
-            uploaded_by=user_id
+            uploaded_by=user_id,
+            background_tasks=background_tasks,
         )
         return document
     except ValueError as e:
@@ -246,8 +299,8 @@ async def submit_for_approval(
     application_id: UUID,
     db: AsyncSession = Depends(get_db),
     event_emitter: EventEmitter = Depends(get_event_emitter),
-    user_id: UUID = Depends(get_current_user_id),
-    organization_id: UUID = Depends(get_current_organization_id),
+    user_id: UUID = Depends(get_onboarding_user_id),
+    organization_id: UUID = Depends(get_onboarding_organization_id),
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     _check: None = Depends(RequireCapability(Capabilities.PARTNER_CREATE)),
 ):
@@ -272,7 +325,7 @@ async def submit_for_approval(
 async def get_application_status(
     application_id: UUID,
     partner_service: PartnerService = Depends(get_partner_service),
-    organization_id: UUID = Depends(get_current_organization_id)
+    organization_id: UUID = Depends(get_onboarding_organization_id)
 ):
     """Get current status of onboarding application"""
     application = await partner_service.get_application_by_id(application_id)
@@ -311,35 +364,23 @@ async def approve_partner(
     _check: None = Depends(RequireCapability(Capabilities.PARTNER_APPROVE)),
 ):
     """Approve partner application (manager/director only)"""
-    approval_service = ApprovalService(db, user_id, redis_client=redis_client)
-    
-    # Get application
-    application = await partner_service.get_application_by_id(application_id)
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    # Build risk assessment from application
-    risk_assessment = RiskAssessment(
-        risk_score=application.risk_score or 50,
-        risk_category=application.risk_category,
-        approval_route="manual",
-        factors=[],
-        assessment_date=application.submitted_at
-    )
+    approval_service = ApprovalService(db, user_id, redis_client=partner_service.redis)
     
     try:
-        # Service handles: business logic, event emission, commit, idempotency
+        # Service handles: application lookup, business logic, event emission, idempotency (commit via get_db)
         partner = await approval_service.process_approval(
             application_id,
-            risk_assessment,
             decision,
+            organization_id=partner_service.organization_id,
             idempotency_key=idempotency_key
         )
         return partner
     except ValueError as e:
+        if str(e) == "Application not found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e)
+            )
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
@@ -370,33 +411,22 @@ async def reject_partner(
     """Reject partner application"""
     decision.approved = False
     
-    # Check application exists before creating service
-    application = await partner_service.get_application_by_id(application_id)
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    approval_service = ApprovalService(db, user_id, redis_client=redis_client)
-    
-    risk_assessment = RiskAssessment(
-        risk_score=application.risk_score or 0,
-        risk_category=application.risk_category,
-        approval_route="manual",
-        factors=[]
-    )
+    approval_service = ApprovalService(db, user_id, redis_client=partner_service.redis)
     
     try:
-        # Service handles: business logic, event emission, commit, idempotency
+        # Service handles: application lookup, business logic, event emission, commit, idempotency
         await approval_service.process_approval(
             application_id,
-            risk_assessment,
             decision,
+            organization_id=partner_service.organization_id,
             idempotency_key=idempotency_key
         )
     except ValueError as e:
+        if str(e) == "Application not found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e)
+            )
         # Rejection raises ValueError with message
         return {"message": str(e), "status": "rejected"}
 
@@ -405,7 +435,7 @@ async def reject_partner(
 
 @router.get(
     "/",
-    response_model=Dict[str, Any],
+    response_model=Union[BusinessPartnerPage, Dict[str, Any]],
     summary="List Partners with Filters",
     description="""
     List all business partners with optional advanced filtering:
@@ -415,11 +445,17 @@ async def reject_partner(
     - Date range filtering
     - Full-text search on business name/GSTIN
     - Risk category filtering
+    
+    Basic listings page by cursor: pass the previous response's
+    `next_cursor` as `after` (null when there are no more results).
+    They carry an ETag and answer If-None-Match with 304 Not Modified.
     """
 )
 async def list_partners(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    skip: int = Query(0, ge=0, deprecated=True, description="Deprecated: use `after`"),
+    after: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    limit: int = Query(100, ge=1, le=1000),
     entity_class: Optional[str] = None,
     status: Optional[PartnerStatus] = None,
     kyc_status: Optional[KYCStatus] = None,
@@ -437,32 +473,49 @@ async def list_partners(
     """List all partners with filters (auto-isolated by organization)"""
     # Use advanced search if any advanced filters are provided
     if any([kyc_expiring_days, risk_category, state, date_from, date_to, sort_by != "created_at", sort_order != "desc"]):
-        return await partner_service.search_partners_advanced(
-            partner_type=partner_type,
-            status=status,
-            kyc_status=kyc_status,
-            kyc_expiring_days=kyc_expiring_days,
-            risk_category=risk_category,
-            state=state,
-            date_from=date_from,
-            date_to=date_to,
-            search=search,
-            sort_by=sort_by,
-            sort_order=sort_order,
-            skip=skip,
-            limit=limit
-        )
+        try:
+            return await partner_service.search_partners_advanced(
+                entity_class=entity_class,
+                status=status,
+                kyc_status=kyc_status,
+                kyc_expiring_days=kyc_expiring_days,
+                risk_category=risk_category,
+                state=state,
+                date_from=date_from,
+                date_to=date_to,
+                search=search,
+                sort_by=sort_by,
+                sort_order=sort_order,
+                skip=skip,
+                limit=limit
+            )
+        except ValueError as e:
+            # Bad date_from/date_to or an unknown sort_by column
+            raise HTTPException(status_code=400, detail=str(e))
     else:
         # Use simple list for basic queries
-        partners = await partner_service.list_all_partners(
-            skip=skip,
-            limit=limit,
-            partner_type=partner_type,
-            status=status,
-            kyc_status=kyc_status,
-            search=search
+        try:
+            partners = await partner_service.list_partner_rows(
+                columns=_PARTNER_LIST_COLUMNS,
+                skip=skip,
+                limit=limit,
+                entity_class=entity_class,
+                status=status,
+                kyc_status=kyc_status,
+                search=search,
+                after=after
+            )
+        except ValueError as e:
+            # `status` is the filter parameter here, not fastapi.status
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        next_cursor = encode_partner_cursor(partners[-1]) if len(partners) == limit else None
+        page = BusinessPartnerPage(
+            results=[partner._asdict() for partner in partners],
+            total=len(partners),
+            next_cursor=next_cursor
         )
-        return {"results": partners, "total": len(partners)}
+        return _json_with_etag(request, page.model_dump_json().encode())
 
 
 @router.get(
@@ -471,11 +524,43 @@ async def list_partners(
     summary="Get Partner Details"
 )
 async def get_partner(
+    partner_id: UUID,
+    request: Request,
+    partner_service: PartnerService = Depends(get_partner_service),
+    partner_cache: PartnerCache = Depends(get_partner_cache)
+):
+    """Get partner details by ID (cached, supports If-None-Match)"""
+    # Loaded with its collections, which BusinessPartnerResponse includes
+    body = await partner_cache.get_or_load_json(
+        partner_id, "detail", BusinessPartnerResponse,
+        lambda: partner_service.get_partner_full(partner_id)
+    )
+    
+    if body is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Partner not found"
+        )
+    
+    return _json_with_etag(request, body)
+
+
+@router.get(
+    "/{partner_id}/full",
+    response_model=BusinessPartnerResponse,
+    summary="Get Partner with Locations, Employees, Documents and Vehicles",
+    description="""
+    Partner details together with all locations, employees, documents and
+    vehicles in one request, instead of calling the four collection
+    endpoints separately.
+    """
+)
+async def get_partner_full(
     partner_id: UUID,
     partner_service: PartnerService = Depends(get_partner_service)
 ):
-    """Get partner details by ID"""
-    partner = await partner_service.get_partner_by_id(partner_id)
+    """Get partner details with all child collections"""
+    partner = await partner_service.get_partner_full(partner_id)
     
     if not partner:
         raise HTTPException(
@@ -493,11 +578,16 @@ async def get_partner(
 )
 async def get_partner_locations(
     partner_id: UUID,
-    partner_service: PartnerService = Depends(get_partner_service)
+    request: Request,
+    partner_service: PartnerService = Depends(get_partner_service),
+    partner_cache: PartnerCache = Depends(get_partner_cache)
 ):
-    """Get all locations for a partner"""
-    locations = await partner_service.get_partner_locations(partner_id)
-    return locations
+    """Get all locations for a partner (cached, supports If-None-Match)"""
+    body = await partner_cache.get_or_load_json(
+        partner_id, "locations", List[PartnerLocationResponse],
+        lambda: partner_service.get_partner_locations(partner_id)
+    )
+    return _json_with_etag(request, body)
 
 
 @router.post(
@@ -519,7 +609,6 @@ async def add_partner_location(
     location_data: PartnerLocationCreate,
     partner_service: PartnerService = Depends(get_partner_service),
     organization_id: UUID = Depends(get_current_organization_id),
-    current_user = Depends(get_current_user),
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     _check: None = Depends(RequireCapability(Capabilities.PARTNER_UPDATE)),
 ):
@@ -542,6 +631,7 @@ async def add_partner_location(
             location_data=location_data,
             organization_id=organization_id
         )
+        run_after_commit(partner_service.db, partial(invalidate_partner_cache, partner_service.redis, partner_id))
         return location
     except ValueError as e:
         raise HTTPException(
@@ -576,11 +666,16 @@ async def add_partner_location(
 )
 async def get_partner_employees(
     partner_id: UUID,
-    partner_service: PartnerService = Depends(get_partner_service)
+    request: Request,
+    partner_service: PartnerService = Depends(get_partner_service),
+    partner_cache: PartnerCache = Depends(get_partner_cache)
 ):
-    """Get all employees for a partner"""
-    employees = await partner_service.get_partner_employees(partner_id)
-    return employees
+    """Get all employees for a partner (cached, supports If-None-Match)"""
+    body = await partner_cache.get_or_load_json(
+        partner_id, "employees", List[PartnerEmployeeResponse],
+        lambda: partner_service.get_partner_employees(partner_id)
+    )
+    return _json_with_etag(request, body)
 
 
 @router.get(
@@ -590,12 +685,17 @@ async def get_partner_employees(
 )
 async def get_partner_documents(
     partner_id: UUID,
+    request: Request,
     document_type: Optional[str] = None,
-    partner_service: PartnerService = Depends(get_partner_service)
+    partner_service: PartnerService = Depends(get_partner_service),
+    partner_cache: PartnerCache = Depends(get_partner_cache)
 ):
-    """Get all documents for a partner"""
-    documents = await partner_service.get_partner_documents(partner_id)
-    return documents
+    """Get all documents for a partner (cached, supports If-None-Match)"""
+    body = await partner_cache.get_or_load_json(
+        partner_id, "documents", List[PartnerDocumentResponse],
+        lambda: partner_service.get_partner_documents(partner_id)
+    )
+    return _json_with_etag(request, body)
 
 
 @router.get(
@@ -605,11 +705,16 @@ async def get_partner_documents(
 )
 async def get_partner_vehicles(
     partner_id: UUID,
-    partner_service: PartnerService = Depends(get_partner_service)
+    request: Request,
+    partner_service: PartnerService = Depends(get_partner_service),
+    partner_cache: PartnerCache = Depends(get_partner_cache)
 ):
-    """Get all vehicles for a transporter partner"""
-    vehicles = await partner_service.get_partner_vehicles(partner_id)
-    return vehicles
+    """Get all vehicles for a transporter partner (cached, supports If-None-Match)"""
+    body = await partner_cache.get_or_load_json(
+        partner_id, "vehicles", List[PartnerVehicleResponse],
+        lambda: partner_service.get_partner_vehicles(partner_id)
+    )
+    return _json_with_etag(request, body)
 
 
 # ===== AMENDMENT ENDPOINTS =====
@@ -664,23 +769,68 @@ async def invite_employee(
     db: AsyncSession = Depends(get_db),
     user_id: UUID = Depends(get_current_user_id),
     organization_id: UUID = Depends(get_current_organization_id),
+    redis_client: redis.Redis = Depends(get_redis),
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     _check: None = Depends(RequireCapability(Capabilities.PARTNER_CREATE)),
 ):
     """Invite employee to partner account"""
-    # Service handles: employee creation, event emission, commit
+    # Service handles: employee creation, event emission (commit via get_db)
     service = PartnerService(db, get_event_emitter(), user_id, organization_id, redis_client=redis_client)
     new_employee = await service.invite_employee(
         partner_id=partner_id,
         employee_data=employee.dict(),
         idempotency_key=idempotency_key
     )
+    run_after_commit(db, partial(invalidate_partner_cache, redis_client, partner_id))
     
     # TODO: Send invitation email with OTP/magic link
     
     return new_employee
 
 
+@router.post(
+    "/{partner_id}/employees:batch",
+    response_model=List[PartnerEmployeeResponse],
+    summary="Invite Employees (Batch)",
+    description="""
+    Invite several employees in one request with a single INSERT.
+    
+    The whole batch is checked against the partner's employee limit and
+    rejected if it would exceed it.
+    
+    **Infrastructure:**
+    - Idempotency via Idempotency-Key header
+    - Capability: PARTNER_CREATE
+    - Events emitted through transactional outbox
+    """
+)
+async def invite_employees_batch(
+    partner_id: UUID,
+    employees: List[EmployeeInvite],
+    partner_service: PartnerService = Depends(get_partner_service),
+    _check: None = Depends(RequireCapability(Capabilities.PARTNER_CREATE)),
+):
+    """Invite several employees to partner account"""
+    try:
+        new_employees = await partner_service.invite_employees(
+            partner_id=partner_id,
+            employees_data=[employee.dict() for employee in employees]
+        )
+    except ValueError as e:
+        if str(e) == "Partner not found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e)
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    run_after_commit(partner_service.db, partial(invalidate_partner_cache, partner_service.redis, partner_id))
+    return new_employees
+
+
 # ===== KYC RENEWAL ENDPOINTS =====
 
 @router.get(
@@ -692,11 +842,13 @@ async def invite_employee(
 async def get_expiring_kyc_partners(
     days: int = 30,
     db: AsyncSession = Depends(get_db),
+    redis_client: redis.Redis = Depends(get_redis),
     organization_id: UUID = Depends(get_current_organization_id)
 ):
     """Get partners with KYC expiring soon"""
-    kyc_service = KYCRenewalService(db, UUID("00000000-0000-0000-0000-000000000000"), redis_client=redis_client)
-    partners = await kyc_service.check_kyc_expiry(organization_id, days)
+    partners = await KYCRenewalService.check_kyc_expiry(
+        db, organization_id, days, redis_client=redis_client
+    )
     return partners
 
 
@@ -716,6 +868,7 @@ async def initiate_kyc_renewal(
     partner_id: UUID,
     db: AsyncSession = Depends(get_db),
     user_id: UUID = Depends(get_current_user_id),
+    redis_client: redis.Redis = Depends(get_redis),
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     _check: None = Depends(RequireCapability(Capabilities.PARTNER_UPDATE)),
 ):
@@ -723,8 +876,8 @@ async def initiate_kyc_renewal(
     kyc_service = KYCRenewalService(db, user_id, redis_client=redis_client)
     
     try:
-        # Service already handles commit
         renewal = await kyc_service.initiate_kyc_renewal(partner_id)
+        run_after_commit(db, partial(invalidate_partner_cache, redis_client, partner_id))
         
         return {
             "message": "KYC renewal initiated",
@@ -756,6 +909,7 @@ async def complete_kyc_renewal(
     renewal: KYCRenewalRequest,
     db: AsyncSession = Depends(get_db),
     user_id: UUID = Depends(get_current_user_id),
+    redis_client: redis.Redis = Depends(get_redis),
     idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
     _check: None = Depends(RequireCapability(Capabilities.PARTNER_UPDATE)),
 ):
@@ -768,6 +922,7 @@ async def complete_kyc_renewal(
             renewal.new_document_ids,
             verified=True
         )
+        run_after_commit(db, partial(invalidate_partner_cache, redis_client, partner.id))
         
         return {
             "message": "KYC renewal completed successfully",
@@ -782,6 +937,38 @@ async def complete_kyc_renewal(
         )
 
 
+@router.post(
+    "/kyc/complete:batch",
+    response_model=List[UUID],
+    summary="Complete KYC Renewals in Bulk",
+    description="""
+    Complete many verified KYC renewals in one request, e.g. for the yearly
+    renewal run. Returns the IDs of the partners whose KYC was extended.
+    
+    **Infrastructure:**
+    - Idempotency via Idempotency-Key header
+    - Capability: PARTNER_UPDATE
+    """
+)
+async def complete_kyc_renewals(
+    completions: List[KYCRenewalCompletion],
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id),
+    redis_client: redis.Redis = Depends(get_redis),
+    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key"),
+    _check: None = Depends(RequireCapability(Capabilities.PARTNER_UPDATE)),
+):
+    """Complete several verified KYC renewals"""
+    kyc_service = KYCRenewalService(db, user_id, redis_client=redis_client)
+    
+    partner_ids = await kyc_service.complete_kyc_renewals(
+        [(completion.renewal_id, completion.document_ids) for completion in completions]
+    )
+    run_after_commit(db, partial(invalidate_partner_caches, redis_client, partner_ids))
+    
+    return partner_ids
+
+
 # ===== VEHICLE MANAGEMENT (for Transporters) =====
 
 @router.post(
@@ -822,10 +1009,46 @@ async def add_vehicle(
         is_active=True,
         created_by=user_id
     )
+    run_after_commit(partner_service.db, partial(invalidate_partner_cache, partner_service.redis, partner_id))
     
     return new_vehicle
 
 
+@router.post(
+    "/{partner_id}/vehicles:batch",
+    response_model=List[PartnerVehicleResponse],
+    summary="Add Vehicles (Batch)",
+    description="""
+    Add several vehicles for a transporter partner with a single INSERT.
+    
+    **Infrastructure:**
+    - Idempotency via Idempotency-Key header
+    - Capability: PARTNER_UPDATE
+    - Events emitted through transactional outbox
+    """
+)
+async def add_vehicles_batch(
+    partner_id: UUID,
+    vehicles: List[VehicleData],
+    partner_service: PartnerService = Depends(get_partner_service),
+    _check: None = Depends(RequireCapability(Capabilities.PARTNER_UPDATE)),
+):
+    """Add several vehicles for transporter"""
+    try:
+        new_vehicles = await partner_service.add_vehicles(
+            partner_id=partner_id,
+            vehicles_data=[vehicle.dict() for vehicle in vehicles]
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    run_after_commit(partner_service.db, partial(invalidate_partner_cache, partner_service.redis, partner_id))
+    return new_vehicles
+
+
 # ===== EXPORT FUNCTIONALITY =====
 
 @router.get(
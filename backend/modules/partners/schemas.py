@@ -450,6 +450,13 @@ class BusinessPartnerListResponse(BaseModel):
         from_attributes = True
 
 
+class BusinessPartnerPage(BaseModel):
+    """One page of the basic partner listing"""
+    results: List[BusinessPartnerListResponse]
+    total: int
+    next_cursor: Optional[str] = Field(None, description="Pass as `after` for the next page; null on the last page")
+
+
 # ============================================
 # APPROVAL SCHEMAS
 # ============================================
@@ -500,6 +507,12 @@ class KYCRenewalRequest(BaseModel):
     partner_id: UUID
 
 
+class KYCRenewalCompletion(BaseModel):
+    """One verified renewal in a batch completion"""
+    renewal_id: UUID
+    document_ids: List[UUID] = Field(default_factory=list)
+
+
 class KYCRenewalResponse(BaseModel):
     """KYC renewal status"""
     id: UUID
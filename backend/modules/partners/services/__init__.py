@@ -4,6 +4,7 @@ Partner Services Module - Service Layer for Business Partner Operations
 Extracted services for clean architecture:
 - analytics.py: Dashboard, export, KYC expiry queries
 - documents.py: Document upload and management
+- cache.py: Redis read cache for partner detail and child lists
 
 NOTE: Core services (PartnerService, ApprovalService, etc.) are in ../services.py
       Import them directly: from backend.modules.partners import services as partner_services
@@ -0,0 +1,154 @@
+"""
+Partner Read Cache
+
+Redis cache for partner detail and per-partner child lists.
+
+Keys are partner:{partner_id}:{organization_id}:{kind}. Every key cached
+for a partner is also added to its index set, partner:{partner_id}:keys,
+so all cached views of a partner can be dropped without scanning the
+keyspace when that partner changes.
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from uuid import UUID
+
+from pydantic import TypeAdapter
+import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+
+logger = logging.getLogger(__name__)
+
+PARTNER_CACHE_TTL_SECONDS = 300
+
+# Refreshed on every write; must outlive every entry listed in the index
+PARTNER_KEY_INDEX_TTL_SECONDS = 3600
+
+
+@lru_cache(maxsize=None)
+def _adapter(response_type: Any) -> TypeAdapter:
+    # Building a TypeAdapter compiles a validator; do it once per type
+    return TypeAdapter(response_type)
+
+
+def _index_key(partner_id: UUID) -> str:
+    return f"partner:{partner_id}:keys"
+
+
+def track_partner_key(pipe: Pipeline, partner_id: UUID, key: str) -> None:
+    """
+    Queue the registration of a cached key in its partner's index.
+    
+    Call on the pipeline that writes the key, so invalidate_partner_cache()
+    finds it.
+    """
+    index = _index_key(partner_id)
+    pipe.sadd(index, key)
+    pipe.expire(index, PARTNER_KEY_INDEX_TTL_SECONDS)
+
+
+async def invalidate_partner_cache(redis_client: Optional[redis.Redis], partner_id: UUID) -> None:
+    """
+    Drop every cached view of a partner (all organizations, all kinds).
+    
+    Call after the change is committed (see run_after_commit), or a
+    concurrent read can cache the old rows again.
+    """
+    await invalidate_partner_caches(redis_client, [partner_id])
+
+
+async def invalidate_partner_caches(redis_client: Optional[redis.Redis], partner_ids: Iterable[UUID]) -> None:
+    """
+    invalidate_partner_cache for many partners in two round trips.
+    
+    One transaction reads and removes each partner's index; a single UNLINK
+    then drops the keys it listed, without blocking Redis.
+    """
+    if not redis_client:
+        return
+    
+    indexes = [_index_key(partner_id) for partner_id in set(partner_ids)]
+    if not indexes:
+        return
+    
+    try:
+        async with redis_client.pipeline(transaction=True) as pipe:
+            for index in indexes:
+                pipe.smembers(index)
+            pipe.unlink(*indexes)
+            *members, _ = await pipe.execute()
+        
+        keys = set().union(*members)
+        if keys:
+            await redis_client.unlink(*keys)
+    except redis.RedisError as e:
+        # Entries still expire after their TTL
+        logger.warning(f"Partner cache invalidation failed for {len(indexes)} partners: {e}")
+
+
+class PartnerCache:
+    """
+    Read-through cache for partner views of one organization.
+    
+    Values are stored as the JSON of their response schema, so a hit is
+    served without touching Postgres, the ORM or Pydantic.
+    """
+    
+    def __init__(self, redis_client: Optional[redis.Redis], organization_id: UUID):
+        self.redis = redis_client
+        self.organization_id = organization_id
+    
+    def _key(self, partner_id: UUID, kind: str) -> str:
+        return f"partner:{partner_id}:{self.organization_id}:{kind}"
+    
+    async def get_or_load_json(
+        self,
+        partner_id: UUID,
+        kind: str,
+        response_type: Any,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Optional[bytes]:
+        """
+        Return the cached view as JSON, or load it, serialize it and cache it.
+        
+        A hit returns the stored bytes as-is, with no validation or
+        re-serialization; they can be sent (or hashed for an ETag) directly.
+        
+        Args:
+            partner_id: Partner ID
+            kind: View name (e.g. "detail", "locations")
+            response_type: Response schema, e.g. BusinessPartnerResponse
+                or List[PartnerLocationResponse]
+            load: Loads the ORM object(s) on a cache miss
+        
+        Returns:
+            JSON of response_type, or None if load found nothing
+        """
+        key = self._key(partner_id, kind)
+        
+        if self.redis:
+            try:
+                cached = await self.redis.get(key)
+                if cached:
+                    return cached.encode() if isinstance(cached, str) else cached
+            except redis.RedisError as e:
+                logger.warning(f"Partner cache read failed for {key}: {e}")
+        
+        loaded = await load()
+        if loaded is None:
+            return None
+        
+        adapter = _adapter(response_type)
+        body = adapter.dump_json(adapter.validate_python(loaded, from_attributes=True))
+        
+        if self.redis:
+            try:
+                async with self.redis.pipeline(transaction=False) as pipe:
+                    pipe.set(key, body, ex=PARTNER_CACHE_TTL_SECONDS)
+                    track_partner_key(pipe, partner_id, key)
+                    await pipe.execute()
+            except redis.RedisError as e:
+                logger.warning(f"Partner cache write failed for {key}: {e}")
+        
+        return body
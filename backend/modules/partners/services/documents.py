@@ -7,14 +7,22 @@ Extracted from router to maintain clean architecture for 15 years.
 NO business logic changes - pure extraction.
 """
 
+import asyncio
+import hashlib
+import logging
 from typing import List, Optional, Literal
 from uuid import UUID
 
-from fastapi import UploadFile
+from fastapi import BackgroundTasks, UploadFile
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
+import orjson
 import redis.asyncio as redis
 
 from backend.core.outbox import OutboxRepository
+from backend.core.settings.config import settings
+from backend.core.storage import get_document_storage
+from backend.db.async_session import AsyncSessionLocal
 from backend.modules.partners.repositories import (
     PartnerDocumentRepository,
     OnboardingApplicationRepository,
@@ -23,9 +31,105 @@ from backend.modules.partners.models import PartnerDocument
 from backend.modules.partners.enums import DocumentType
 from backend.modules.partners.partner_services import DocumentProcessingService
 
+logger = logging.getLogger(__name__)
+
 # Document status literals (not enum - stored as strings)
 DocumentStatusType = Literal["pending", "approved", "rejected", "expired"]
 
+# Upper bound on OCR jobs running at once per worker process; each one
+# holds a thread and the decoded image in memory
+MAX_OCR_INFLIGHT = 4
+_ocr_slots = asyncio.Semaphore(MAX_OCR_INFLIGHT)
+
+# Extracted data per (document type, SHA-256 of the file), so a re-upload
+# of the same file (e.g. a client retry) skips OCR
+OCR_CACHE_TTL_SECONDS = 86400
+_ocr_cache: Optional[redis.Redis] = None
+
+# OCR extractor per document type; types not listed are stored without OCR
+_EXTRACTORS = {
+    "GST_CERTIFICATE": DocumentProcessingService.extract_gst_certificate,
+    "PAN_CARD": DocumentProcessingService.extract_pan_card,
+    "BANK_PROOF": DocumentProcessingService.extract_bank_proof,
+    "VEHICLE_RC": DocumentProcessingService.extract_vehicle_rc,
+}
+
+
+async def store_document_file(file: UploadFile) -> str:
+    """Upload a file to document storage and return its URL."""
+    document_storage = get_document_storage()
+    if document_storage is None:
+        # No bucket configured (local development)
+        return f"https://storage.example.com/{file.filename}"
+    return await document_storage.upload(file.file, file.filename, file.content_type)
+
+
+def _get_ocr_cache() -> redis.Redis:
+    """
+    Redis client for OCR results, shared by all OCR tasks of the process.
+    
+    OCR runs after the request, when the request's own Redis client has
+    already been closed.
+    """
+    global _ocr_cache
+    if _ocr_cache is None:
+        _ocr_cache = redis.from_url(settings.REDIS_URL)
+    return _ocr_cache
+
+
+async def _get_cached_extraction(cache_key: str) -> Optional[dict]:
+    try:
+        cached = await _get_ocr_cache().get(cache_key)
+    except redis.RedisError as e:
+        logger.warning(f"OCR cache read failed for {cache_key}: {e}")
+        return None
+    return orjson.loads(cached) if cached else None
+
+
+async def _cache_extraction(cache_key: str, extracted_data: dict) -> None:
+    try:
+        await _get_ocr_cache().set(cache_key, orjson.dumps(extracted_data), ex=OCR_CACHE_TTL_SECONDS)
+    except redis.RedisError as e:
+        logger.warning(f"OCR cache write failed for {cache_key}: {e}")
+
+
+async def run_document_ocr(document_id: UUID, document_type: str, file_bytes: bytes) -> None:
+    """
+    Extract data from an uploaded document and store it on the document row.
+    
+    Runs after the upload response has been sent, in its own session.
+    ocr_extracted_data stays NULL until this completes. Results are cached
+    by file content, so identical files are only OCR'd once a day.
+    """
+    extractor = _EXTRACTORS.get(document_type)
+    if extractor is None:
+        return
+    
+    cache_key = f"ocr:{document_type}:{hashlib.sha256(file_bytes).hexdigest()}"
+    
+    # A cache hit doesn't wait for an OCR slot
+    extracted_data = await _get_cached_extraction(cache_key)
+    
+    async with AsyncSessionLocal() as session:
+        if extracted_data is None:
+            async with _ocr_slots:
+                extracted_data = await extractor(DocumentProcessingService(session), file_bytes)
+            await _cache_extraction(cache_key, extracted_data)
+        else:
+            logger.info(f"OCR cache hit for document {document_id} ({document_type})")
+        
+        await session.execute(
+            update(PartnerDocument)
+            .where(PartnerDocument.id == document_id)
+            .values(
+                ocr_extracted_data=extracted_data,
+                extraction_confidence=extracted_data.get("confidence", 0),
+            )
+        )
+        await session.commit()
+    
+    logger.info(f"OCR completed for document {document_id} ({document_type})")
+
 
 class PartnerDocumentService:
     """
@@ -137,16 +241,17 @@ class PartnerDocumentService:
         file: UploadFile,
         document_type: str,
         organization_id: UUID,
-        uploaded_by: UUID
+        uploaded_by: UUID,
+        background_tasks: BackgroundTasks,
     ) -> PartnerDocument:
         """
-        Process document upload with OCR extraction.
+        Process document upload; OCR extraction runs in the background.
         
         Steps:
-        1. Read file bytes for OCR
-        2. Extract data using Tesseract OCR based on document type
-        3. Upload file to storage (S3/GCS) - TODO
-        4. Create document record with extracted data
+        1. Read file bytes for OCR (only for types with an extractor)
+        2. Stream file to storage (GCS), overlapped with the application lookup
+        3. Create document record (OCR fields empty)
+        4. Schedule Tesseract OCR to fill in the extracted data
         
         Args:
             application_id: Application ID
@@ -154,49 +259,36 @@ class PartnerDocumentService:
             document_type: Type of document
             organization_id: Organization ID
             uploaded_by: User ID who uploaded
+            background_tasks: Request background tasks; OCR runs after the
+                response is sent and the request transaction has committed
             
         Returns:
             Created PartnerDocument
         """
-        # Read file bytes for OCR processing
-        file_bytes = await file.read()
-        
-        # Reset file pointer for potential re-upload
-        await file.seek(0)
-        
-        # Extract data using Tesseract OCR based on document type
-        extracted_data = {}
-        if document_type == "GST_CERTIFICATE":
-            extracted_data = await self.doc_processing_service.extract_gst_certificate(file_bytes)
-        elif document_type == "PAN_CARD":
-            extracted_data = await self.doc_processing_service.extract_pan_card(file_bytes)
-        elif document_type == "BANK_PROOF":
-            extracted_data = await self.doc_processing_service.extract_bank_proof(file_bytes)
-        elif document_type == "VEHICLE_RC":
-            extracted_data = await self.doc_processing_service.extract_vehicle_rc(file_bytes)
-        
-        # TODO: Upload file to storage (S3/GCS)
-        # For now, use placeholder URL
-        file_url = f"https://storage.example.com/{file.filename}"
-        
-        # Get application to find partner_id
-        application = await self.app_repo.get_by_id(application_id, organization_id)
+        # Read file bytes for OCR processing; other types are never loaded whole
+        file_bytes = await file.read() if document_type in _EXTRACTORS else None
+        
+        # Upload runs in a worker thread while the application is fetched
+        # (an upload for a missing application leaves an unreferenced object)
+        file_url, application = await asyncio.gather(
+            store_document_file(file),
+            self.app_repo.get_by_id(application_id, organization_id),
+        )
         if not application:
             raise ValueError("Application not found")
         
         # Create document record
         document = await self.document_repo.create(
             partner_id=application.id,  # For now, link to application
-            organization_id=organization_id,
             document_type=document_type,
+            country=application.primary_country,
             file_url=file_url,
             file_name=file.filename,
-            file_size=file.size or len(file_bytes),
-            mime_type=file.content_type,
-            ocr_extracted_data=extracted_data,
-            ocr_confidence=extracted_data.get("confidence", 0),
-            uploaded_by=uploaded_by
+            file_size=file.size,
+            mime_type=file.content_type
         )
+        if file_bytes is not None:
+            background_tasks.add_task(run_document_ocr, document.id, document_type, file_bytes)
         
         # Emit event
         await self.outbox_repo.add_event(
@@ -207,7 +299,6 @@ class PartnerDocumentService:
                 "application_id": str(application_id),
                 "document_id": str(document.id),
                 "document_type": document_type,
-                "ocr_confidence": extracted_data.get("confidence", 0)
             },
             topic_name="partner-events",
             metadata={"user_id": str(uploaded_by)}
@@ -215,6 +306,79 @@ class PartnerDocumentService:
         
         return document
     
+    async def process_and_upload_many(
+        self,
+        application_id: UUID,
+        files: List[UploadFile],
+        document_types: List[str],
+        organization_id: UUID,
+        uploaded_by: UUID,
+        background_tasks: BackgroundTasks,
+    ) -> List[UUID]:
+        """
+        Upload several documents for an application with a single INSERT.
+        
+        Same flow as process_and_upload, but the document rows are written in
+        one statement; OCR is scheduled per document as usual.
+        
+        Args:
+            application_id: Application ID
+            files: Uploaded files
+            document_types: Document type for each file, in the same order
+            organization_id: Organization ID
+            uploaded_by: User ID who uploaded
+            background_tasks: Request background tasks for OCR
+            
+        Returns:
+            IDs of the created documents, in upload order
+        """
+        if len(files) != len(document_types):
+            raise ValueError("Each file needs exactly one document type")
+        
+        file_bytes_list = [
+            await file.read() if document_type in _EXTRACTORS else None
+            for file, document_type in zip(files, document_types)
+        ]
+        
+        application, *file_urls = await asyncio.gather(
+            self.app_repo.get_by_id(application_id, organization_id),
+            *(store_document_file(file) for file in files),
+        )
+        if not application:
+            raise ValueError("Application not found")
+        
+        document_ids = await self.document_repo.create_many([
+            {
+                "partner_id": application.id,  # For now, link to application
+                "document_type": document_type,
+                "country": application.primary_country,
+                "file_url": file_url,
+                "file_name": file.filename,
+                "file_size": file.size,
+                "mime_type": file.content_type,
+            }
+            for file, file_url, document_type in zip(files, file_urls, document_types)
+        ])
+        
+        for document_id, document_type, file_bytes in zip(document_ids, document_types, file_bytes_list):
+            if file_bytes is not None:
+                background_tasks.add_task(run_document_ocr, document_id, document_type, file_bytes)
+            
+            await self.outbox_repo.add_event(
+                aggregate_id=application_id,
+                aggregate_type="OnboardingApplication",
+                event_type="PartnerDocumentUploaded",
+                payload={
+                    "application_id": str(application_id),
+                    "document_id": str(document_id),
+                    "document_type": document_type,
+                },
+                topic_name="partner-events",
+                metadata={"user_id": str(uploaded_by)}
+            )
+        
+        return document_ids
+    
     async def check_all_documents_verified(self, partner_id: UUID) -> bool:
         """
         Check if all required documents are verified.
@@ -0,0 +1,116 @@
+"""
+Partner Risk Data Cache
+
+Redis cache for the partner data risk assessments read (credit position,
+performance, trade history).
+
+Keys are partner:{partner_id}:risk:{kind} and are registered in the
+partner's key index, so invalidate_partner_cache() in the partners module
+drops them along with the partner's other cached views whenever the
+partner changes.
+"""
+
+import logging
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from uuid import UUID
+
+import orjson
+import redis.asyncio as redis
+
+from backend.modules.partners.services.cache import track_partner_key
+
+logger = logging.getLogger(__name__)
+
+PARTNER_RISK_DATA_TTL_SECONDS = 60
+# Trade history moves slower than credit exposure
+TRADE_HISTORY_TTL_SECONDS = 300
+
+# Fields stored as strings (orjson has no Decimal type) and restored on read
+_DECIMAL_FIELDS = frozenset({
+    "credit_limit",
+    "current_exposure",
+    "rating",
+    "average_trade_value",
+})
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    return orjson.dumps(data, default=str)
+
+
+def _loads(raw: bytes) -> Dict[str, Any]:
+    data = orjson.loads(raw)
+    for field in _DECIMAL_FIELDS.intersection(data):
+        data[field] = Decimal(data[field])
+    return data
+
+
+class PartnerRiskDataCache:
+    """
+    Read-through cache of per-partner risk inputs.
+
+    Without a Redis client every call goes to the loader; Redis errors are
+    logged and fall back to the loader as well.
+    """
+
+    def __init__(self, redis_client: Optional[redis.Redis]):
+        self.redis = redis_client
+
+    @staticmethod
+    def _key(partner_id: UUID, kind: str) -> str:
+        return f"partner:{partner_id}:risk:{kind}"
+
+    async def get_or_load_many(
+        self,
+        kind: str,
+        partner_ids: Set[UUID],
+        load: Callable[[Set[UUID]], Awaitable[Dict[UUID, Dict[str, Any]]]],
+        ttl_seconds: int = PARTNER_RISK_DATA_TTL_SECONDS,
+    ) -> Dict[UUID, Dict[str, Any]]:
+        """
+        Return data for every partner, loading only the ones not cached.
+
+        One MGET for the lookup and one pipelined round trip to store misses.
+
+        Args:
+            kind: Data kind (e.g. "buyer", "seller", "trade_history")
+            partner_ids: Partners to fetch
+            load: Loads data for a set of partners, keyed by partner ID
+            ttl_seconds: Expiry of newly cached entries
+
+        Returns:
+            Data keyed by partner ID
+        """
+        partner_ids = list(partner_ids)
+        if not partner_ids:
+            return {}
+        if not self.redis:
+            return await load(set(partner_ids))
+
+        found: Dict[UUID, Dict[str, Any]] = {}
+        try:
+            cached = await self.redis.mget([self._key(partner_id, kind) for partner_id in partner_ids])
+            for partner_id, raw in zip(partner_ids, cached):
+                if raw:
+                    found[partner_id] = _loads(raw)
+        except redis.RedisError as e:
+            logger.warning(f"Partner risk data cache read failed ({kind}): {e}")
+
+        missing = {partner_id for partner_id in partner_ids if partner_id not in found}
+        if not missing:
+            return found
+
+        loaded = await load(missing)
+        try:
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for partner_id, data in loaded.items():
+                    key = self._key(partner_id, kind)
+                    pipe.setex(key, ttl_seconds, _dumps(data))
+                    track_partner_key(pipe, partner_id, key)
+                await pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Partner risk data cache write failed ({kind}): {e}")
+
+        found.update(loaded)
+        return found
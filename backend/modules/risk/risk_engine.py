@@ -35,6 +35,19 @@ from backend.modules.risk.exceptions import (
 )
 
 
+def _utilization_percent(current_exposure: Decimal, credit_limit: Decimal) -> float:
+    """
+    Exposure as a percentage of the credit limit.
+    
+    Only scored and reported (schemas type it as float), so it is computed
+    in float; the amounts themselves stay Decimal wherever they are stored
+    or settled.
+    """
+    if credit_limit <= 0:
+        return 0.0
+    return float(current_exposure) / float(credit_limit) * 100
+
+
 class RiskEngine:
     """
     Centralized Risk Assessment Engine
@@ -55,6 +68,17 @@ class RiskEngine:
     RATING_WEIGHT = 0.30  # 30%
     PERFORMANCE_WEIGHT = 0.30  # 30%
     
+    # Rating cut-offs (0.00-5.00) and credit multipliers. Built once here:
+    # parsing a Decimal costs more than the comparison that uses it
+    VERY_LOW_RATING = Decimal("2.0")
+    LOW_RATING = Decimal("3.0")
+    MODERATE_RATING = Decimal("4.0")
+    EXCELLENT_RATING = Decimal("4.5")
+    CREDIT_BUFFER = Decimal("1.2")  # Remaining credit should cover trade value + 20%
+    EXCELLENT_LIMIT_FACTOR = Decimal("1.2")
+    GOOD_LIMIT_FACTOR = Decimal("1.1")
+    POOR_LIMIT_FACTOR = Decimal("0.75")
+    
     def __init__(self, db: AsyncSession):
         self.db = db
     
@@ -257,16 +281,16 @@ class RiskEngine:
                 f"Insufficient credit limit (need: {estimated_value}, "
                 f"available: {credit_remaining})"
             )
-        elif credit_remaining < estimated_value * Decimal("1.2"):
+        elif credit_remaining < estimated_value * self.CREDIT_BUFFER:
             # Less than 20% buffer
             risk_score -= 20
             risk_factors.append("Low credit limit buffer (<20%)")
         
         # Factor 2: Buyer rating (30 points)
-        if buyer_rating < Decimal("3.0"):
+        if buyer_rating < self.LOW_RATING:
             risk_score -= 30
             risk_factors.append(f"Low buyer rating (<3.0): {buyer_rating}")
-        elif buyer_rating < Decimal("4.0"):
+        elif buyer_rating < self.MODERATE_RATING:
             risk_score -= 15
             risk_factors.append(f"Moderate buyer rating (<4.0): {buyer_rating}")
         
@@ -294,9 +318,7 @@ class RiskEngine:
         risk_assessment = requirement.update_risk_precheck(
             credit_limit_remaining=credit_remaining,
             rating_score=buyer_rating,
-            payment_performance_score=buyer_payment_performance,
-            current_exposure=buyer_current_exposure,
-            user_id=user_id
+            payment_performance_score=buyer_payment_performance
         )
         
         return {
@@ -354,15 +376,15 @@ class RiskEngine:
                 f"Insufficient seller credit limit (need: {estimated_value}, "
                 f"available: {credit_remaining})"
             )
-        elif credit_remaining < estimated_value * Decimal("1.2"):
+        elif credit_remaining < estimated_value * self.CREDIT_BUFFER:
             risk_score -= 20
             risk_factors.append("Low seller credit limit buffer (<20%)")
         
         # Factor 2: Seller rating (30 points)
-        if seller_rating < Decimal("3.0"):
+        if seller_rating < self.LOW_RATING:
             risk_score -= 30
             risk_factors.append(f"Low seller rating (<3.0): {seller_rating}")
-        elif seller_rating < Decimal("4.0"):
+        elif seller_rating < self.MODERATE_RATING:
             risk_score -= 15
             risk_factors.append(f"Moderate seller rating (<4.0): {seller_rating}")
         
@@ -467,7 +489,7 @@ class RiskEngine:
         # ====================================================================
         party_link_check = await self.check_party_links(
             buyer_partner_id=requirement.buyer_partner_id,
-            seller_partner_id=availability.seller_id
+            seller_partner_id=availability.seller_partner_id
         )
         
         # ====================================================================
@@ -591,7 +613,7 @@ class RiskEngine:
         risk_factors = []
         
         # Factor 1: Credit utilization (25 points)
-        credit_utilization = (current_exposure / credit_limit * 100) if credit_limit > 0 else 0
+        credit_utilization = _utilization_percent(current_exposure, credit_limit)
         
         if credit_utilization > 90:
             risk_score -= 25
@@ -601,13 +623,13 @@ class RiskEngine:
             risk_factors.append(f"Moderate credit utilization ({credit_utilization}%)")
         
         # Factor 2: Rating (25 points)
-        if rating < Decimal("2.0"):
+        if rating < self.VERY_LOW_RATING:
             risk_score -= 25
             risk_factors.append(f"Very low rating (<2.0): {rating}")
-        elif rating < Decimal("3.0"):
+        elif rating < self.LOW_RATING:
             risk_score -= 15
             risk_factors.append(f"Low rating (<3.0): {rating}")
-        elif rating < Decimal("4.0"):
+        elif rating < self.MODERATE_RATING:
             risk_score -= 8
             risk_factors.append(f"Moderate rating (<4.0): {rating}")
         
@@ -687,7 +709,7 @@ class RiskEngine:
         Returns:
             Dict with monitoring status and alerts
         """
-        utilization = (current_exposure / credit_limit * 100) if credit_limit > 0 else 0
+        utilization = _utilization_percent(current_exposure, credit_limit)
         
         alerts = []
         alert_level = "GREEN"
@@ -775,12 +797,12 @@ class RiskEngine:
         - Average partners: No change
         - Poor partners (rating < 3.0 or performance < 60): -25%
         """
-        if rating >= Decimal("4.5") and performance_score >= 90:
-            return current_limit * Decimal("1.2")
-        elif rating >= Decimal("4.0") and performance_score >= 80:
-            return current_limit * Decimal("1.1")
-        elif rating < Decimal("3.0") or performance_score < 60:
-            return current_limit * Decimal("0.75")
+        if rating >= self.EXCELLENT_RATING and performance_score >= 90:
+            return current_limit * self.EXCELLENT_LIMIT_FACTOR
+        elif rating >= self.MODERATE_RATING and performance_score >= 80:
+            return current_limit * self.GOOD_LIMIT_FACTOR
+        elif rating < self.LOW_RATING or performance_score < 60:
+            return current_limit * self.POOR_LIMIT_FACTOR
         else:
             return current_limit
     
@@ -7,22 +7,54 @@ Integrates with:
 - WebSocket manager (risk alert broadcasting)
 """
 
+import asyncio
 import json
+import logging
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
-from uuid import UUID
+from typing import Any, Coroutine, Dict, List, Optional, Set
+from uuid import UUID, uuid5
 
+import orjson
 import redis.asyncio as redis
 from sqlalchemy import select, func
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from backend.core.outbox import OutboxRepository
+from backend.db.async_session import AsyncSessionLocal
+from backend.modules.risk.partner_data_cache import PartnerRiskDataCache, TRADE_HISTORY_TTL_SECONDS
 from backend.modules.risk.risk_engine import RiskEngine
 from backend.modules.trade_desk.models.requirement import Requirement
 from backend.modules.trade_desk.models.availability import Availability
 from backend.core.websocket.manager import ConnectionManager
 from backend.ai.orchestrators.factory import get_orchestrator
 
+logger = logging.getLogger(__name__)
+
+RISK_EVENTS_TOPIC = "risk-events"
+
+# Broadcasts in flight; the event loop only keeps weak references to tasks
+_broadcast_tasks: Set[asyncio.Task] = set()
+
+# Assessments run at once by the batch methods; each holds its own pooled
+# connection, so keep this well under DB_POOL_SIZE + DB_MAX_OVERFLOW
+BATCH_ASSESSMENT_CONCURRENCY = 16
+
+
+def trade_aggregate_id(requirement_id: UUID, availability_id: UUID) -> UUID:
+    """Stable outbox aggregate ID for a requirement/availability pair."""
+    return uuid5(requirement_id, str(availability_id))
+
+
+def _json_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Outbox payloads are JSONB; amounts (Decimal) are stored as strings."""
+    return orjson.loads(orjson.dumps(payload, default=str))
+
+
+def _broadcast_done(task: asyncio.Task) -> None:
+    _broadcast_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Risk alert broadcast failed", exc_info=task.exception())
+
 
 class RiskService:
     """Service layer for Risk Engine operations"""
@@ -31,13 +63,18 @@ class RiskService:
         self,
         db: AsyncSession,
         ws_manager: Optional[ConnectionManager] = None,
-        redis_client: Optional[redis.Redis] = None
+        redis_client: Optional[redis.Redis] = None,
+        session_factory: async_sessionmaker = AsyncSessionLocal
     ):
         self.db = db
         self.ws_manager = ws_manager
         self.redis = redis_client
+        # Sessions for concurrent batch assessments (self.db must not be
+        # shared between tasks)
+        self.session_factory = session_factory
         self.outbox_repo = OutboxRepository(db)
         self.risk_engine = RiskEngine(db)
+        self.partner_data_cache = PartnerRiskDataCache(redis_client)
         
         # AI orchestrator for AI-enhanced risk scoring
         try:
@@ -83,6 +120,27 @@ class RiskService:
         # Get buyer data (from partner module)
         buyer_data = await self._get_buyer_data(requirement.buyer_partner_id)
         
+        assessment = await self._assess_requirement_core(requirement, buyer_data, user_id)
+        
+        # Cache result for idempotency
+        if idempotency_key and self.redis:
+            await self.redis.setex(
+                f"idempotency:{idempotency_key}",
+                86400,  # 24 hours
+                json.dumps(assessment, default=str)
+            )
+        
+        return assessment
+    
+    async def _assess_requirement_core(
+        self,
+        requirement: Requirement,
+        buyer_data: Dict[str, Any],
+        user_id: UUID
+    ) -> Dict[str, Any]:
+        """Assess a loaded requirement, alert, emit the outbox event and commit."""
+        requirement_id = requirement.id
+        
         # Perform risk assessment
         assessment = await self.risk_engine.assess_buyer_risk(
             requirement=requirement,
@@ -93,39 +151,32 @@ class RiskService:
             user_id=user_id
         )
         
-        # Broadcast risk alert if FAIL
-        if assessment["status"] == "FAIL" and self.ws_manager:
-            await self._broadcast_risk_alert(
-                entity_type="requirement",
-                entity_id=requirement_id,
-                assessment=assessment
-            )
-        
         # Emit event to outbox (transactional)
         await self.outbox_repo.add_event(
             event_type="risk.requirement_assessed",
             aggregate_type="requirement",
             aggregate_id=str(requirement_id),
-            payload={
+            payload=_json_payload({
                 "requirement_id": str(requirement_id),
                 "buyer_partner_id": str(requirement.buyer_partner_id),
                 "assessment": assessment,
                 "user_id": str(user_id),
                 "status": assessment["status"]
-            },
-            user_id=user_id
+            }),
+            topic_name=RISK_EVENTS_TOPIC,
+            metadata={"user_id": str(user_id)}
         )
         
         # Commit changes to database
         await self.db.commit()
         
-        # Cache result for idempotency
-        if idempotency_key and self.redis:
-            await self.redis.setex(
-                f"idempotency:{idempotency_key}",
-                86400,  # 24 hours
-                json.dumps(assessment)
-            )
+        # Broadcast risk alert if FAIL (after commit, without waiting for clients)
+        if assessment["status"] == "FAIL" and self.ws_manager:
+            self._schedule_broadcast(self._broadcast_risk_alert(
+                entity_type="requirement",
+                entity_id=requirement_id,
+                assessment=assessment
+            ))
         
         return assessment
     
@@ -165,7 +216,28 @@ class RiskService:
             raise ValueError(f"Availability {availability_id} not found")
         
         # Get seller data (from partner module)
-        seller_data = await self._get_seller_data(availability.seller_id)
+        seller_data = await self._get_seller_data(availability.seller_partner_id)
+        
+        assessment = await self._assess_availability_core(availability, seller_data, user_id)
+        
+        # Cache for idempotency
+        if idempotency_key and self.redis:
+            await self.redis.setex(
+                f"idempotency:{idempotency_key}",
+                86400,
+                json.dumps(assessment, default=str)
+            )
+        
+        return assessment
+    
+    async def _assess_availability_core(
+        self,
+        availability: Availability,
+        seller_data: Dict[str, Any],
+        user_id: UUID
+    ) -> Dict[str, Any]:
+        """Assess a loaded availability, alert, emit the outbox event and commit."""
+        availability_id = availability.id
         
         # Perform risk assessment
         assessment = await self.risk_engine.assess_seller_risk(
@@ -177,39 +249,32 @@ class RiskService:
             user_id=user_id
         )
         
-        # Broadcast risk alert if FAIL
-        if assessment["status"] == "FAIL" and self.ws_manager:
-            await self._broadcast_risk_alert(
-                entity_type="availability",
-                entity_id=availability_id,
-                assessment=assessment
-            )
-        
         # Emit event to outbox
         await self.outbox_repo.add_event(
             event_type="risk.availability_assessed",
             aggregate_type="availability",
             aggregate_id=str(availability_id),
-            payload={
+            payload=_json_payload({
                 "availability_id": str(availability_id),
-                "seller_id": str(availability.seller_id),
+                "seller_id": str(availability.seller_partner_id),
                 "assessment": assessment,
                 "user_id": str(user_id),
                 "status": assessment["status"]
-            },
-            user_id=user_id
+            }),
+            topic_name=RISK_EVENTS_TOPIC,
+            metadata={"user_id": str(user_id)}
         )
         
         # Commit changes to database
         await self.db.commit()
         
-        # Cache for idempotency
-        if idempotency_key and self.redis:
-            await self.redis.setex(
-                f"idempotency:{idempotency_key}",
-                86400,
-                json.dumps(assessment)
-            )
+        # Broadcast risk alert if FAIL (after commit, without waiting for clients)
+        if assessment["status"] == "FAIL" and self.ws_manager:
+            self._schedule_broadcast(self._broadcast_risk_alert(
+                entity_type="availability",
+                entity_id=availability_id,
+                assessment=assessment
+            ))
         
         return assessment
     
@@ -245,15 +310,13 @@ class RiskService:
             cached = await self.redis.get(f"idempotency:{idempotency_key}")
             if cached:
                 return json.loads(cached)
-        # Get requirement and availability
+        # Get requirement and availability. Both are read in self.db: the
+        # engine updates their prechecks and the commit below must see it.
         req_stmt = select(Requirement).where(Requirement.id == requirement_id)
         avail_stmt = select(Availability).where(Availability.id == availability_id)
         
-        req_result = await self.db.execute(req_stmt)
-        avail_result = await self.db.execute(avail_stmt)
-        
-        requirement = req_result.scalar_one_or_none()
-        availability = avail_result.scalar_one_or_none()
+        requirement = (await self.db.execute(req_stmt)).scalar_one_or_none()
+        availability = (await self.db.execute(avail_stmt)).scalar_one_or_none()
         
         if not requirement:
             raise ValueError(f"Requirement {requirement_id} not found")
@@ -261,8 +324,10 @@ class RiskService:
             raise ValueError(f"Availability {availability_id} not found")
         
         # Get buyer and seller data
-        buyer_data = await self._get_buyer_data(requirement.buyer_partner_id)
-        seller_data = await self._get_seller_data(availability.seller_id)
+        buyer_data, seller_data = await asyncio.gather(
+            self._get_buyer_data(requirement.buyer_partner_id),
+            self._get_seller_data(availability.seller_partner_id)
+        )
         
         # Perform bilateral risk assessment
         assessment = await self.risk_engine.assess_trade_risk(
@@ -275,20 +340,12 @@ class RiskService:
             user_id=user_id
         )
         
-        # Broadcast if high risk
-        if assessment["overall_status"] == "FAIL" and self.ws_manager:
-            await self._broadcast_trade_risk_alert(
-                requirement_id=requirement_id,
-                availability_id=availability_id,
-                assessment=assessment
-            )
-        
         # Emit event to outbox
         await self.outbox_repo.add_event(
             event_type="risk.trade_assessed",
             aggregate_type="trade",
-            aggregate_id=f"{requirement_id}_{availability_id}",
-            payload={
+            aggregate_id=trade_aggregate_id(requirement_id, availability_id),
+            payload=_json_payload({
                 "requirement_id": str(requirement_id),
                 "availability_id": str(availability_id),
                 "trade_quantity": str(trade_quantity),
@@ -296,19 +353,28 @@ class RiskService:
                 "assessment": assessment,
                 "user_id": str(user_id),
                 "overall_status": assessment["overall_status"]
-            },
-            user_id=user_id
+            }),
+            topic_name=RISK_EVENTS_TOPIC,
+            metadata={"user_id": str(user_id)}
         )
         
         # Commit changes
         await self.db.commit()
         
+        # Broadcast if high risk (after commit, without waiting for clients)
+        if assessment["overall_status"] == "FAIL" and self.ws_manager:
+            self._schedule_broadcast(self._broadcast_trade_risk_alert(
+                requirement_id=requirement_id,
+                availability_id=availability_id,
+                assessment=assessment
+            ))
+        
         # Cache for idempotency
         if idempotency_key and self.redis:
             await self.redis.setex(
                 f"idempotency:{idempotency_key}",
                 86400,
-                json.dumps(assessment)
+                json.dumps(assessment, default=str)
             )
         
         return assessment
@@ -367,11 +433,12 @@ class RiskService:
             event_type="risk.partner_assessed",
             aggregate_type="partner",
             aggregate_id=str(partner_id),
-            payload={
+            payload=_json_payload({
                 "partner_id": str(partner_id),
                 "partner_type": partner_type,
                 "assessment": assessment
-            }
+            }),
+            topic_name=RISK_EVENTS_TOPIC
         )
         
         # Commit
@@ -382,7 +449,7 @@ class RiskService:
             await self.redis.setex(
                 f"idempotency:{idempotency_key}",
                 86400,
-                json.dumps(assessment)
+                json.dumps(assessment, default=str)
             )
         
         return assessment
@@ -421,34 +488,35 @@ class RiskService:
             credit_limit=partner_data["credit_limit"]
         )
         
-        # Broadcast alerts if RED or YELLOW
-        if monitoring["alert_level"] in ["RED", "YELLOW"] and self.ws_manager:
-            await self._broadcast_exposure_alert(
-                partner_id=partner_id,
-                monitoring=monitoring
-            )
-        
         # Emit event
         await self.outbox_repo.add_event(
             event_type="risk.exposure_monitored",
             aggregate_type="partner",
             aggregate_id=str(partner_id),
-            payload={
+            payload=_json_payload({
                 "partner_id": str(partner_id),
                 "monitoring": monitoring,
                 "alert_level": monitoring["alert_level"]
-            }
+            }),
+            topic_name=RISK_EVENTS_TOPIC
         )
         
         # Commit
         await self.db.commit()
         
+        # Broadcast alerts if RED or YELLOW (after commit, without waiting for clients)
+        if monitoring["alert_level"] in ["RED", "YELLOW"] and self.ws_manager:
+            self._schedule_broadcast(self._broadcast_exposure_alert(
+                partner_id=partner_id,
+                monitoring=monitoring
+            ))
+        
         # Cache for idempotency
         if idempotency_key and self.redis:
             await self.redis.setex(
                 f"idempotency:{idempotency_key}",
                 86400,
-                json.dumps(monitoring)
+                json.dumps(monitoring, default=str)
             )
         
         return monitoring
@@ -461,57 +529,86 @@ class RiskService:
         self,
         user_id: UUID
     ) -> List[Dict[str, Any]]:
-        """Assess risk for all active requirements."""
+        """
+        Assess risk for all active requirements.
+        
+        Requirements and their buyers' data are loaded once up front; up to
+        BATCH_ASSESSMENT_CONCURRENCY requirements are then assessed at once,
+        each in its own session and transaction. Each row is merged into its
+        task's session (without a reload), so the risk precheck fields the
+        engine sets are written by that task's commit.
+        """
         stmt = select(Requirement).where(Requirement.status == "ACTIVE")
         result = await self.db.execute(stmt)
         requirements = result.scalars().all()
         
-        assessments = []
-        for requirement in requirements:
-            try:
-                assessment = await self.assess_requirement_risk(
-                    requirement_id=requirement.id,
-                    user_id=user_id
-                )
-                assessments.append({
-                    "requirement_id": str(requirement.id),
-                    "assessment": assessment
-                })
-            except Exception as e:
-                assessments.append({
-                    "requirement_id": str(requirement.id),
-                    "error": str(e)
-                })
-        
-        return assessments
+        buyers = await self._get_buyers_bulk({r.buyer_partner_id for r in requirements})
+        slots = asyncio.Semaphore(BATCH_ASSESSMENT_CONCURRENCY)
+        
+        async def assess_one(requirement: Requirement) -> Dict[str, Any]:
+            async with slots, self.session_factory() as session:
+                try:
+                    assessment = await self._for_session(session)._assess_requirement_core(
+                        requirement=await session.merge(requirement, load=False),
+                        buyer_data=buyers[requirement.buyer_partner_id],
+                        user_id=user_id
+                    )
+                    return {
+                        "requirement_id": str(requirement.id),
+                        "assessment": assessment
+                    }
+                except Exception as e:
+                    return {
+                        "requirement_id": str(requirement.id),
+                        "error": str(e)
+                    }
+        
+        return await asyncio.gather(*(assess_one(requirement) for requirement in requirements))
     
     async def assess_all_active_availabilities(
         self,
         user_id: UUID
     ) -> List[Dict[str, Any]]:
-        """Assess risk for all active availabilities."""
+        """
+        Assess risk for all active availabilities.
+        
+        Bulk-loaded and concurrent like assess_all_active_requirements.
+        """
         stmt = select(Availability).where(Availability.status == "ACTIVE")
         result = await self.db.execute(stmt)
         availabilities = result.scalars().all()
         
-        assessments = []
-        for availability in availabilities:
-            try:
-                assessment = await self.assess_availability_risk(
-                    availability_id=availability.id,
-                    user_id=user_id
-                )
-                assessments.append({
-                    "availability_id": str(availability.id),
-                    "assessment": assessment
-                })
-            except Exception as e:
-                assessments.append({
-                    "availability_id": str(availability.id),
-                    "error": str(e)
-                })
-        
-        return assessments
+        sellers = await self._get_sellers_bulk({a.seller_partner_id for a in availabilities})
+        slots = asyncio.Semaphore(BATCH_ASSESSMENT_CONCURRENCY)
+        
+        async def assess_one(availability: Availability) -> Dict[str, Any]:
+            async with slots, self.session_factory() as session:
+                try:
+                    assessment = await self._for_session(session)._assess_availability_core(
+                        availability=await session.merge(availability, load=False),
+                        seller_data=sellers[availability.seller_partner_id],
+                        user_id=user_id
+                    )
+                    return {
+                        "availability_id": str(availability.id),
+                        "assessment": assessment
+                    }
+                except Exception as e:
+                    return {
+                        "availability_id": str(availability.id),
+                        "error": str(e)
+                    }
+        
+        return await asyncio.gather(*(assess_one(availability) for availability in availabilities))
+    
+    def _for_session(self, session: AsyncSession) -> "RiskService":
+        """A RiskService sharing this one's clients but using another session."""
+        return RiskService(
+            db=session,
+            ws_manager=self.ws_manager,
+            redis_client=self.redis,
+            session_factory=self.session_factory
+        )
     
     # ============================================================================
     # PRIVATE HELPER METHODS
@@ -519,36 +616,73 @@ class RiskService:
     
     async def _get_buyer_data(self, buyer_id: UUID) -> Dict[str, Any]:
         """Get buyer credit and performance data."""
-        # TODO: Integrate with Partner module
+        return (await self._get_buyers_bulk({buyer_id}))[buyer_id]
+    
+    async def _get_buyers_bulk(self, buyer_ids: Set[UUID]) -> Dict[UUID, Dict[str, Any]]:
+        """Get credit and performance data for many buyers, keyed by buyer ID (cached)."""
+        return await self.partner_data_cache.get_or_load_many("buyer", buyer_ids, self._load_buyers)
+    
+    async def _load_buyers(self, buyer_ids: Set[UUID]) -> Dict[UUID, Dict[str, Any]]:
+        # TODO: Integrate with Partner module (one query with
+        # BusinessPartner.id.in_(buyer_ids) for the whole set)
         # For now, return mock data
         return {
-            "credit_limit": Decimal("100000000"),
-            "current_exposure": Decimal("20000000"),
-            "rating": Decimal("4.2"),
-            "payment_performance": 85
+            buyer_id: {
+                "credit_limit": Decimal("100000000"),
+                "current_exposure": Decimal("20000000"),
+                "rating": Decimal("4.2"),
+                "payment_performance": 85
+            }
+            for buyer_id in buyer_ids
         }
     
     async def _get_seller_data(self, seller_id: UUID) -> Dict[str, Any]:
         """Get seller credit and performance data."""
-        # TODO: Integrate with Partner module
+        return (await self._get_sellers_bulk({seller_id}))[seller_id]
+    
+    async def _get_sellers_bulk(self, seller_ids: Set[UUID]) -> Dict[UUID, Dict[str, Any]]:
+        """Get credit and performance data for many sellers, keyed by seller ID (cached)."""
+        return await self.partner_data_cache.get_or_load_many("seller", seller_ids, self._load_sellers)
+    
+    async def _load_sellers(self, seller_ids: Set[UUID]) -> Dict[UUID, Dict[str, Any]]:
+        # TODO: Integrate with Partner module (one query with
+        # BusinessPartner.id.in_(seller_ids) for the whole set)
         # For now, return mock data
         return {
-            "credit_limit": Decimal("50000000"),
-            "current_exposure": Decimal("10000000"),
-            "rating": Decimal("4.5"),
-            "delivery_performance": 92
+            seller_id: {
+                "credit_limit": Decimal("50000000"),
+                "current_exposure": Decimal("10000000"),
+                "rating": Decimal("4.5"),
+                "delivery_performance": 92
+            }
+            for seller_id in seller_ids
         }
     
     async def _get_trade_history(self, partner_id: UUID) -> Dict[str, Any]:
-        """Get partner trade history."""
+        """Get partner trade history (cached)."""
+        history = await self.partner_data_cache.get_or_load_many(
+            "trade_history", {partner_id}, self._load_trade_history, TRADE_HISTORY_TTL_SECONDS
+        )
+        return history[partner_id]
+    
+    async def _load_trade_history(self, partner_ids: Set[UUID]) -> Dict[UUID, Dict[str, Any]]:
         # TODO: Integrate with Trade module
         # For now, return mock data
         return {
-            "total_trades": 150,
-            "dispute_count": 3,
-            "average_trade_value": Decimal("500000")
+            partner_id: {
+                "total_trades": 150,
+                "dispute_count": 3,
+                "average_trade_value": Decimal("500000")
+            }
+            for partner_id in partner_ids
         }
     
+    def _schedule_broadcast(self, broadcast: Coroutine[Any, Any, None]) -> None:
+        """Run a broadcast in the background; failures are logged, not raised."""
+        task = asyncio.create_task(broadcast)
+        _broadcast_tasks.add(task)
+        task.add_done_callback(_broadcast_done)
+    
     async def _broadcast_risk_alert(
         self,
         entity_type: str,
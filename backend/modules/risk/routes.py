@@ -35,7 +35,7 @@ from backend.modules.risk.schemas import (
     BatchRiskAssessmentResponse,
     CircularTradingCheckRequest,
     CircularTradingCheckResponse,
-    ErrorResponse,
+    ErrorResponseV1,
     ExposureMonitoringRequest,
     ExposureMonitoringResponse,
     MLModelTrainRequest,
@@ -78,7 +78,7 @@ def get_ml_model() -> MLRiskModel:
     response_model=RiskAssessmentResponse,
     summary="Assess Requirement Risk",
     description="Perform risk assessment for a buyer requirement. Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
+    responses={404: {"model": ErrorResponseV1}, 500: {"model": ErrorResponseV1}}
 )
 async def assess_requirement_risk(
     request: RequirementRiskAssessmentRequest,
@@ -116,7 +116,7 @@ async def assess_requirement_risk(
     response_model=RiskAssessmentResponse,
     summary="Assess Availability Risk",
     description="Perform risk assessment for a seller availability. Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
+    responses={404: {"model": ErrorResponseV1}, 500: {"model": ErrorResponseV1}}
 )
 async def assess_availability_risk(
     request: AvailabilityRiskAssessmentRequest,
@@ -154,7 +154,7 @@ async def assess_availability_risk(
     response_model=TradeRiskAssessmentResponse,
     summary="Assess Bilateral Trade Risk",
     description="Perform comprehensive bilateral risk assessment for a proposed trade. Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
+    responses={404: {"model": ErrorResponseV1}, 500: {"model": ErrorResponseV1}}
 )
 async def assess_trade_risk(
     request: TradeRiskAssessmentRequest,
@@ -196,7 +196,7 @@ async def assess_trade_risk(
     response_model=RiskAssessmentResponse,
     summary="Assess Partner Counterparty Risk",
     description="Assess overall counterparty risk for a partner. Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}}
+    responses={404: {"model": ErrorResponseV1}, 500: {"model": ErrorResponseV1}}
 )
 async def assess_partner_risk(
     request: PartnerRiskAssessmentRequest,
@@ -237,7 +237,7 @@ async def assess_partner_risk(
     response_model=PartyLinksCheckResponse,
     summary="Check Party Links",
     description="Validate for related party transactions (PAN/GST/mobile/email matching). Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={500: {"model": ErrorResponse}}
+    responses={500: {"model": ErrorResponseV1}}
 )
 async def check_party_links(
     request: PartyLinksCheckRequest,
@@ -275,7 +275,7 @@ async def check_party_links(
     response_model=CircularTradingCheckResponse,
     summary="Check Circular Trading",
     description="Detect same-day circular trading (wash trading prevention). Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={500: {"model": ErrorResponse}}
+    responses={500: {"model": ErrorResponseV1}}
 )
 async def check_circular_trading(
     request: CircularTradingCheckRequest,
@@ -314,7 +314,7 @@ async def check_circular_trading(
     response_model=RoleRestrictionCheckResponse,
     summary="Validate Role Restrictions",
     description="Check if partner role allows transaction type. Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={500: {"model": ErrorResponse}}
+    responses={500: {"model": ErrorResponseV1}}
 )
 async def validate_role_restriction(
     request: RoleRestrictionCheckRequest,
@@ -355,7 +355,7 @@ async def validate_role_restriction(
     response_model=MLPredictionResponse,
     summary="ML Payment Default Prediction",
     description="Predict payment default risk using ML model. Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={500: {"model": ErrorResponse}}
+    responses={500: {"model": ErrorResponseV1}}
 )
 async def predict_payment_default(
     request: MLPredictionRequest,
@@ -401,7 +401,7 @@ async def predict_payment_default(
     response_model=MLModelTrainResponse,
     summary="Train ML Risk Models",
     description="Train ML models with synthetic or real data. Requires ADMIN_MANAGE_USERS capability.",
-    responses={500: {"model": ErrorResponse}}
+    responses={500: {"model": ErrorResponseV1}}
 )
 async def train_ml_models(
     request: MLModelTrainRequest,
@@ -453,7 +453,7 @@ async def train_ml_models(
 @router.post(
     "/ml/train/all",
     summary="Train All ML Models",
-    description="Train all 4 ML models (RandomForest, XGBoost, Credit Limit, Fraud Detector)",
+    description="Train all 4 ML models (HistGradientBoosting, XGBoost, Credit Limit, Fraud Detector)",
 )
 async def train_all_ml_models(
     num_samples: int = 10000,
@@ -557,7 +557,7 @@ async def get_ml_models_status(
     response_model=ExposureMonitoringResponse,
     summary="Monitor Partner Exposure",
     description="Monitor partner credit exposure and generate alerts",
-    responses={500: {"model": ErrorResponse}}
+    responses={500: {"model": ErrorResponseV1}}
 )
 async def monitor_partner_exposure(
     request: ExposureMonitoringRequest,
@@ -595,7 +595,7 @@ async def monitor_partner_exposure(
     response_model=BatchRiskAssessmentResponse,
     summary="Batch Assess All Active Requirements",
     description="Assess risk for all active requirements in one operation. Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={500: {"model": ErrorResponse}}
+    responses={500: {"model": ErrorResponseV1}}
 )
 async def batch_assess_requirements(
     current_user=Depends(get_current_user),
@@ -642,7 +642,7 @@ async def batch_assess_requirements(
     response_model=BatchRiskAssessmentResponse,
     summary="Batch Assess All Active Availabilities",
     description="Assess risk for all active availabilities in one operation. Requires ADMIN_VIEW_ALL_DATA capability.",
-    responses={500: {"model": ErrorResponse}}
+    responses={500: {"model": ErrorResponseV1}}
 )
 async def batch_assess_availabilities(
     current_user=Depends(get_current_user),
@@ -11,7 +11,7 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator
 
-from backend.modules.common.schemas.responses import ErrorResponse
+from backend.modules.common.schemas.responses import ErrorResponseV1
 
 
 # =============================================================================
@@ -337,4 +337,4 @@ class BatchRiskAssessmentResponse(BaseModel):
 # =============================================================================
 # ERROR SCHEMAS
 # =============================================================================
-# ErrorResponse imported from modules.common.schemas.responses
+# ErrorResponseV1 imported from modules.common.schemas.responses
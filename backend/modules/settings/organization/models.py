@@ -9,9 +9,12 @@ from sqlalchemy import (
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
+    Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import relationship
@@ -26,17 +29,17 @@ class Organization(Base, EventMixin):
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, unique=True)
-    legal_name = Column(String(255), nullable=True)
+    legal_name = Column(Text, nullable=True)
     type = Column(String(64), nullable=True)
     CIN = Column(String(21), nullable=True)
     PAN = Column(String(10), nullable=True)
     base_currency = Column(String(3), nullable=False, default="INR")
-    address_line1 = Column(String(255), nullable=True)
-    address_line2 = Column(String(255), nullable=True)
-    city = Column(String(128), nullable=True)
-    state = Column(String(128), nullable=True)
+    address_line1 = Column(Text, nullable=True)
+    address_line2 = Column(Text, nullable=True)
+    city = Column(Text, nullable=True)
+    state = Column(Text, nullable=True)
     pincode = Column(String(16), nullable=True)
-    contact_email = Column(String(255), nullable=True)
+    contact_email = Column(Text, nullable=True)
     contact_phone = Column(String(32), nullable=True)
     is_active = Column(Boolean, nullable=False, default=True)
 
@@ -49,22 +52,25 @@ class Organization(Base, EventMixin):
     fx_enabled = Column(Boolean, nullable=False, default=False)
 
     # Branding
-    logo_url = Column(String(255), nullable=True)
+    logo_url = Column(Text, nullable=True)
     theme_color = Column(String(64), nullable=True)
-    invoice_footer = Column(String(1024), nullable=True)
-    digital_signature_url = Column(String(255), nullable=True)
+    invoice_footer = Column(Text, nullable=True)
+    digital_signature_url = Column(Text, nullable=True)
 
     # Tax settings
     tds_rate = Column(Integer, nullable=True)
     tcs_rate = Column(Integer, nullable=True)
-    audit_firm_name = Column(String(255), nullable=True)
-    audit_firm_email = Column(String(255), nullable=True)
+    audit_firm_name = Column(Text, nullable=True)
+    audit_firm_email = Column(Text, nullable=True)
     audit_firm_phone = Column(String(32), nullable=True)
     gst_audit_required = Column(Boolean, nullable=False, default=False)
 
     # Automation
     auto_invoice = Column(Boolean, nullable=False, default=False)
     auto_contract_number = Column(Boolean, nullable=False, default=False)
+    # Free-form overflow only. No key is read on a hot path today; once one is,
+    # promote it to a typed column (backfilled from extra_config->>'key') rather
+    # than querying into the JSONB on every config fetch.
     extra_config = Column(JSONB, nullable=False, default={})
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -78,12 +84,12 @@ class Organization(Base, EventMixin):
 class OrganizationGST(Base):
     __tablename__ = "organization_gst"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     gstin = Column(String(15), nullable=False, unique=True)
-    legal_name = Column(String(255), nullable=True)
-    address = Column(String(255), nullable=True)
-    state = Column(String(128), nullable=True)
+    legal_name = Column(Text, nullable=True)
+    address = Column(Text, nullable=True)
+    state = Column(Text, nullable=True)
     branch_code = Column(String(32), nullable=True)
     is_primary = Column(Boolean, nullable=False, default=False)
     is_active = Column(Boolean, nullable=False, default=True)
@@ -96,13 +102,13 @@ class OrganizationGST(Base):
 class OrganizationBankAccount(Base):
     __tablename__ = "organization_bank_accounts"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
-    account_holder = Column(String(255), nullable=False)
-    bank_name = Column(String(255), nullable=False)
+    account_holder = Column(Text, nullable=False)
+    bank_name = Column(Text, nullable=False)
     account_number = Column(String(64), nullable=False)
     ifsc = Column(String(11), nullable=True)
-    branch = Column(String(255), nullable=True)
+    branch = Column(Text, nullable=True)
     is_default = Column(Boolean, nullable=False, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -112,8 +118,13 @@ class OrganizationBankAccount(Base):
 
 class OrganizationFinancialYear(Base):
     __tablename__ = "organization_financial_years"
+    __table_args__ = (
+        # Years are created in date order, so BRIN ranges stay tight
+        Index("ix_organization_financial_years_start_date", "start_date", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+        Index("ix_organization_financial_years_end_date", "end_date", postgresql_using="brin", postgresql_with={"pages_per_range": 32}),
+    )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=False)
@@ -133,7 +144,7 @@ class OrganizationDocumentSeries(Base):
         UniqueConstraint("organization_id", "document_type", "financial_year_id", name="uq_org_doc_series"),
     )
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, server_default=text("gen_random_uuid()"))
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
     financial_year_id = Column(UUID(as_uuid=True), ForeignKey("organization_financial_years.id", ondelete="CASCADE"), nullable=False)
     document_type = Column(String(64), nullable=False)  # 'INVOICE', 'CONTRACT', etc.
@@ -141,7 +152,7 @@ class OrganizationDocumentSeries(Base):
     current_number = Column(Integer, nullable=False, default=1)
     reset_annually = Column(Boolean, nullable=False, default=True)
     is_active = Column(Boolean, nullable=False, default=True)
-    extra_config = Column(JSONB, nullable=False, default={})
+    extra_config = Column(JSONB, nullable=False, default={})  # overflow only, see Organization.extra_config
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
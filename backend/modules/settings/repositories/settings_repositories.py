@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from typing import Iterable, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.modules.settings.organization.models import Organization
@@ -17,6 +18,10 @@ from backend.modules.settings.models.settings_models import (
 )
 
 
+# Rows per COPY when seeding permissions
+COPY_BATCH_SIZE = 10_000
+
+
 class BaseRepo:
 	def __init__(self, db: AsyncSession) -> None:
 		self.db = db
@@ -180,26 +185,39 @@ class PermissionRepository(BaseRepo):
 		return result.scalar_one_or_none()
 
 	async def ensure_many(self, codes: Iterable[str]) -> list[Permission]:
-		result = await self.db.execute(select(Permission).where(Permission.code.in_(list(codes))))
-		existing = result.scalars().all()
-		existing_codes = {p.code for p in existing}
-		created: list[Permission] = []
-		for code in codes:
-			if code not in existing_codes:
-				p = Permission(code=code)
-				self.db.add(p)
-				created.append(p)
-		if created:
-			await self.db.flush()
-		return list(existing) + created
+		codes = list(dict.fromkeys(codes))
+		result = await self.db.execute(select(Permission.code).where(Permission.code.in_(codes)))
+		existing_codes = set(result.scalars().all())
+		missing = [code for code in codes if code not in existing_codes]
+		if missing:
+			await self._copy_codes(missing)
+		result = await self.db.execute(select(Permission).where(Permission.code.in_(codes)))
+		return list(result.scalars().all())
+
+	async def _copy_codes(self, codes: list[str]) -> None:
+		# COPY on the session's own asyncpg connection, so the rows are part of
+		# the caller's transaction; one round-trip per batch instead of per row.
+		conn = await self.db.connection()
+		raw = await conn.get_raw_connection()
+		# COPY bypasses the compiler, so honour a schema_translate_map by hand
+		schema_map = conn.sync_connection.get_execution_options().get("schema_translate_map") or {}
+		for start in range(0, len(codes), COPY_BATCH_SIZE):
+			batch = codes[start:start + COPY_BATCH_SIZE]
+			await raw.driver_connection.copy_records_to_table(
+				Permission.__tablename__,
+				records=[(uuid4(), code) for code in batch],
+				columns=["id", "code"],
+				schema_name=schema_map.get(Permission.__table__.schema),
+			)
 
 
 class RolePermissionRepository(BaseRepo):
 	async def ensure(self, role_id: UUID, permission_ids: Iterable[UUID]) -> None:
-		for pid in permission_ids:
-			rp = await self.db.get(RolePermission, {"role_id": role_id, "permission_id": pid})
-			if rp is None:
-				self.db.add(RolePermission(role_id=role_id, permission_id=pid))
+		# One INSERT ... VALUES (...), (...) ON CONFLICT DO NOTHING instead of a
+		# lookup and an insert per permission
+		rows = [{"role_id": role_id, "permission_id": pid} for pid in permission_ids]
+		if rows:
+			await self.db.execute(pg_insert(RolePermission).values(rows).on_conflict_do_nothing())
 
 
 class UserRoleRepository(BaseRepo):
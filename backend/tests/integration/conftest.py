@@ -53,6 +53,45 @@ def create_test_partner(partner_type="buyer", legal_name="Test Partner"):
     )
 
 
+def create_test_business_partner(legal_name="Test Partner", overrides: dict = None):
+    """
+    Helper to create a BusinessPartner classified by entity_class (CDPS).
+
+    Args:
+        legal_name: Legal name, also used as the bank account name
+        overrides: Optional dict to override defaults (entity_class, status, ...)
+
+    Returns:
+        BusinessPartner instance (not yet added to the session)
+    """
+    from backend.modules.partners.models import BusinessPartner
+
+    data = {
+        "id": uuid.uuid4(),
+        "entity_class": "business_entity",
+        "legal_name": legal_name,
+        "country": "India",
+        "primary_currency": "INR",
+        "bank_account_name": legal_name,
+        "bank_name": "HDFC Bank",
+        "bank_account_number": "1234567890",
+        "bank_routing_code": "HDFC0001234",
+        "primary_address": "123 Test Street",
+        "primary_city": "Mumbai",
+        "primary_postal_code": "400001",
+        "primary_country": "India",
+        "primary_contact_name": "Test Contact",
+        "primary_contact_email": "test@example.com",
+        "primary_contact_phone": "+919876543210",
+        "status": "active",
+    }
+
+    if overrides:
+        data.update(overrides)
+
+    return BusinessPartner(**data)
+
+
 async def create_test_requirement(
     db_session: AsyncSession,
     buyer_partner_id: uuid.UUID,
@@ -138,7 +177,7 @@ async def create_test_availability(
     
     Args:
         db_session: Async database session
-        seller_id: UUID of seller partner (NOT seller_partner_id!)
+        seller_id: UUID of seller partner (stored as seller_partner_id)
         commodity_id: UUID of commodity
         location_id: UUID of location (NOT pickup_location_id!)
         created_by: UUID of user creating availability (NOT created_by_user_id!)
@@ -153,11 +192,12 @@ async def create_test_availability(
     # Default data
     data = {
         "id": uuid.uuid4(),
-        "seller_id": seller_id,  # ⚠️ NOT seller_partner_id
+        "seller_partner_id": seller_id,
         "commodity_id": commodity_id,
         "location_id": location_id,  # ⚠️ NOT pickup_location_id
         "created_by": created_by,  # ⚠️ NOT created_by_user_id
         "total_quantity": Decimal("1000.00"),
+        "quantity_unit": "kg",
         "available_quantity": Decimal("1000.00"),
         "price_type": "FIXED",  # Required
         "base_price": Decimal("45.00"),
@@ -0,0 +1,70 @@
+"""
+Integration tests for the dictionary-encoded event store.
+
+events stores event_type and aggregate_type as SMALLINT ids into
+event_type_ref / aggregate_type_ref; EventStore registers a code the first
+time it is seen and Event.event_type / Event.aggregate_type read and filter
+by the code.
+"""
+
+import uuid
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.core.events.store import AggregateTypeRef, Event, EventStore, EventTypeRef
+from backend.modules.notifications.models.notification import Notification  # noqa: F401 (User.notifications)
+
+
+async def _append(store: EventStore, event_type: str, aggregate_id: uuid.UUID, aggregate_type: str) -> Event:
+    return await store.append(
+        event_type=event_type,
+        aggregate_id=aggregate_id,
+        aggregate_type=aggregate_type,
+        user_id=uuid.uuid4(),
+        data={"n": 1},
+    )
+
+
+class TestEventTypeLookup:
+    """Codes are stored once and read back as strings."""
+
+    @pytest.mark.asyncio
+    async def test_codes_are_registered_once(self, db_session):
+        store = EventStore(db_session)
+        event_type = f"it.{uuid.uuid4().hex[:8]}.created"
+        aggregate_type = f"it_{uuid.uuid4().hex[:8]}"
+
+        first = await _append(store, event_type, uuid.uuid4(), aggregate_type)
+        second = await _append(store, event_type, uuid.uuid4(), aggregate_type)
+
+        assert first.event_type_id == second.event_type_id
+        assert first.aggregate_type_id == second.aggregate_type_id
+        assert (first.event_type, first.aggregate_type) == (event_type, aggregate_type)
+        count = await db_session.scalar(
+            select(func.count()).select_from(EventTypeRef).where(EventTypeRef.code == event_type)
+        )
+        assert count == 1
+        assert await db_session.scalar(
+            select(AggregateTypeRef.code).where(AggregateTypeRef.id == first.aggregate_type_id)
+        ) == aggregate_type
+
+    @pytest.mark.asyncio
+    async def test_filters_by_code(self, db_session):
+        store = EventStore(db_session)
+        event_type = f"it.{uuid.uuid4().hex[:8]}.updated"
+        aggregate_id = uuid.uuid4()
+        await _append(store, event_type, aggregate_id, "it_partner")
+        await _append(store, f"{event_type}.other", aggregate_id, "it_vehicle")
+
+        by_type = await store.get_by_type(event_type)
+        assert [e.aggregate_id for e in by_type] == [aggregate_id]
+        assert by_type[0].event_type == event_type
+
+        by_aggregate = await store.get_by_aggregate(aggregate_id, "it_vehicle")
+        assert [e.event_type for e in by_aggregate] == [f"{event_type}.other"]
+        assert await store.count_by_aggregate(aggregate_id) == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_code_matches_nothing(self, db_session):
+        assert await EventStore(db_session).get_by_type(f"it.{uuid.uuid4().hex}") == []
@@ -0,0 +1,223 @@
+"""
+Integration tests for the partner batch writes.
+
+invite_employees and add_vehicles insert a whole batch with one statement
+and record the same events as their single-item counterparts; batch
+inserts return their rows in the order they were given;
+PartnerKYCRenewalRepository.complete_many completes renewals and extends
+their partners' KYC in one statement.
+"""
+
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import select
+
+from backend.core.events.emitter import EventEmitter
+from backend.core.events.store import Event
+from backend.modules.notifications.models.notification import Notification  # noqa: F401 (User.notifications)
+from backend.modules.partners.enums import KYCStatus
+from backend.modules.partners.models import (
+    BusinessPartner,
+    PartnerDocument,
+    PartnerEmployee,
+    PartnerKYCRenewal,
+    PartnerVehicle,
+)
+from backend.modules.partners.partner_services import PartnerService
+from backend.modules.partners.repositories import (
+    PartnerDocumentRepository,
+    PartnerKYCRenewalRepository,
+)
+from backend.tests.integration.conftest import create_test_business_partner
+
+
+def _partner(entity_class: str = "business_entity", **overrides) -> BusinessPartner:
+    return create_test_business_partner("Batch Partner Ltd", {
+        "entity_class": entity_class,
+        "status": "approved",
+        **overrides
+    })
+
+
+def _service(db_session, user_id: uuid.UUID, organization_id: uuid.UUID) -> PartnerService:
+    return PartnerService(
+        db=db_session,
+        event_emitter=EventEmitter(db_session),
+        current_user_id=user_id,
+        organization_id=organization_id
+    )
+
+
+async def _events(db_session, event_type: str, aggregate_ids) -> list:
+    result = await db_session.execute(
+        select(Event).where(Event.event_type == event_type, Event.aggregate_id.in_(aggregate_ids))
+    )
+    return list(result.scalars().all())
+
+
+class TestBatchInsert:
+    """Batch inserts create every row and an event per row."""
+
+    @pytest.mark.asyncio
+    async def test_invite_employees(self, db_session, seed_user):
+        partner = _partner(max_employees_allowed=5)
+        db_session.add(partner)
+        await db_session.flush()
+        service = _service(db_session, seed_user.id, seed_user.organization_id)
+
+        employees = await service.invite_employees(partner.id, [
+            {"employee_name": f"Employee {i}", "employee_email": f"e{i}@example.com", "employee_phone": f"+91980000000{i}"}
+            for i in range(3)
+        ])
+
+        assert [e.employee_email for e in employees] == [f"e{i}@example.com" for i in range(3)]
+        assert all(e.partner_id == partner.id and e.status == "invited" for e in employees)
+        saved = (await db_session.execute(
+            select(PartnerEmployee).where(PartnerEmployee.partner_id == partner.id)
+        )).scalars().all()
+        assert len(saved) == 3
+
+        events = await _events(db_session, "partner.employee.invited", [e.id for e in employees])
+        assert sorted(event.data["employee_email"] for event in events) == sorted(e.employee_email for e in employees)
+
+    @pytest.mark.asyncio
+    async def test_invite_employees_over_limit_inserts_nothing(self, db_session, seed_user):
+        partner = _partner(max_employees_allowed=2)
+        db_session.add(partner)
+        await db_session.flush()
+        service = _service(db_session, seed_user.id, seed_user.organization_id)
+
+        with pytest.raises(ValueError, match="allows 2 employees"):
+            await service.invite_employees(partner.id, [
+                {"employee_name": f"Employee {i}", "employee_email": f"e{i}@example.com", "employee_phone": "+919800000000"}
+                for i in range(3)
+            ])
+
+        saved = (await db_session.execute(
+            select(PartnerEmployee).where(PartnerEmployee.partner_id == partner.id)
+        )).scalars().all()
+        assert saved == []
+
+    @pytest.mark.asyncio
+    async def test_add_vehicles(self, db_session, seed_user):
+        partner = _partner(entity_class="service_provider")
+        db_session.add(partner)
+        await db_session.flush()
+        service = _service(db_session, seed_user.id, seed_user.organization_id)
+        numbers = [f"GJ03{uuid.uuid4().hex[:6].upper()}" for _ in range(2)]
+
+        vehicles = await service.add_vehicles(partner.id, [
+            {"vehicle_number": number, "vehicle_type": "truck", "capacity_tons": 20}
+            for number in numbers
+        ])
+
+        assert [v.vehicle_number for v in vehicles] == numbers
+        saved = (await db_session.execute(
+            select(PartnerVehicle).where(PartnerVehicle.partner_id == partner.id)
+        )).scalars().all()
+        assert sorted(v.vehicle_number for v in saved) == sorted(numbers)
+
+        events = await _events(db_session, "partner.vehicle.added", [v.id for v in vehicles])
+        assert sorted(event.data["registration_number"] for event in events) == sorted(numbers)
+        assert {event.data["partner_id"] for event in events} == {str(partner.id)}
+
+    @pytest.mark.asyncio
+    async def test_add_vehicles_requires_service_provider(self, db_session, seed_user):
+        partner = _partner(entity_class="business_entity")
+        db_session.add(partner)
+        await db_session.flush()
+        service = _service(db_session, seed_user.id, seed_user.organization_id)
+
+        with pytest.raises(ValueError, match="Only service provider"):
+            await service.add_vehicles(partner.id, [{"vehicle_number": "GJ03ZZ0001", "vehicle_type": "truck"}])
+
+    @pytest.mark.asyncio
+    async def test_document_ids_follow_row_order(self, db_session):
+        partner = _partner()
+        db_session.add(partner)
+        await db_session.flush()
+        document_types = ["pan_card", "gst_certificate", "bank_proof", "address_proof"]
+
+        document_ids = await PartnerDocumentRepository(db_session).create_many([
+            {
+                "partner_id": partner.id,
+                "document_type": document_type,
+                "country": "India",
+                "file_url": f"gs://documents/{document_type}.pdf",
+            }
+            for document_type in document_types
+        ])
+
+        documents = [await db_session.get(PartnerDocument, document_id) for document_id in document_ids]
+        assert [d.document_type for d in documents] == document_types
+
+
+
+class TestCompleteMany:
+    """complete_many completes renewals and renews their partners' KYC."""
+
+    @pytest.mark.asyncio
+    async def test_completes_renewals_and_extends_kyc(self, db_session):
+        partners = [_partner(kyc_status=KYCStatus.EXPIRED.value) for _ in range(2)]
+        untouched = _partner(kyc_status=KYCStatus.EXPIRED.value)
+        db_session.add_all([*partners, untouched])
+        await db_session.flush()
+        renewals = [
+            PartnerKYCRenewal(partner_id=partner.id, renewal_due_date=date.today())
+            for partner in [*partners, untouched]
+        ]
+        db_session.add_all(renewals)
+        await db_session.flush()
+        completed_by = uuid.uuid4()
+        document_ids = [uuid.uuid4(), uuid.uuid4()]
+
+        renewed = await PartnerKYCRenewalRepository(db_session).complete_many(
+            [(renewals[0].id, document_ids), (renewals[1].id, []), (uuid.uuid4(), [])],
+            completed_by
+        )
+
+        expiry = date.today() + timedelta(days=365)
+        assert sorted(renewed) == sorted((partner.id, expiry) for partner in partners)
+
+        for renewal in renewals:
+            await db_session.refresh(renewal)
+        assert [r.status for r in renewals] == ["completed", "completed", "pending"]
+        assert renewals[0].documents_verified == [str(document_id) for document_id in document_ids]
+        assert renewals[1].documents_verified == []
+        assert renewals[0].completed_by == completed_by
+
+        for partner in [*partners, untouched]:
+            await db_session.refresh(partner)
+        assert [p.kyc_status for p in partners] == [KYCStatus.VERIFIED.value] * 2
+        assert [p.kyc_expiry_date for p in partners] == [expiry] * 2
+        assert untouched.kyc_status == KYCStatus.EXPIRED.value
+
+    @pytest.mark.asyncio
+    async def test_retry_skips_completed_renewals(self, db_session):
+        partner = _partner(kyc_status=KYCStatus.EXPIRED.value)
+        db_session.add(partner)
+        await db_session.flush()
+        renewal = PartnerKYCRenewal(partner_id=partner.id, renewal_due_date=date.today())
+        db_session.add(renewal)
+        await db_session.flush()
+        repo = PartnerKYCRenewalRepository(db_session)
+        first_by, retry_by = uuid.uuid4(), uuid.uuid4()
+
+        assert len(await repo.complete_many([(renewal.id, [])], first_by)) == 1
+        await db_session.refresh(renewal)
+        completed_at = renewal.renewal_completed_at
+
+        assert await repo.complete_many([(renewal.id, [uuid.uuid4()])], retry_by) == []
+
+        await db_session.refresh(renewal)
+        await db_session.refresh(partner)
+        assert renewal.renewal_completed_at == completed_at
+        assert renewal.completed_by == first_by
+        assert renewal.documents_verified == []
+        assert partner.updated_by == first_by
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self, db_session):
+        assert await PartnerKYCRenewalRepository(db_session).complete_many([], uuid.uuid4()) == []
@@ -0,0 +1,87 @@
+"""
+Integration tests for partner cache invalidation against Redis.
+
+Every key cached for a partner, by PartnerCache or by the risk module's
+PartnerRiskDataCache, must be dropped by invalidate_partner_cache(s).
+"""
+
+import uuid
+from typing import Dict
+
+import pytest
+
+from backend.modules.partners.services.cache import (
+    PartnerCache,
+    invalidate_partner_cache,
+    invalidate_partner_caches,
+)
+from backend.modules.risk.partner_data_cache import PartnerRiskDataCache
+
+
+async def _cache_views(redis_client, partner_id: uuid.UUID) -> None:
+    """Cache a detail view in two organizations plus the partner's risk data."""
+    for organization_id in (uuid.uuid4(), uuid.uuid4()):
+        async def load():
+            return {"id": str(partner_id)}
+
+        await PartnerCache(redis_client, organization_id).get_or_load_json(
+            partner_id, "detail", Dict[str, str], load
+        )
+
+    async def load_buyers(partner_ids):
+        return {pid: {"credit_limit": "100", "rating": "4.5"} for pid in partner_ids}
+
+    await PartnerRiskDataCache(redis_client).get_or_load_many("buyer", {partner_id}, load_buyers)
+
+
+async def _cached_keys(redis_client, partner_id: uuid.UUID) -> list:
+    return [key async for key in redis_client.scan_iter(match=f"partner:{partner_id}:*")]
+
+
+class TestPartnerCacheInvalidation:
+    """invalidate_partner_cache(s) drop exactly the changed partners' keys."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_all_views_of_partner(self, redis_client):
+        partner_id, other_id = uuid.uuid4(), uuid.uuid4()
+        await _cache_views(redis_client, partner_id)
+        await _cache_views(redis_client, other_id)
+        # Two detail views, the risk entry and the key index
+        assert len(await _cached_keys(redis_client, partner_id)) == 4
+
+        await invalidate_partner_cache(redis_client, partner_id)
+
+        assert await _cached_keys(redis_client, partner_id) == []
+        assert len(await _cached_keys(redis_client, other_id)) == 4
+        await invalidate_partner_cache(redis_client, other_id)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_many(self, redis_client):
+        partner_ids = [uuid.uuid4() for _ in range(3)]
+        for partner_id in partner_ids:
+            await _cache_views(redis_client, partner_id)
+
+        await invalidate_partner_caches(redis_client, partner_ids[:2])
+
+        assert await _cached_keys(redis_client, partner_ids[0]) == []
+        assert await _cached_keys(redis_client, partner_ids[1]) == []
+        assert len(await _cached_keys(redis_client, partner_ids[2])) == 4
+        await invalidate_partner_cache(redis_client, partner_ids[2])
+
+    @pytest.mark.asyncio
+    async def test_views_reload_after_invalidation(self, redis_client):
+        partner_id, organization_id = uuid.uuid4(), uuid.uuid4()
+        cache = PartnerCache(redis_client, organization_id)
+        loads = []
+
+        async def load():
+            loads.append(1)
+            return {"version": str(len(loads))}
+
+        assert await cache.get_or_load_json(partner_id, "detail", Dict[str, str], load) == b'{"version":"1"}'
+        assert await cache.get_or_load_json(partner_id, "detail", Dict[str, str], load) == b'{"version":"1"}'
+
+        await invalidate_partner_cache(redis_client, partner_id)
+
+        assert await cache.get_or_load_json(partner_id, "detail", Dict[str, str], load) == b'{"version":"2"}'
+        await invalidate_partner_cache(redis_client, partner_id)
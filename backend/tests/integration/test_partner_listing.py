@@ -0,0 +1,154 @@
+"""
+Integration tests for the basic partner listing (GET /partners/).
+
+The partners router is mounted on a bare app with the service bound to the
+rolled-back db_session. Each test tags its partners with a unique
+entity_class and filters on it, so rows from other tests never show up.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from backend.core.events.emitter import EventEmitter
+from backend.modules.notifications.models.notification import Notification  # noqa: F401 (User.notifications)
+from backend.modules.partners.models import BusinessPartner
+from backend.modules.partners.partner_services import PartnerService
+from backend.modules.partners.router import (
+    get_current_organization_id,
+    get_partner_service,
+    router,
+)
+from backend.tests.integration.conftest import create_test_business_partner
+
+
+def _partner(entity_class: str, legal_name: str, created_at: datetime) -> BusinessPartner:
+    return create_test_business_partner(legal_name, {
+        "entity_class": entity_class,
+        "status": "approved",
+        "kyc_status": "verified",
+        "created_at": created_at,
+    })
+
+
+@pytest_asyncio.fixture
+async def listing_client(db_session):
+    organization_id = uuid.uuid4()
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_partner_service] = lambda: PartnerService(
+        db=db_session,
+        event_emitter=EventEmitter(db_session),
+        current_user_id=uuid.uuid4(),
+        organization_id=organization_id
+    )
+    app.dependency_overrides[get_current_organization_id] = lambda: organization_id
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def listed_partners(db_session):
+    """Five partners under a unique entity_class, newest first"""
+    entity_class = f"it_{uuid.uuid4().hex[:8]}"
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    partners = [
+        _partner(entity_class, f"Listing Partner {i}", start + timedelta(minutes=i))
+        for i in range(5)
+    ]
+    db_session.add_all(partners)
+    await db_session.flush()
+    return entity_class, sorted(partners, key=lambda p: p.created_at, reverse=True)
+
+
+class TestPartnerListingResponse:
+    """Basic listings are BusinessPartnerPage bodies with an ETag."""
+
+    @pytest.mark.asyncio
+    async def test_page_matches_response_model(self, listing_client, listed_partners):
+        entity_class, partners = listed_partners
+
+        response = await listing_client.get("/partners/", params={"entity_class": entity_class})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total"] == 5
+        assert body["next_cursor"] is None
+        assert [row["id"] for row in body["results"]] == [str(p.id) for p in partners]
+        assert body["results"][0] == {
+            "id": str(partners[0].id),
+            "partner_code": None,
+            "entity_class": entity_class,
+            "legal_name": "Listing Partner 4",
+            "country": "India",
+            "status": "approved",
+            "risk_score": None,
+            "risk_category": None,
+            "kyc_status": "verified",
+            "created_at": "2026-01-01T00:04:00Z"
+        }
+
+    @pytest.mark.asyncio
+    async def test_if_none_match_returns_304(self, listing_client, listed_partners):
+        entity_class, _ = listed_partners
+        params = {"entity_class": entity_class}
+
+        first = await listing_client.get("/partners/", params=params)
+        etag = first.headers["ETag"]
+
+        cached = await listing_client.get("/partners/", params=params, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["ETag"] == etag
+
+        other_page = await listing_client.get(
+            "/partners/", params={**params, "limit": 2}, headers={"If-None-Match": etag}
+        )
+        assert other_page.status_code == 200
+        assert other_page.headers["ETag"] != etag
+
+
+class TestPartnerListingCursor:
+    """next_cursor pages through every partner exactly once."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_round_trip(self, listing_client, db_session, listed_partners):
+        entity_class, partners = listed_partners
+        # Same created_at as the newest partner: id must break the tie
+        tied = _partner(entity_class, "Listing Partner Tied", partners[0].created_at)
+        db_session.add(tied)
+        await db_session.flush()
+        expected = sorted([*partners, tied], key=lambda p: (p.created_at, p.id), reverse=True)
+
+        seen, after = [], None
+        while True:
+            params = {"entity_class": entity_class, "limit": 2}
+            if after:
+                params["after"] = after
+            body = (await listing_client.get("/partners/", params=params)).json()
+            seen.extend(row["id"] for row in body["results"])
+            after = body["next_cursor"]
+            if after is None:
+                break
+
+        assert seen == [str(p.id) for p in expected]
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_is_rejected(self, listing_client, listed_partners):
+        entity_class, _ = listed_partners
+
+        response = await listing_client.get("/partners/", params={"entity_class": entity_class, "after": "not-a-cursor"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid pagination cursor"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("params", [{"limit": 0}, {"limit": -1}, {"limit": 1001}, {"skip": -1}])
+    async def test_out_of_range_paging_is_rejected(self, listing_client, params):
+        response = await listing_client.get("/partners/", params=params)
+
+        assert response.status_code == 422
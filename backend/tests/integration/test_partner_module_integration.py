@@ -311,8 +311,8 @@ class TestPartnerOnboardingWorkflow:
         
         partner = await approval_service.process_approval(
             application.id,
-            risk_assessment,
-            decision
+            decision,
+            risk_assessment=risk_assessment
         )
 
         assert partner.legal_name == "New Seller Pvt Ltd"
@@ -0,0 +1,183 @@
+"""
+Integration tests for the Risk Engine batch and trade assessments.
+
+RiskService assesses each item in its own session (session_factory), so the
+rows these tests read back must have been committed by that session; the
+shared rolled-back db_session fixture would hide a missing write. Data is
+committed through a dedicated session factory and removed afterwards.
+"""
+
+import uuid
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from backend.core.outbox.models import EventOutbox
+from backend.modules.notifications.models.notification import Notification  # noqa: F401 (User.notifications)
+from backend.modules.partners.models import BusinessPartner
+from backend.modules.risk.risk_service import RiskService, trade_aggregate_id
+from backend.modules.settings.commodities.models import Commodity
+from backend.modules.settings.locations.models import Location
+from backend.modules.settings.models.settings_models import User
+from backend.modules.settings.organization.models import Organization
+from backend.modules.trade_desk.models.availability import Availability
+from backend.modules.trade_desk.models.requirement import Requirement
+from backend.tests.integration.conftest import (
+    create_test_availability,
+    create_test_business_partner,
+    create_test_requirement,
+)
+
+
+@pytest_asyncio.fixture
+async def session_factory(async_database_url: str, setup_database_schema):
+    """Session factory whose commits are visible to every other session."""
+    engine = create_async_engine(async_database_url, poolclass=NullPool)
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def trade_rows(session_factory):
+    """Committed partner, user, commodity, location, requirement and availability."""
+    async with session_factory() as session:
+        organization = Organization(
+            id=uuid.uuid4(),
+            name=f"RiskCo_{uuid.uuid4().hex[:6]}",
+            legal_name="Risk Company Ltd",
+            PAN="AAACR1234A"
+        )
+        session.add(organization)
+        await session.flush()
+
+        user = User(
+            id=uuid.uuid4(),
+            user_type="INTERNAL",
+            organization_id=organization.id,
+            mobile_number=f"+9198{uuid.uuid4().int % 10**8:08d}",
+            full_name="Risk Officer",
+            is_active=True,
+            is_verified=True
+        )
+        buyer = create_test_business_partner("Risk Buyer Ltd")
+        seller = create_test_business_partner("Risk Seller Ltd")
+        commodity = Commodity(
+            id=uuid.uuid4(),
+            name=f"Cotton_{uuid.uuid4().hex[:6]}",
+            category="Agricultural",
+            uom="Bales",
+            is_active=True
+        )
+        location = Location(
+            id=uuid.uuid4(),
+            name="Rajkot",
+            google_place_id=f"risk-test-{uuid.uuid4().hex}",
+            city="Rajkot",
+            state="Gujarat",
+            pincode="360001",
+            region="WEST"
+        )
+        session.add_all([user, buyer, seller, commodity, location])
+        await session.flush()
+
+        requirement = await create_test_requirement(
+            session, buyer.id, commodity.id, user.id, overrides={"status": "ACTIVE"}
+        )
+        availability = await create_test_availability(
+            session, seller.id, commodity.id, location.id, user.id, overrides={"status": "ACTIVE"}
+        )
+        await session.commit()
+
+    yield {"user": user, "requirement": requirement, "availability": availability}
+
+    async with session_factory() as session:
+        await session.execute(delete(EventOutbox).where(EventOutbox.aggregate_id.in_([
+            requirement.id, availability.id, trade_aggregate_id(requirement.id, availability.id)
+        ])))
+        await session.execute(delete(Requirement).where(Requirement.id == requirement.id))
+        await session.execute(delete(Availability).where(Availability.id == availability.id))
+        await session.execute(delete(BusinessPartner).where(BusinessPartner.id.in_([buyer.id, seller.id])))
+        await session.execute(delete(Commodity).where(Commodity.id == commodity.id))
+        await session.execute(delete(Location).where(Location.id == location.id))
+        await session.execute(delete(User).where(User.id == user.id))
+        await session.execute(delete(Organization).where(Organization.id == organization.id))
+        await session.commit()
+
+
+class TestBatchRiskAssessment:
+    """assess_all_active_* persist each item's results in its own transaction."""
+
+    @pytest.mark.asyncio
+    async def test_requirement_precheck_is_saved(self, session_factory, trade_rows):
+        requirement = trade_rows["requirement"]
+
+        async with session_factory() as session:
+            service = RiskService(db=session, session_factory=session_factory)
+            results = await service.assess_all_active_requirements(user_id=trade_rows["user"].id)
+
+        result = next(r for r in results if r["requirement_id"] == str(requirement.id))
+        assert "error" not in result, result
+
+        async with session_factory() as session:
+            saved = await session.get(Requirement, requirement.id)
+            assert saved.risk_precheck_status == result["assessment"]["status"]
+            assert saved.buyer_credit_limit_remaining == result["assessment"]["credit_limit_remaining"]
+            assert saved.buyer_payment_performance_score == 85
+
+            events = (await session.execute(
+                select(EventOutbox).where(EventOutbox.aggregate_id == requirement.id)
+            )).scalars().all()
+            assert [e.event_type for e in events] == ["risk.requirement_assessed"]
+
+    @pytest.mark.asyncio
+    async def test_availability_precheck_is_saved(self, session_factory, trade_rows):
+        availability = trade_rows["availability"]
+
+        async with session_factory() as session:
+            service = RiskService(db=session, session_factory=session_factory)
+            results = await service.assess_all_active_availabilities(user_id=trade_rows["user"].id)
+
+        result = next(r for r in results if r["availability_id"] == str(availability.id))
+        assert "error" not in result, result
+
+        async with session_factory() as session:
+            saved = await session.get(Availability, availability.id)
+            assert saved.risk_precheck_status is not None
+            assert saved.risk_precheck_score is not None
+            assert saved.seller_rating_score == Decimal("4.5")
+            assert saved.seller_delivery_score == 92
+
+
+class TestTradeRiskAssessment:
+    """assess_trade_risk saves both sides' prechecks with the trade event."""
+
+    @pytest.mark.asyncio
+    async def test_trade_prechecks_are_saved(self, session_factory, trade_rows):
+        requirement = trade_rows["requirement"]
+        availability = trade_rows["availability"]
+
+        async with session_factory() as session:
+            service = RiskService(db=session, session_factory=session_factory)
+            assessment = await service.assess_trade_risk(
+                requirement_id=requirement.id,
+                availability_id=availability.id,
+                trade_quantity=Decimal("100"),
+                trade_price=Decimal("45.00"),
+                user_id=trade_rows["user"].id
+            )
+
+        async with session_factory() as session:
+            saved_requirement = await session.get(Requirement, requirement.id)
+            saved_availability = await session.get(Availability, availability.id)
+            assert saved_requirement.risk_precheck_status == assessment["buyer_assessment"]["status"]
+            assert saved_availability.risk_precheck_status == assessment["seller_assessment"]["status"]
+            assert saved_availability.seller_delivery_score == 92
+
+            events = (await session.execute(select(EventOutbox).where(
+                EventOutbox.aggregate_id == trade_aggregate_id(requirement.id, availability.id)
+            ))).scalars().all()
+            assert [e.event_type for e in events] == ["risk.trade_assessed"]
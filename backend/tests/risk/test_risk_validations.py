@@ -5,7 +5,9 @@ Comprehensive test suite for risk management system.
 Tests all 4 critical validations + ML model + API endpoints.
 """
 
+import copy
 import pytest
+import numpy as np
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from uuid import UUID, uuid4
@@ -476,6 +478,84 @@ class TestMLRiskModel:
             assert 0 <= score <= 100
             assert isinstance(score, (int, float))
 
+    def test_scaler_folded_into_trees(self, tmp_path):
+        """Trees rewritten for raw features should predict exactly as on scaled features."""
+        from sklearn.ensemble import GradientBoostingRegressor
+        
+        ml_model = MLRiskModel(model_dir=str(tmp_path))
+        df = ml_model.generate_synthetic_training_data(num_samples=2000)
+        X, _ = ml_model.extract_features(df)
+        X_train_scaled, _ = ml_model._scale_features(X[:1500], X[1500:])
+        
+        model = GradientBoostingRegressor(n_estimators=20, max_depth=5, random_state=42)
+        model.fit(X_train_scaled, df['credit_limit'].to_numpy()[:1500])
+        
+        folded = copy.deepcopy(model)
+        ml_model._fold_scaler_into_trees(folded)
+        
+        np.testing.assert_allclose(
+            folded.predict(X),
+            model.predict(ml_model.feature_scaler.transform(X)),
+            rtol=1e-6
+        )
+
+    @pytest.mark.asyncio
+    async def test_prediction_uses_raw_features_and_rounded_cache_key(self, tmp_path):
+        """The model scores exact inputs; rounding only decides cache hits."""
+        ml_model = MLRiskModel(model_dir=str(tmp_path))
+        ml_model.payment_default_model = Mock()
+        batch_predict = Mock(return_value=np.array([0.125]))
+        inputs = dict(
+            credit_utilization=45.26,
+            rating=4.04,
+            payment_performance=88,
+            trade_history_count=40,
+            dispute_rate=1.23,
+            payment_delay_days=2.34,
+            avg_trade_value=1_000_000
+        )
+
+        with patch("backend.modules.risk.ml_risk_model.SKLEARN_AVAILABLE", True), \
+                patch.object(ml_model, "batch_predict", batch_predict):
+            await ml_model.predict_payment_default_risk(**inputs)
+            # Rounds to the same key: served from the cache
+            await ml_model.predict_payment_default_risk(**{**inputs, "credit_utilization": 45.28})
+            # Different key: scored again
+            await ml_model.predict_payment_default_risk(**{**inputs, "credit_utilization": 46.0})
+
+        assert batch_predict.call_count == 2
+        np.testing.assert_allclose(
+            batch_predict.call_args_list[0].args[0][0],
+            [45.26, 4.04, 88, 40, 1.23, 2.34, np.log1p(1_000_000)],
+            rtol=1e-6
+        )
+
+    @pytest.mark.asyncio
+    async def test_cached_prediction_explains_the_exact_inputs(self, tmp_path):
+        """A cache hit reuses the probability only; factors follow the caller's inputs."""
+        ml_model = MLRiskModel(model_dir=str(tmp_path))
+        ml_model.payment_default_model = Mock()
+        batch_predict = Mock(return_value=np.array([0.125]))
+        inputs = dict(
+            rating=4.0,
+            payment_performance=88,
+            trade_history_count=40,
+            dispute_rate=1.0,
+            payment_delay_days=2.0,
+            avg_trade_value=1_000_000
+        )
+
+        with patch("backend.modules.risk.ml_risk_model.SKLEARN_AVAILABLE", True), \
+                patch.object(ml_model, "batch_predict", batch_predict):
+            # Both round to 80.0 but sit on opposite sides of the 80% threshold
+            above = await ml_model.predict_payment_default_risk(credit_utilization=80.04, **inputs)
+            below = await ml_model.predict_payment_default_risk(credit_utilization=79.96, **inputs)
+
+        batch_predict.assert_called_once()
+        assert above["default_probability"] == below["default_probability"] == 12.5
+        assert above["contributing_factors"] == ["High credit utilization (80.0%)"]
+        assert below["contributing_factors"] == []
+
 
 # ========================================
 # TEST 6: RISK ENGINE INTEGRATION
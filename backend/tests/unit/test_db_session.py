@@ -0,0 +1,160 @@
+"""
+Test the get_db dependency (connection circuit breaker, after-commit callbacks).
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import NullPool
+
+from backend.db import async_session
+
+
+def _session() -> AsyncMock:
+    session = AsyncMock()
+    session.info = {}
+    return session
+
+
+def _connect(connection_error: Exception = None):
+    """Run the engine's do_connect hook against a dialect that fails or succeeds."""
+    dialect = MagicMock()
+    if connection_error is not None:
+        dialect.connect.side_effect = connection_error
+    return async_session._connect_with_breaker(dialect, None, (), {})
+
+
+def _session_factory(session: AsyncMock) -> MagicMock:
+    factory = MagicMock()
+    factory.return_value.__aenter__.return_value = session
+    return factory
+
+
+async def _run(session: AsyncMock, handler_error: Exception = None, handler=None):
+    """Drive get_db like FastAPI does, raising handler_error at the yield."""
+    with patch.object(async_session, "AsyncSessionLocal", _session_factory(session)):
+        dependency = async_session.get_db()
+        db = await dependency.__anext__()
+        if handler is not None:
+            handler(db)
+        if handler_error is None:
+            with pytest.raises(StopAsyncIteration):
+                await dependency.__anext__()
+        else:
+            with pytest.raises(type(handler_error)):
+                await dependency.athrow(handler_error)
+
+
+@pytest.fixture(autouse=True)
+def reset_breaker():
+    async_session._consecutive_failures = 0
+    async_session._retry_at = 0.0
+    yield
+    async_session._consecutive_failures = 0
+    async_session._retry_at = 0.0
+
+
+def _operational_error() -> OperationalError:
+    return OperationalError("SELECT 1", {}, Exception("connection refused"))
+
+
+class TestCircuitBreaker:
+    """Only failed connection attempts trip the breaker."""
+
+    @pytest.mark.asyncio
+    async def test_connect_failures_open_breaker(self):
+        for _ in range(async_session.DB_FAILURE_THRESHOLD):
+            with pytest.raises(OSError):
+                _connect(ConnectionRefusedError("connection refused"))
+
+        with pytest.raises(async_session.HTTPException) as exc_info:
+            await _run(_session())
+        assert exc_info.value.status_code == 503
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_do_not_count(self):
+        for _ in range(async_session.DB_FAILURE_THRESHOLD):
+            session = _session()
+            await _run(session, handler_error=_operational_error())
+            session.rollback.assert_awaited_once()
+
+        assert async_session._consecutive_failures == 0
+        await _run(_session())
+
+    def test_successful_connect_resets_count(self):
+        with pytest.raises(OperationalError):
+            _connect(_operational_error())
+        assert async_session._consecutive_failures == 1
+
+        _connect()
+        assert async_session._consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_session_connects_lazily(self):
+        session = _session()
+        await _run(session)
+
+        session.connection.assert_not_awaited()
+        session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_counts_real_connection_attempts(self):
+        # Nothing listens on port 1: the pool's connect attempt is refused
+        engine = create_async_engine("postgresql+asyncpg://u:p@127.0.0.1:1/x", poolclass=NullPool)
+        event.listen(engine.sync_engine, "do_connect", async_session._connect_with_breaker)
+
+        with pytest.raises(OSError):
+            async with engine.connect():
+                pass
+        await engine.dispose()
+
+        assert async_session._consecutive_failures == 1
+
+
+class TestRunAfterCommit:
+    """Callbacks run once the request's transaction is committed."""
+
+    @pytest.mark.asyncio
+    async def test_runs_after_commit(self):
+        session = _session()
+        calls = []
+
+        async def callback():
+            session.commit.assert_awaited_once()
+            calls.append("callback")
+
+        await _run(session, handler=lambda db: async_session.run_after_commit(db, callback))
+
+        assert calls == ["callback"]
+
+    @pytest.mark.asyncio
+    async def test_dropped_on_rollback(self):
+        session = _session()
+        callback = AsyncMock()
+
+        await _run(
+            session,
+            handler_error=ValueError("handler failed"),
+            handler=lambda db: async_session.run_after_commit(db, callback)
+        )
+
+        callback.assert_not_awaited()
+        assert "after_commit" not in session.info
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_does_not_stop_others(self):
+        session = _session()
+        failing = AsyncMock(side_effect=RuntimeError("redis down"))
+        second = AsyncMock()
+
+        def handler(db):
+            async_session.run_after_commit(db, failing)
+            async_session.run_after_commit(db, second)
+
+        await _run(session, handler=handler)
+
+        failing.assert_awaited_once()
+        second.assert_awaited_once()
+        session.rollback.assert_not_awaited()
@@ -0,0 +1,34 @@
+"""
+Test primary key generation (time-ordered UUIDv7).
+"""
+
+import time
+from unittest.mock import patch
+
+from backend.db import ids
+from backend.db.ids import uuid7
+
+
+class TestUUID7:
+    """uuid7() keys are valid version 7 UUIDs that sort by creation time."""
+
+    def test_version_and_variant(self):
+        key = uuid7()
+        assert key.version == 7
+        assert key.variant == "specified in RFC 4122"
+
+    def test_embeds_millisecond_timestamp(self):
+        before = time.time_ns() // 1_000_000
+        key = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= key.int >> 80 <= after
+
+    def test_later_keys_sort_later(self):
+        with patch.object(ids.time, "time_ns", return_value=1_700_000_000_000_000_000):
+            earlier = [uuid7() for _ in range(100)]
+        with patch.object(ids.time, "time_ns", return_value=1_700_000_000_001_000_000):
+            later = [uuid7() for _ in range(100)]
+        assert max(earlier) < min(later)
+
+    def test_keys_are_unique(self):
+        assert len({uuid7() for _ in range(10_000)}) == 10_000
@@ -0,0 +1,78 @@
+"""
+Test that partner approval defers its Redis writes until after commit.
+"""
+
+import json
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from backend.db.async_session import _AFTER_COMMIT
+from backend.modules.partners.partner_services import ApprovalService
+from backend.modules.partners.schemas import ApprovalDecision
+
+
+def _approval_service(redis_client: AsyncMock) -> ApprovalService:
+    db = AsyncMock()
+    db.info = {}
+    service = ApprovalService(db, uuid.uuid4(), redis_client=redis_client)
+
+    application = Mock(risk_score=20, risk_category="low", risk_assessment={"flags": []})
+    partner = SimpleNamespace(
+        id=uuid.uuid4(),
+        partner_type="buyer",
+        legal_name="Approved Partner Ltd",
+        credit_limit=None,
+        status="approved",
+        approved_at=datetime.utcnow(),
+        kyc_expiry_date=datetime.utcnow() + timedelta(days=365)
+    )
+    service.app_repo = AsyncMock()
+    service.app_repo.get_by_id.return_value = application
+    service.bp_repo = AsyncMock()
+    service.bp_repo.create.return_value = partner
+    service.outbox_repo = AsyncMock()
+    return service
+
+
+class TestApprovalAfterCommit:
+    """KYC expiry index and idempotency result are written after commit."""
+
+    @pytest.mark.asyncio
+    async def test_redis_writes_wait_for_commit(self):
+        redis_client = AsyncMock()
+        redis_client.get.return_value = None
+        service = _approval_service(redis_client)
+
+        partner = await service.process_approval(
+            uuid.uuid4(), ApprovalDecision(decision="approve"), idempotency_key="approve-1"
+        )
+
+        redis_client.eval.assert_not_awaited()
+        redis_client.setex.assert_not_awaited()
+
+        # What get_db does once the request's transaction has committed
+        for callback in service.db.info.pop(_AFTER_COMMIT):
+            await callback()
+
+        redis_client.eval.assert_awaited_once()
+        redis_client.setex.assert_awaited_once()
+        key, ttl, cached = redis_client.setex.await_args.args
+        assert key == "idempotency:approve-1"
+        assert json.loads(cached)["id"] == str(partner.id)
+
+    @pytest.mark.asyncio
+    async def test_nothing_cached_without_idempotency_key(self):
+        redis_client = AsyncMock()
+        service = _approval_service(redis_client)
+
+        await service.process_approval(uuid.uuid4(), ApprovalDecision(decision="approve"))
+
+        callbacks = service.db.info.pop(_AFTER_COMMIT)
+        assert len(callbacks) == 1
+        await callbacks[0]()
+        redis_client.eval.assert_awaited_once()
+        redis_client.setex.assert_not_awaited()